@@ -2,5 +2,11 @@ from .models import Model as Model
 from .datasets import DatasetGenerator as DatasetGenerator
 from .fileio import load_model as load_model
 from .fileio import save_model as save_model
+from .fileio import evict_model as evict_model
+from .fileio import clear_model_cache as clear_model_cache
+from .fileio import clear_extracted_artifacts as clear_extracted_artifacts
+from .internal.models.inference.pool import PredictorPool as PredictorPool
+from .internal.models.storage.artifact_store import ArtifactStore as ArtifactStore
+from .internal.models.storage.catalog import ModelCatalog as ModelCatalog
 from .callbacks import Callback as Callback
 from .callbacks import MLFlowCallback as MLFlowCallback
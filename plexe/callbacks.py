@@ -7,6 +7,7 @@ or other operations to be performed at key points.
 """
 
 import logging
+import time
 from abc import ABC
 from dataclasses import dataclass
 from typing import Optional, Type, Dict, List
@@ -97,6 +98,17 @@ class Callback(ABC):
         """
         pass
 
+    def on_execution_output(self, info: BuildStateInfo, stream: str, line: str) -> None:
+        """
+        Called with each line of output written by training code while it runs.
+
+        Args:
+            info: The state of the iteration whose training code is running
+            stream: The stream the line was written to, either "stdout" or "stderr"
+            line: The line of output, including its line ending
+        """
+        pass
+
 
 class ChainOfThoughtModelCallback(Callback):
     """
@@ -106,6 +118,9 @@ class ChainOfThoughtModelCallback(Callback):
     chain of thought callback system.
     """
 
+    # Minimum number of seconds between two lines of execution output shown in the chain of thought
+    OUTPUT_INTERVAL = 1.0
+
     def __init__(self, emitter=None):
         """
         Initialize the chain of thought model callback.
@@ -115,6 +130,7 @@ class ChainOfThoughtModelCallback(Callback):
         """
 
         self.cot_callable = ChainOfThoughtCallable(emitter=emitter or ConsoleEmitter())
+        self._last_output = 0.0
 
     def on_build_start(self, info: BuildStateInfo) -> None:
         """
@@ -149,6 +165,18 @@ class ChainOfThoughtModelCallback(Callback):
                 "System", f"📋 Iteration {info.iteration + 1} failed: No performance metrics available"
             )
 
+    def on_execution_output(self, info: BuildStateInfo, stream: str, line: str) -> None:
+        """
+        Emit training code output as it is written, at most one line per interval so that scripts logging every
+        batch do not flood the chain of thought.
+        """
+        line = line.strip()
+        now = time.monotonic()
+        if not line or now - self._last_output < self.OUTPUT_INTERVAL:
+            return
+        self._last_output = now
+        self.cot_callable.emitter.emit_thought("Execution", f"{'⚠️ ' if stream == 'stderr' else ''}{line[:200]}")
+
     def get_chain_of_thought_callable(self):
         """
         Get the underlying chain of thought callable.
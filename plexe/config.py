@@ -39,6 +39,12 @@ class _Config:
     class _FileStorageConfig:
         model_cache_dir: str = field(default=".smolcache/")
         model_dir: str = field(default="model_files/")
+        archive_codec: str = field(default="zstd")
+        archive_chunk_size: int = field(default=4 * 1024 * 1024)
+        archive_gzip_level: int = field(default=6)
+        archive_compression_workers: int | None = field(default=None)
+        loaded_model_cache_max_models: int | None = field(default=8)
+        loaded_model_cache_max_bytes: int | None = field(default=None)
 
     @dataclass(frozen=True)
     class _LoggingConfig:
@@ -56,6 +62,40 @@ class _Config:
     @dataclass(frozen=True)
     class _ExecutionConfig:
         runfile_name: str = field(default="execution_script.py")
+        # "parquet", or "arrow" to pass datasets to training scripts as uncompressed Arrow IPC files to memory-map
+        dataset_format: str = field(default="parquet")
+        # Run local executions in processes forked from a warm worker that has already imported the allowed packages
+        warm_workers: bool = field(default=False)
+        # Limits for running candidate solutions concurrently: at most one execution per `cpus_per_execution` CPUs,
+        # only started while `memory_per_execution` bytes are available, and at most `max_parallel_executions`
+        max_parallel_executions: int | None = field(default=None)
+        cpus_per_execution: int = field(default=4)
+        memory_per_execution: int = field(default=2 * 1024**3)
+        # Characters of each execution output stream kept from its start and its end; the middle is dropped
+        output_head_chars: int = field(default=64 * 1024)
+        output_tail_chars: int = field(default=256 * 1024)
+
+    @dataclass(frozen=True)
+    class _InferenceConfig:
+        stream_batch_size: int = field(default=65_536)
+        stream_prefetch: int = field(default=2)
+        max_batch_size: int = field(default=64)
+        max_wait_ms: float = field(default=2.0)
+        max_concurrent_batches: int = field(default=1)
+        cache_max_entries: int = field(default=100_000)
+        cache_max_bytes: int | None = field(default=None)
+        cache_ttl: float | None = field(default=None)
+        warmup_rounds: int = field(default=3)
+        warmup_max_samples: int = field(default=32)
+
+    @dataclass(frozen=True)
+    class _ServingConfig:
+        host: str = field(default="127.0.0.1")
+        port: int = field(default=8000)
+        workers: int = field(default=1)
+        max_inflight_requests: int = field(default=256)
+        max_request_bytes: int = field(default=16 * 1024 * 1024)
+        request_timeout: float = field(default=30.0)
 
     @dataclass(frozen=True)
     class _CodeGenerationConfig:
@@ -160,6 +200,8 @@ class _Config:
     model_search: _ModelSearchConfig = field(default_factory=_ModelSearchConfig)
     code_generation: _CodeGenerationConfig = field(default_factory=_CodeGenerationConfig)
     execution: _ExecutionConfig = field(default_factory=_ExecutionConfig)
+    inference: _InferenceConfig = field(default_factory=_InferenceConfig)
+    serving: _ServingConfig = field(default_factory=_ServingConfig)
     data_generation: _DataGenerationConfig = field(default_factory=_DataGenerationConfig)
     ray: _RayConfig = field(default_factory=_RayConfig)
 
@@ -216,7 +258,14 @@ class _PromptTemplates:
         return self._render("training/system_prompt.jinja")
 
     def training_generate(
-        self, problem_statement, plan, history, allowed_packages, training_data_files, validation_data_files
+        self,
+        problem_statement,
+        plan,
+        history,
+        allowed_packages,
+        training_data_files,
+        validation_data_files,
+        dataset_format="parquet",
     ) -> str:
         return self._render(
             "training/generate.jinja",
@@ -227,10 +276,19 @@ class _PromptTemplates:
             training_data_files=training_data_files,
             validation_data_files=validation_data_files,
             use_validation_files=len(validation_data_files) > 0,
+            dataset_format=dataset_format,
         )
 
     def training_fix(
-        self, training_code, plan, review, problems, allowed_packages, training_data_files, validation_data_files
+        self,
+        training_code,
+        plan,
+        review,
+        problems,
+        allowed_packages,
+        training_data_files,
+        validation_data_files,
+        dataset_format="parquet",
     ) -> str:
         return self._render(
             "training/fix.jinja",
@@ -242,6 +300,7 @@ class _PromptTemplates:
             training_data_files=training_data_files,
             validation_data_files=validation_data_files,
             use_validation_files=len(validation_data_files) > 0,
+            dataset_format=dataset_format,
         )
 
     def training_review(self, problem_statement, plan, training_code, problems, allowed_packages) -> str:
@@ -37,10 +37,24 @@ Usage:
     output_data = {"score": 10, "winner": "Alice"}
     result = valid_constraints.evaluate(input_data, output_data)
     print(result)  # True
+
+Constraints can also be evaluated over whole batches of inputs and outputs with `evaluate_batch`. Conditions
+declared with `vectorized=True` receive the input and output DataFrames and return a boolean mask, which avoids
+calling Python code once per row:
+
+    non_negative = Constraint(
+        condition=lambda inputs, outputs: outputs["score"] >= 0,
+        description="The score must be non-negative",
+        vectorized=True,
+    )
+    mask = (non_negative & has_winner).evaluate_batch(inputs_df, outputs_df)
 """
 
 import inspect
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 
 # todo: something to think about is how to represent constraints in cases where the model is not a
@@ -80,13 +94,17 @@ class Constraint:
         print(non_negative.evaluate(input_data, output_data))  # True
     """
 
-    def __init__(self, condition: Callable[[Any, Any], bool], description: Optional[str] = None):
+    def __init__(
+        self, condition: Callable[[Any, Any], bool], description: Optional[str] = None, vectorized: bool = False
+    ):
         """
         Initialize a constraint with an optional description and a condition.
 
         :param Callable[[Any, Any], bool] condition: A function that takes (inputs, outputs) and returns
             True if the constraint is satisfied.
         :param Optional[str] description: A human-readable description of the constraint. Defaults to None.
+        :param bool vectorized: Whether the condition takes DataFrames of inputs and outputs and returns a
+            boolean mask with one value per row, instead of taking a single input/output pair.
         :raises TypeError: If the condition is not callable.
         :raises ValueError: If the condition does not accept exactly two arguments.
         """
@@ -103,6 +121,12 @@ class Constraint:
 
         self.condition = condition
         self.description = description or "Unnamed constraint"
+        self.vectorized = vectorized
+
+        # Composite constraints record their structure, so that evaluation can flatten nested combinations
+        self._operator: Optional[str] = None
+        self._operands: Tuple["Constraint", ...] = ()
+        self._plan: Optional[tuple] = None
 
     def evaluate(self, inputs: Any, outputs: Any) -> bool:
         """
@@ -114,10 +138,65 @@ class Constraint:
         :raises RuntimeError: If an error occurs during constraint evaluation.
         """
         try:
+            if self._operator is not None:
+                return _evaluate_pair(self._compile(), inputs, outputs)
+            if self.vectorized:
+                mask = self.condition(pd.DataFrame([inputs]), pd.DataFrame([outputs]))
+                return bool(np.asarray(mask, dtype=bool).reshape(-1)[0])
             return self.condition(inputs, outputs)
         except Exception as e:
             raise RuntimeError(f"Constraint evaluation failed: {self.description}") from e
 
+    def evaluate_batch(self, inputs: pd.DataFrame, outputs: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the constraint on a batch of input/output pairs, given as aligned rows of two DataFrames.
+
+        Nested combinations are flattened and evaluated in a single pass with boolean masks: each operand of an
+        AND is only evaluated on the rows that still satisfy all previous operands, and each operand of an OR
+        only on the rows that no previous operand satisfied. Vectorized conditions are evaluated once per
+        operand on those rows; other conditions are evaluated once per row.
+
+        :param pd.DataFrame inputs: The inputs to the model, one row per pair.
+        :param pd.DataFrame outputs: The outputs from the model, one row per pair.
+        :return: Boolean array with one value per row, True where the constraint is satisfied.
+        :raises ValueError: If the inputs and outputs have different numbers of rows.
+        :raises RuntimeError: If an error occurs during constraint evaluation.
+        """
+        if len(inputs) != len(outputs):
+            raise ValueError(f"Got {len(inputs)} input rows but {len(outputs)} output rows")
+        inputs, outputs = inputs.reset_index(drop=True), outputs.reset_index(drop=True)
+        return _evaluate_rows(self._compile(), inputs, outputs, np.arange(len(inputs)))
+
+    def _evaluate_leaf(self, inputs: pd.DataFrame, outputs: pd.DataFrame) -> np.ndarray:
+        """Evaluate this constraint's own condition on the given rows."""
+        try:
+            if self.vectorized:
+                mask = np.asarray(self.condition(inputs, outputs), dtype=bool).reshape(-1)
+                if len(mask) != len(inputs):
+                    raise ValueError(f"Vectorized condition returned {len(mask)} values for {len(inputs)} rows")
+                return mask
+            pairs = zip(inputs.to_dict(orient="records"), outputs.to_dict(orient="records"))
+            return np.fromiter((bool(self.condition(i, o)) for i, o in pairs), dtype=bool, count=len(inputs))
+        except Exception as e:
+            raise RuntimeError(f"Constraint evaluation failed: {self.description}") from e
+
+    def _compile(self) -> tuple:
+        """Return the flattened evaluation plan of this constraint, building it on first use."""
+        if self._plan is None:
+            self._plan = _flatten(self)
+        return self._plan
+
+    @classmethod
+    def _combine(cls, operator: str, operands: Tuple["Constraint", ...], description: str) -> "Constraint":
+        """Create a composite constraint; its condition evaluates the flattened plan for a single pair."""
+        composite = cls(
+            condition=lambda inputs, outputs: _evaluate_pair(composite._compile(), inputs, outputs),
+            description=description,
+        )
+        composite._operator = operator
+        composite._operands = operands
+        return composite
+
     def __str__(self) -> str:
         return f"Constraint(description={self.description})"
 
@@ -128,10 +207,7 @@ class Constraint:
         :param Constraint other: Another constraint to combine with.
         :return: A new constraint that is satisfied if both constraints are satisfied.
         """
-        return Constraint(
-            condition=lambda inputs, outputs: self.evaluate(inputs, outputs) and other.evaluate(inputs, outputs),
-            description=f"({self.description}) AND ({other.description})",
-        )
+        return Constraint._combine("and", (self, other), f"({self.description}) AND ({other.description})")
 
     def __or__(self, other: "Constraint") -> "Constraint":
         """
@@ -140,10 +216,7 @@ class Constraint:
         :param Constraint other: Another constraint to combine with.
         :return: A new constraint that is satisfied if either constraint is satisfied.
         """
-        return Constraint(
-            condition=lambda inputs, outputs: self.evaluate(inputs, outputs) or other.evaluate(inputs, outputs),
-            description=f"({self.description}) OR ({other.description})",
-        )
+        return Constraint._combine("or", (self, other), f"({self.description}) OR ({other.description})")
 
     def __invert__(self) -> "Constraint":
         """
@@ -151,7 +224,59 @@ class Constraint:
 
         :return: A new constraint that is satisfied if this constraint is not satisfied.
         """
-        return Constraint(
-            condition=lambda inputs, outputs: not self.evaluate(inputs, outputs),
-            description=f"NOT ({self.description})",
-        )
+        return Constraint._combine("not", (self,), f"NOT ({self.description})")
+
+
+# Evaluation plans are nested tuples: ("leaf", constraint), ("not", plan), or ("and" | "or", [plans]).
+# Flattening merges chains of the same operator, so that a conjunction of 30 rules is a single node with 30
+# operands rather than 30 levels of nested calls.
+def _flatten(constraint: Constraint) -> tuple:
+    if constraint._operator is None:
+        return "leaf", constraint
+    if constraint._operator == "not":
+        operand = _flatten(constraint._operands[0])
+        return operand[1] if operand[0] == "not" else ("not", operand)
+    operands: List[tuple] = []
+    for operand in constraint._operands:
+        plan = _flatten(operand)
+        if plan[0] == constraint._operator:
+            operands.extend(plan[1])
+        else:
+            operands.append(plan)
+    return constraint._operator, operands
+
+
+def _evaluate_pair(plan: tuple, inputs: Any, outputs: Any) -> bool:
+    """Evaluate a plan on a single input/output pair, short-circuiting like Python's boolean operators."""
+    kind, operands = plan
+    if kind == "leaf":
+        return bool(operands.evaluate(inputs, outputs))
+    if kind == "not":
+        return not _evaluate_pair(operands, inputs, outputs)
+    if kind == "and":
+        return all(_evaluate_pair(operand, inputs, outputs) for operand in operands)
+    return any(_evaluate_pair(operand, inputs, outputs) for operand in operands)
+
+
+def _evaluate_rows(plan: tuple, inputs: pd.DataFrame, outputs: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+    """Evaluate a plan on the given row positions, returning one boolean per position."""
+    kind, operands = plan
+    if kind == "leaf":
+        if len(rows) == len(inputs):
+            return operands._evaluate_leaf(inputs, outputs)
+        return operands._evaluate_leaf(inputs.iloc[rows], outputs.iloc[rows])
+    if kind == "not":
+        return ~_evaluate_rows(operands, inputs, outputs, rows)
+
+    # For AND, rows stay undecided while every operand so far holds; for OR, while no operand has held
+    decided_value = kind == "or"
+    result = np.full(len(rows), not decided_value)
+    undecided = np.arange(len(rows))
+    for operand in operands:
+        if len(undecided) == 0:
+            break
+        mask = _evaluate_rows(operand, inputs, outputs, rows[undecided])
+        decided = mask if decided_value else ~mask
+        result[undecided[decided]] = decided_value
+        undecided = undecided[~decided]
+    return result
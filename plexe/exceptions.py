@@ -58,6 +58,18 @@ class InvalidSchemaError(SpecificationError):
     pass
 
 
+class SchemaValidationError(SpecificationError, ValueError):
+    """
+    Raised when data does not conform to the input or output schema.
+
+    The `failures` attribute maps each invalid column to the positions of the rows that failed validation.
+    """
+
+    def __init__(self, message: str, failures: dict = None):
+        super().__init__(message)
+        self.failures = failures or {}
+
+
 # Instruction-related errors
 class InstructionError(PlexeError):
     """
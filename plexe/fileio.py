@@ -2,15 +2,31 @@
 This module provides file I/O utilities for saving and loading models to and from archive files.
 """
 
+import contextlib
+from datetime import datetime, timezone
+import functools
+import hashlib
 import io
 import json
 import logging
+import os
 import pickle
+import shutil
 import tarfile
-import types
-from pathlib import Path
+import tempfile
+import threading
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
+from plexe.config import config
 from plexe.models import Model, ModelState
+from plexe.internal.models.storage.artifact_store import ArtifactStore
+from plexe.internal.models.storage.code_cache import defining_module, load_source_module
+from plexe.internal.models.storage.compression import ParallelGzipWriter
+from plexe.internal.models.storage.container import ContainerReader, ContainerWriter, is_container
+from plexe.internal.models.storage.mapped import map_file
+from plexe.internal.models.storage.model_cache import LoadedModelCache
+from plexe.internal.models.storage.snapshots import create_snapshot, restore_snapshot
 from plexe.internal.models.entities.artifact import Artifact
 from plexe.internal.common.utils.pydantic_utils import map_to_basemodel
 from plexe.internal.models.entities.metric import Metric, MetricComparator, ComparisonMethod
@@ -18,12 +34,62 @@ from plexe.internal.models.entities.metric import Metric, MetricComparator, Comp
 logger = logging.getLogger(__name__)
 
 
-def save_model(model: Model, path: str | Path) -> str:
+# Names of the archive entries in which each part of a model is stored
+INTENT = "metadata/intent.txt"
+STATE = "metadata/state.txt"
+METRICS = "metadata/metrics.json"
+METADATA = "metadata/metadata.json"
+IDENTIFIER = "metadata/identifier.txt"
+INPUT_SAMPLE = "metadata/input_sample.json"
+CONSTRAINTS = "metadata/constraints.pkl"
+INPUT_SCHEMA = "schemas/input_schema.json"
+OUTPUT_SCHEMA = "schemas/output_schema.json"
+TRAINER_SOURCE = "code/trainer.py"
+PREDICTOR_SOURCE = "code/predictor.py"
+ARTIFACTS_DIR = "artifacts/"
+ARTIFACT_MANIFEST = "metadata/artifacts.json"
+SNAPSHOT = "snapshot/predictor.pkl"
+SNAPSHOT_FINGERPRINT = "snapshot/fingerprint.json"
+
+# Directory of the local cache to which entries of compressed archives are extracted, so they can be memory-mapped
+EXTRACTED_ARTIFACTS_DIR = "artifacts"
+
+# Archive formats, identified by the suffix of the path a model is saved to; directories must be chosen explicitly
+FORMATS = {".tar.gz": "tar", ".plexe": "plexe"}
+DIRECTORY = "directory"
+
+ArchiveSource = Union[bytes, Path, BinaryIO]
+
+
+def save_model(
+    model: Model,
+    path: str | Path,
+    codec: Optional[str] = None,
+    format: Optional[str] = None,
+    store: Union[ArtifactStore, str, Path, bool, None] = None,
+    snapshot: bool = False,
+) -> str:
     """
-    Save a model to a tar archive.
+    Save a model to an archive or a directory. Unless a format is given, it is chosen by the path's suffix:
+    ".tar.gz" for a gzipped tar archive, or ".plexe" for an indexed container whose entries can be read
+    individually, which is much faster to load.
+
+    The "directory" format writes the archive structure to a directory as plain files. Loading it needs no
+    extraction, and artifacts are exposed by path, so that frameworks can memory-map them and processes serving
+    the same model share its pages.
 
     :param model: The model to save
-    :param path: Optional custom path. If not provided, saves to smolcache/models/
+    :param path: path of the archive, ending in .tar.gz or .plexe, or of the directory
+    :param codec: compression codec for .plexe containers, one of "zstd", "lz4" or "none"; defaults to
+        `config.file_storage.archive_codec`. Artifacts that are already compressed are always stored as-is.
+    :param format: one of "tar", "plexe" or "directory", or None to choose the format from the path's suffix
+    :param store: content-addressed artifact store to write the artifacts to, as an `ArtifactStore`, the path of
+        its directory, or True for the default store in `config.file_storage.model_cache_dir`. Only artifacts
+        missing from the store are written, and the archive holds a manifest of their digests instead of their
+        content. `load_model` reads them from the same store.
+    :param snapshot: whether to also store a snapshot of the initialised predictor, if its class opts in through
+        `Predictor.snapshot_serializer`. `load_model` restores the snapshot instead of initialising the predictor,
+        unless the Python or package versions have changed since the model was saved.
     :return: Path where the model was saved
     """
     #     Archive structure:
@@ -32,107 +98,392 @@ def save_model(model: Model, path: str | Path) -> str:
     #         - state.txt
     #         - metrics.json
     #         - metadata.json
+    #         - input_sample.json
     #     - schemas/
     #         - input_schema.json
     #         - output_schema.json
     #     - code/
     #         - trainer.py
     #         - predictor.py
+    #     - snapshot/
+    #         - predictor.pkl
+    #         - fingerprint.json
     #     - artifacts/
     #         - [model files]
 
-    # Ensure .tar.gz extension
-    if not str(path).endswith(".tar.gz"):
-        raise ValueError("Path must end with .tar.gz")
+    archive_format = format or next((fmt for suffix, fmt in FORMATS.items() if str(path).endswith(suffix)), None)
+    if archive_format is None:
+        raise ValueError(f"Path must end with one of {', '.join(FORMATS)}, or format='{DIRECTORY}' must be given")
+    if archive_format not in (*FORMATS.values(), DIRECTORY):
+        raise ValueError(f"Unknown format '{archive_format}', expected one of tar, plexe or {DIRECTORY}")
+    if codec is not None and archive_format != "plexe":
+        raise ValueError("A codec can only be chosen for .plexe containers")
+    if archive_format == DIRECTORY and Path(path).is_dir() and any(Path(path).iterdir()):
+        # Never replace a directory that does not hold a saved model
+        if not (Path(path) / INTENT).is_file():
+            raise ValueError(f"Directory {path} is not empty and does not contain a saved model")
 
     # Ensure parent directory exists
     Path(path).parent.mkdir(parents=True, exist_ok=True)
 
+    entries = _model_entries(model, snapshot)
+    if store:
+        store = _resolve_store(store)
+        manifest = {"store": str(store.root), "artifacts": {}}
+        entries = _store_artifacts(entries, store, manifest)
+
+    # Write to a temporary file and move it into place, so that processes which have memory-mapped artifacts of
+    # an existing archive at the same path keep reading consistent data, and a failed save leaves nothing behind
     try:
-        with tarfile.open(path, "w:gz") as tar:
-            metrics_data = {}
-            if model.metric:
-                metrics_data = {
-                    "name": model.metric.name,
-                    "value": model.metric.value,
-                    "comparison_method": model.metric.comparator.comparison_method.value,
-                    "target": model.metric.comparator.target,
-                }
-
-            metadata = {
-                "intent": model.intent,
-                "state": model.state.value,
-                "metrics": metrics_data,
-                "metadata": model.metadata,
-                "identifier": model.identifier,
-            }
-
-            # Save each metadata item separately
-            for key, value in metadata.items():
-                if key in ["metrics", "metadata"]:
-                    info = tarfile.TarInfo(f"metadata/{key}.json")
-                    content = json.dumps(value, indent=2).encode("utf-8")
-                else:
-                    info = tarfile.TarInfo(f"metadata/{key}.txt")
-                    content = str(value).encode("utf-8")
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
-
-            for name, schema in [("input_schema", model.input_schema), ("output_schema", model.output_schema)]:
-                schema_dict = {name: field.annotation.__name__ for name, field in schema.model_fields.items()}
-                info = tarfile.TarInfo(f"schemas/{name}.json")
-                content = json.dumps(schema_dict).encode("utf-8")
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
-
-            if model.trainer_source:
-                info = tarfile.TarInfo("code/trainer.py")
-                content = model.trainer_source.encode("utf-8")
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
-
-            if model.predictor_source:
-                info = tarfile.TarInfo("code/predictor.py")
-                content = model.predictor_source.encode("utf-8")
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
-
-            for artifact in model.artifacts:
-                arc_name = f"artifacts/{Path(artifact.name).as_posix()}"
-                info = tarfile.TarInfo(arc_name)
-
-                if artifact.is_path():
-                    with open(artifact.path, "rb") as f:
-                        content = f.read()
-                elif artifact.is_handle():
-                    content = artifact.handle.read()
-                else:
-                    content = artifact.data
-
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
-
-            if model.constraints:
-                info = tarfile.TarInfo("metadata/constraints.pkl")
-                content = pickle.dumps(model.constraints)
-                info.size = len(content)
-                tar.addfile(info, io.BytesIO(content))
+        with _atomic_write(Path(path)) as temporary:
+            if archive_format == "plexe":
+                with ContainerWriter(
+                    temporary,
+                    codec=codec or config.file_storage.archive_codec,
+                    chunk_size=config.file_storage.archive_chunk_size,
+                    workers=config.file_storage.archive_compression_workers,
+                ) as container:
+                    for name, source in entries:
+                        container.add(name, source)
+            elif archive_format == DIRECTORY:
+                for name, source in entries:
+                    _add_to_directory(temporary, name, source)
+            else:
+                # The tar stream is gzipped in blocks on several threads; artifacts are streamed, not read whole
+                with (
+                    open(temporary, "wb") as out,
+                    ParallelGzipWriter(
+                        out,
+                        level=config.file_storage.archive_gzip_level,
+                        workers=config.file_storage.archive_compression_workers,
+                    ) as compressed,
+                    tarfile.open(fileobj=compressed, mode="w|") as tar,
+                ):
+                    for name, source in entries:
+                        _add_to_tar(tar, name, source)
+
+        if store:
+            store.add_reference(path, (entry["sha256"] for entry in manifest["artifacts"].values()))
 
     except Exception as e:
         logger.error(f"Error saving model: {e}")
-        if Path(path).exists():
-            Path(path).unlink()
         raise
 
     logger.info(f"Model saved to {path}")
     return str(path)
 
 
-def load_model(path: str | Path) -> Model:
-    """
-    Instantiate a model from a tar archive.
+def _model_entries(model: Model, snapshot: bool = False) -> Iterator[Tuple[str, ArchiveSource]]:
+    """Yield the name and content of each archive entry of a model; artifacts are yielded without reading them."""
+    metrics_data = {}
+    if model.metric:
+        metrics_data = {
+            "name": model.metric.name,
+            "value": model.metric.value,
+            "comparison_method": model.metric.comparator.comparison_method.value,
+            "target": model.metric.comparator.target,
+        }
+
+    yield INTENT, str(model.intent).encode("utf-8")
+    yield STATE, str(model.state.value).encode("utf-8")
+    yield METRICS, json.dumps(metrics_data, indent=2).encode("utf-8")
+    # The creation time is kept across saves, so that catalogs can order models by when they were first saved
+    metadata = {**model.metadata, "created_at": model.metadata.get("created_at") or _now()}
+    yield METADATA, json.dumps(metadata, indent=2).encode("utf-8")
+    yield IDENTIFIER, str(model.identifier).encode("utf-8")
+
+    for name, schema in [(INPUT_SCHEMA, model.input_schema), (OUTPUT_SCHEMA, model.output_schema)]:
+        schema_dict = {name: field.annotation.__name__ for name, field in schema.model_fields.items()}
+        yield name, json.dumps(schema_dict).encode("utf-8")
+
+    if model.trainer_source:
+        yield TRAINER_SOURCE, model.trainer_source.encode("utf-8")
+    if model.predictor_source:
+        yield PREDICTOR_SOURCE, model.predictor_source.encode("utf-8")
+    if model.input_sample:
+        yield INPUT_SAMPLE, json.dumps(model.input_sample, default=_to_json_native).encode("utf-8")
+    if model.constraints:
+        yield CONSTRAINTS, pickle.dumps(model.constraints)
+    if snapshot:
+        yield from _snapshot_entries(model)
+
+    for artifact in model.artifacts:
+        name = f"{ARTIFACTS_DIR}{Path(artifact.name).as_posix()}"
+        if artifact.is_path():
+            yield name, Path(artifact.path)
+        elif artifact.is_handle():
+            yield name, artifact.handle
+        elif artifact.is_lazy():
+            yield name, artifact.get_as_handle()
+        else:
+            yield name, artifact.data
+
+
+def _snapshot_entries(model: Model) -> Iterator[Tuple[str, ArchiveSource]]:
+    """Yield the snapshot of a model's initialised predictor and its environment fingerprint, if it has one."""
+    module = defining_module(type(model.predictor)) if model.predictor is not None else None
+    result = create_snapshot(model.predictor, module) if module is not None else None
+    if result is None:
+        logger.info("Model predictor does not support snapshots; saving the model without one")
+        return
+    data, fingerprint = result
+    yield SNAPSHOT, data
+    yield SNAPSHOT_FINGERPRINT, json.dumps(fingerprint, indent=2).encode("utf-8")
+
+
+def _add_to_tar(tar: tarfile.TarFile, name: str, source: ArchiveSource) -> None:
+    if isinstance(source, Path):
+        tar.add(source, arcname=name)
+        return
+    info = tarfile.TarInfo(name)
+    if isinstance(source, bytes):
+        info.size = len(source)
+        tar.addfile(info, io.BytesIO(source))
+        return
+    if source.seekable():
+        start = source.tell()
+        info.size = source.seek(0, io.SEEK_END) - start
+        source.seek(start)
+        tar.addfile(info, source)
+        return
+    # Tar headers need the size up front, so streams of unknown length are spooled to disk first
+    with tempfile.TemporaryFile() as spool:
+        shutil.copyfileobj(source, spool, 1024 * 1024)
+        info.size = spool.tell()
+        spool.seek(0)
+        tar.addfile(info, spool)
+
+
+def _resolve_store(store: Union[ArtifactStore, str, Path, bool]) -> ArtifactStore:
+    if isinstance(store, ArtifactStore):
+        return store
+    if store is True:
+        return ArtifactStore(_cache_dir() / "store")
+    return ArtifactStore(store)
+
+
+def _store_artifacts(
+    entries: Iterator[Tuple[str, ArchiveSource]], store: ArtifactStore, manifest: dict
+) -> Iterator[Tuple[str, ArchiveSource]]:
+    """Write the artifacts among archive entries to a store, replacing them with a manifest of their digests."""
+    for name, source in entries:
+        if name.startswith(ARTIFACTS_DIR):
+            digest, size = store.put(source)
+            manifest["artifacts"][name] = {"sha256": digest, "size": size}
+        else:
+            yield name, source
+    yield ARTIFACT_MANIFEST, json.dumps(manifest, indent=2).encode("utf-8")
+
+
+def _add_to_directory(directory: Path, name: str, source: ArchiveSource) -> None:
+    destination = directory / _safe_relative_path(name)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(source, Path):
+        shutil.copyfile(source, destination)
+    elif isinstance(source, bytes):
+        destination.write_bytes(source)
+    else:
+        with open(destination, "wb") as out:
+            shutil.copyfileobj(source, out, 1024 * 1024)
+
+
+class _DirectoryArchive:
+    """Reads the entries of a model saved to a directory."""
+
+    def __init__(self, path: Path):
+        self.path = path.resolve()
+        self._names = sorted(
+            entry.relative_to(self.path).as_posix()
+            for entry in self.path.rglob("*")
+            if entry.is_file() and not entry.name.startswith(".")
+        )
+
+    def names(self) -> List[str]:
+        return self._names
+
+    def __contains__(self, name: str) -> bool:
+        return (self.path / _safe_relative_path(name)).is_file()
+
+    def read(self, name: str) -> bytes:
+        return (self.path / _safe_relative_path(name)).read_bytes()
+
+    def size(self, name: str) -> int:
+        return (self.path / _safe_relative_path(name)).stat().st_size
+
+    def artifact(self, name: str) -> Artifact:
+        return Artifact(name=Path(name).name, path=self.path / _safe_relative_path(name))
+
+    def close(self) -> None:
+        pass
+
+
+class _TarArchive:
+    """Reads the entries of a tar.gz model archive."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._tar = tarfile.open(path, "r:gz")
+        # Index the members once; tarfile scans the whole compressed stream to list them
+        self._members = {member.name: member for member in self._tar.getmembers() if member.isfile()}
+
+    def names(self) -> List[str]:
+        return list(self._members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def read(self, name: str) -> bytes:
+        return self._tar.extractfile(self._members[name]).read()
+
+    def size(self, name: str) -> int:
+        return self._members[name].size
+
+    def artifact(self, name: str) -> Artifact:
+        # Members of a compressed stream cannot be mapped, so they are extracted to the local cache first
+        destination = _extraction_path(self.path, name)
+        if not _is_extracted(destination, self._members[name].size):
+            with _atomic_write(destination) as temporary, open(temporary, "wb") as out:
+                shutil.copyfileobj(self._tar.extractfile(self._members[name]), out, 1024 * 1024)
+        return Artifact.from_loader(Path(name).name, functools.partial(map_file, destination))
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+class _TarMetadataArchive:
+    """Reads the metadata and schemas of a tar.gz model archive, stopping before its artifacts."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, bytes] = {}
+        # Metadata is written before code and artifacts, so only the start of the compressed stream is read
+        with tarfile.open(path, "r|gz") as tar:
+            for member in tar:
+                if member.name.startswith(ARTIFACTS_DIR):
+                    break
+                if member.isfile() and member.name.startswith(("metadata/", "schemas/")):
+                    self._entries[member.name] = tar.extractfile(member).read()
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def read(self, name: str) -> bytes:
+        return self._entries[name]
+
+    def size(self, name: str) -> int:
+        return len(self._entries[name])
+
+    def close(self) -> None:
+        pass
+
+
+class _ContainerArchive(ContainerReader):
+    """Reads the entries of a .plexe model container."""
 
-    :param path: path to tar archive
+    def size(self, name: str) -> int:
+        return self.info(name)["size"]
+
+    def artifact(self, name: str) -> Artifact:
+        info = self.info(name)
+        if info["codec"] == "none":
+            # Uncompressed entries are mapped straight from the container
+            loader = functools.partial(map_file, self.path.resolve(), info["offset"], info["size"])
+        else:
+            loader = functools.partial(_map_extracted, self.path.resolve(), name)
+        return Artifact.from_loader(Path(name).name, loader)
+
+
+def _map_extracted(path: Path, name: str) -> memoryview:
+    """Map a compressed container entry, decompressing it to the local cache on first use."""
+    destination = _extraction_path(path, name)
+    with ContainerReader(path) as container:
+        if not _is_extracted(destination, container.info(name)["size"]):
+            with _atomic_write(destination) as temporary:
+                container.extract(name, temporary)
+    return map_file(destination)
+
+
+def _extraction_path(archive: Path, name: str) -> Path:
+    """Path in the local cache to which an archive entry is extracted, unique to the archive's path and version."""
+    stat = archive.stat()
+    key = f"{archive.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return _cache_dir() / EXTRACTED_ARTIFACTS_DIR / digest / _safe_relative_path(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_dir() -> Path:
+    """The local cache directory, made absolute once, so that archives loaded from any working directory share it."""
+    return Path(config.file_storage.model_cache_dir).resolve()
+
+
+def _safe_relative_path(name: str) -> Path:
+    """Convert an entry name to a relative path, rejecting names that would escape the directory they are in."""
+    if PurePosixPath(name).is_absolute() or ".." in PurePosixPath(name).parts:
+        raise ValueError(f"Invalid entry name in archive: {name}")
+    return Path(*PurePosixPath(name).parts)
+
+
+def _is_extracted(path: Path, size: int) -> bool:
+    return path.is_file() and path.stat().st_size == size
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Path) -> Iterator[Path]:
+    """Yield a temporary path to write a file or directory to, which replaces `path` once the write succeeds."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield temporary
+        if temporary.is_dir() and path.is_dir():
+            # Directories cannot be renamed over non-empty directories, so the old one is moved aside first
+            previous = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.old")
+            os.replace(path, previous)
+            os.replace(temporary, path)
+            shutil.rmtree(previous)
+        else:
+            os.replace(temporary, path)
+    finally:
+        if temporary.is_dir():
+            shutil.rmtree(temporary)
+        else:
+            temporary.unlink(missing_ok=True)
+
+
+def _open_archive(
+    path: Path, metadata_only: bool = False
+) -> Union[_DirectoryArchive, _TarArchive, _TarMetadataArchive, _ContainerArchive]:
+    if path.is_dir():
+        return _DirectoryArchive(path)
+    if is_container(path):
+        return _ContainerArchive(path)
+    return _TarMetadataArchive(path) if metadata_only else _TarArchive(path)
+
+
+def load_model(
+    path: str | Path,
+    warmup: bool = False,
+    cache: bool = False,
+    store: Union[ArtifactStore, str, Path, None] = None,
+    metadata_only: bool = False,
+) -> Model:
+    """
+    Instantiate a model from an archive or directory saved with `save_model`, in any format.
+
+    :param path: path to the archive or directory
+    :param warmup: whether to warm up the predictor with its stored input sample before returning, so that
+        the first predictions are not slowed down by first-call costs; see `Model.warmup`
+    :param cache: whether to use the process-wide model cache. Cached models are shared: every call that loads
+        the same unchanged archive returns the same instance, which callers must not modify. See `evict_model`
+        and `clear_model_cache`.
+    :param store: artifact store holding the model's artifacts, if the model was saved with a store that has
+        since moved; by default, the store recorded in the archive is used
+    :param metadata_only: whether to read only the intent, state, schemas, metric, metadata and input sample,
+        without reading or executing code, unpickling constraints, or touching artifacts. The returned model has no
+        predictor and cannot make predictions; use this to inspect or select models cheaply. Not cached.
     :return: the loaded model
     :raises ValueError: If model is not found
     :raises Exception: If there are errors during loading
@@ -140,84 +491,208 @@ def load_model(path: str | Path) -> Model:
     if not Path(path).exists():
         raise ValueError(f"Model not found: {path}")
 
-    # TODO: the mapping between model internals and the archive structure should be defined once somewhere
-    # for example, in this module but outside the load/save functions
     try:
-        with tarfile.open(path, "r:gz") as tar:
-            # Extract metadata
-            intent = tar.extractfile("metadata/intent.txt").read().decode("utf-8")
-            state = ModelState(tar.extractfile("metadata/state.txt").read().decode("utf-8"))
-            metrics_data = json.loads(tar.extractfile("metadata/metrics.json").read().decode("utf-8"))
-            metadata = json.loads(tar.extractfile("metadata/metadata.json").read().decode("utf-8"))
-            identifier = tar.extractfile("metadata/identifier.txt").read().decode("utf-8")
-
-            # Extract schema information
-            input_schema_dict = json.loads(tar.extractfile("schemas/input_schema.json").read().decode("utf-8"))
-            output_schema_dict = json.loads(tar.extractfile("schemas/output_schema.json").read().decode("utf-8"))
-
-            # Extract code if available
-            trainer_source = None
-            if "code/trainer.py" in [m.name for m in tar.getmembers()]:
-                trainer_source = tar.extractfile("code/trainer.py").read().decode("utf-8")
-
-            predictor_source = None
-            if "code/predictor.py" in [m.name for m in tar.getmembers()]:
-                predictor_source = tar.extractfile("code/predictor.py").read().decode("utf-8")
-
-            # Extract constraints if available
-            constraints = []
-            if "metadata/constraints.pkl" in [m.name for m in tar.getmembers()]:
-                constraints = pickle.loads(tar.extractfile("metadata/constraints.pkl").read())
-
-            # Get handles for all model artifacts
-            artifact_handles = []
-            for member in tar.getmembers():
-                if member.name.startswith("artifacts/") and not member.isdir():
-                    file_data = tar.extractfile(member)
-                    if file_data:
-                        artifact_handles.append(Artifact.from_data(Path(member.name).name, file_data.read()))
-
-            # Reconstruct Metric object if metrics data exists
-            metrics = None
-            if metrics_data:
-                comparator = MetricComparator(
-                    comparison_method=ComparisonMethod(metrics_data["comparison_method"]), target=metrics_data["target"]
-                )
-                metrics = Metric(name=metrics_data["name"], value=metrics_data["value"], comparator=comparator)
-
-            def type_from_name(type_name: str) -> type:
-                type_map = {"str": str, "int": int, "float": float, "bool": bool}
-                return type_map[type_name]
-
-            # Create schemas from the schema dictionaries
-            input_schema = map_to_basemodel(
-                "InputSchema", {name: type_from_name(type_name) for name, type_name in input_schema_dict.items()}
-            )
-            output_schema = map_to_basemodel(
-                "OutputSchema", {name: type_from_name(type_name) for name, type_name in output_schema_dict.items()}
-            )
+        if metadata_only:
+            archive = _open_archive(Path(path), metadata_only=True)
+            try:
+                return _read_model(archive, store, metadata_only=True)
+            finally:
+                archive.close()
+        if cache:
+            model = _get_model_cache().get_or_load(_archive_key(Path(path)), path, lambda: _load(Path(path), store))
+        else:
+            model, _ = _load(Path(path), store)
 
-            # Create the model instance
-            model = Model(
-                intent=intent, input_schema=input_schema, output_schema=output_schema, constraints=constraints
-            )
-            model.state = state
-            model.metric = metrics
-            model.metadata = metadata
-            model.identifier = identifier
-            model.trainer_source = trainer_source
-            model.predictor_source = predictor_source
+    except Exception as e:
+        logger.error(f"Error loading model: {e}")
+        raise
 
-            if predictor_source:
-                predictor_module = types.ModuleType("predictor")
-                exec(predictor_source, predictor_module.__dict__)
-                model.predictor = predictor_module.PredictorImplementation(artifact_handles)
+    # Models shared through the model cache are warmed up once; warm-up stats saved with the model do not count
+    if warmup and model.state == ModelState.READY and not model._warmed:
+        try:
+            model.warmup()
+        except Exception as e:
+            logger.warning(f"Model warm-up failed, the first predictions may be slow: {e}")
+    return model
 
-            model.artifacts = artifact_handles
 
-            logger.debug(f"Model successfully loaded from {path}")
-            return model
+def evict_model(path: str | Path) -> bool:
+    """
+    Remove a model from the process-wide model cache, so that the next cached load reads the archive again.
 
-    except Exception as e:
-        logger.error(f"Error loading model: {e}")
-        raise
+    :param path: path the model was loaded from
+    :return: True if a cached model was evicted
+    """
+    return _get_model_cache().evict(path)
+
+
+def clear_model_cache() -> None:
+    """
+    Remove all models from the process-wide model cache.
+    """
+    _get_model_cache().clear()
+
+
+def clear_extracted_artifacts() -> None:
+    """
+    Remove the artifacts extracted from compressed archives to the local cache. Archives loaded afterwards are
+    extracted again; models that are already loaded keep their artifacts mapped until they are released.
+    """
+    directory = _cache_dir() / EXTRACTED_ARTIFACTS_DIR
+    if directory.exists():
+        shutil.rmtree(directory)
+
+
+_model_cache: Optional[LoadedModelCache] = None
+_model_cache_lock = threading.Lock()
+
+# Digests of tar archives, by path, size and modification time, so that unchanged archives are hashed only once
+_tar_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def _get_model_cache() -> LoadedModelCache:
+    global _model_cache
+    with _model_cache_lock:
+        if _model_cache is None:
+            _model_cache = LoadedModelCache(
+                max_models=config.file_storage.loaded_model_cache_max_models,
+                max_bytes=config.file_storage.loaded_model_cache_max_bytes,
+            )
+        return _model_cache
+
+
+def _archive_key(path: Path) -> str:
+    """Key of an archive in the model cache: a digest of its content, plus its modification time."""
+    if path.is_dir():
+        # Hashing every artifact would cost as much as loading them; the names, sizes and times of the files
+        # identify the directory's content instead
+        files = sorted(entry for entry in path.rglob("*") if entry.is_file() and not entry.name.startswith("."))
+        listing = [(str(f.relative_to(path)), f.stat().st_size, f.stat().st_mtime_ns) for f in files]
+        digest = hashlib.sha256(json.dumps(listing).encode("utf-8")).hexdigest()
+        return f"{digest}:{max((mtime for _, _, mtime in listing), default=0)}"
+
+    stat = path.stat()
+    if is_container(path):
+        # The index holds the checksum of every entry, so its digest identifies the container's content
+        with ContainerReader(path) as container:
+            digest = container.digest()
+    else:
+        signature = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        digest = _tar_digests.get(signature)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            if len(_tar_digests) >= 1024:
+                _tar_digests.clear()
+            _tar_digests[signature] = digest
+    return f"{digest}:{stat.st_mtime_ns}"
+
+
+def _load(path: Path, store: Union[ArtifactStore, str, Path, None] = None) -> Tuple[Model, int]:
+    """Load a model, returning it with an estimate of its memory footprint in bytes."""
+    archive = _open_archive(path)
+    try:
+        model = _read_model(archive, store)
+        footprint = sum(archive.size(name) for name in archive.names())
+        if ARTIFACT_MANIFEST in archive:
+            manifest = json.loads(archive.read(ARTIFACT_MANIFEST))
+            footprint += sum(entry["size"] for entry in manifest["artifacts"].values())
+    finally:
+        archive.close()
+    logger.debug(f"Model successfully loaded from {path}")
+    return model, footprint
+
+
+def _read_model(
+    archive: Union[_DirectoryArchive, _TarArchive, _TarMetadataArchive, _ContainerArchive],
+    store: Union[ArtifactStore, str, Path, None],
+    metadata_only: bool = False,
+) -> Model:
+    """Reconstruct a model from an open archive; artifacts are only mapped into memory when they are accessed."""
+
+    def read_text(name: str) -> Optional[str]:
+        return archive.read(name).decode("utf-8") if name in archive else None
+
+    # Extract metadata
+    intent = read_text(INTENT)
+    state = ModelState(read_text(STATE))
+    metrics_data = json.loads(read_text(METRICS))
+    metadata = json.loads(read_text(METADATA))
+    identifier = read_text(IDENTIFIER)
+
+    # Extract schema information
+    input_schema_dict = json.loads(read_text(INPUT_SCHEMA))
+    output_schema_dict = json.loads(read_text(OUTPUT_SCHEMA))
+
+    # Extract code if available
+    trainer_source = None if metadata_only else read_text(TRAINER_SOURCE)
+    predictor_source = None if metadata_only else read_text(PREDICTOR_SOURCE)
+    input_sample = json.loads(read_text(INPUT_SAMPLE) or "[]")
+    # Unpickling constraints can import and run code, so metadata-only loads skip them
+    constraints = pickle.loads(archive.read(CONSTRAINTS)) if CONSTRAINTS in archive and not metadata_only else []
+
+    # Reconstruct Metric object if metrics data exists
+    metrics = None
+    if metrics_data:
+        comparator = MetricComparator(
+            comparison_method=ComparisonMethod(metrics_data["comparison_method"]), target=metrics_data["target"]
+        )
+        metrics = Metric(name=metrics_data["name"], value=metrics_data["value"], comparator=comparator)
+
+    def type_from_name(type_name: str) -> type:
+        type_map = {"str": str, "int": int, "float": float, "bool": bool}
+        return type_map[type_name]
+
+    # Create schemas from the schema dictionaries
+    input_schema = map_to_basemodel(
+        "InputSchema", {name: type_from_name(type_name) for name, type_name in input_schema_dict.items()}
+    )
+    output_schema = map_to_basemodel(
+        "OutputSchema", {name: type_from_name(type_name) for name, type_name in output_schema_dict.items()}
+    )
+
+    # Create the model instance
+    model = Model(intent=intent, input_schema=input_schema, output_schema=output_schema, constraints=constraints)
+    model.state = state
+    model.metric = metrics
+    model.metadata = metadata
+    model.identifier = identifier
+    model.trainer_source = trainer_source
+    model.predictor_source = predictor_source
+    model.input_sample = input_sample
+    if metadata_only:
+        return model
+
+    model.artifacts = [archive.artifact(name) for name in archive.names() if name.startswith(ARTIFACTS_DIR)]
+    if ARTIFACT_MANIFEST in archive:
+        # Artifacts saved to a store are used in place, by path, like those of directories
+        manifest = json.loads(archive.read(ARTIFACT_MANIFEST))
+        store = _resolve_store(store or manifest["store"])
+        for name, entry in manifest["artifacts"].items():
+            if entry["sha256"] not in store:
+                raise ValueError(f"Artifact '{name}' ({entry['sha256']}) is missing from the store at {store.root}")
+            model.artifacts.append(Artifact(name=Path(name).name, path=store.blob_path(entry["sha256"])))
+
+    if predictor_source:
+        predictor_module = load_source_module(predictor_source)
+        if SNAPSHOT in archive and SNAPSHOT_FINGERPRINT in archive:
+            # The module is imported first, so that the snapshot can resolve the predictor's class
+            fingerprint = json.loads(archive.read(SNAPSHOT_FINGERPRINT))
+            model.predictor = restore_snapshot(archive.read(SNAPSHOT), fingerprint, predictor_module)
+        if model.predictor is None:
+            model.predictor = predictor_module.PredictorImplementation(model.artifacts)
+        # Most frameworks copy the artifacts while loading; drop the mappings so the copies are not held twice.
+        # Buffers that the predictor still refers to, for example through numpy views, stay mapped.
+        for artifact in model.artifacts:
+            artifact.release()
+
+    return model
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _to_json_native(value):
+    """Convert numpy scalars and other values the json module cannot encode, such as timestamps."""
+    return value.item() if hasattr(value, "item") else str(value)
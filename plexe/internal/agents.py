@@ -17,6 +17,7 @@ from plexe.internal.models.entities.code import Code
 from plexe.internal.models.entities.metric import Metric
 from plexe.internal.models.entities.metric import MetricComparator, ComparisonMethod
 from plexe.internal.models.interfaces.predictor import Predictor
+from plexe.internal.models.storage.code_cache import load_source_module
 from plexe.internal.models.tools.training import (
     get_generate_training_code,
     get_fix_training_code,
@@ -24,7 +25,7 @@ from plexe.internal.models.tools.training import (
 from plexe.internal.models.tools.evaluation import get_review_finalised_model
 from plexe.internal.models.tools.metrics import get_select_target_metric
 from plexe.internal.models.tools.datasets import split_datasets, create_input_sample
-from plexe.internal.models.tools.execution import get_executor_tool
+from plexe.internal.models.tools.execution import get_batch_executor_tools, get_executor_tool
 from plexe.internal.models.tools.response_formatting import (
     format_final_orchestrator_agent_response,
     format_final_mle_agent_response,
@@ -134,6 +135,7 @@ class PlexeAgent:
                 validate_training_code,
                 get_fix_training_code(self.tool_model_id),
                 get_executor_tool(distributed),
+                *get_batch_executor_tools(distributed),
                 format_final_mle_agent_response,
             ],
             add_base_tools=False,
@@ -241,17 +243,18 @@ class PlexeAgent:
             metadata = result.get("metadata", {"model_type": "unknown", "framework": "unknown"})
 
             # Compile the inference code into a module
-            inference_module: types.ModuleType = types.ModuleType("predictor")
-            exec(inference_code, inference_module.__dict__)
+            inference_module: types.ModuleType = load_source_module(inference_code)
             # Instantiate the predictor class from the loaded module
             predictor_class = getattr(inference_module, "PredictorImplementation")
-            predictor = predictor_class(object_registry.get_all(Artifact).values())
+            # Only the selected solution's artifacts, since other candidates may have written files of the same name
+            model_artifacts = list(object_registry.get_multiple(Artifact, artifact_names).values())
+            predictor = predictor_class(model_artifacts)
 
             return ModelGenerationResult(
                 training_source_code=training_code,
                 inference_source_code=inference_code,
                 predictor=predictor,
-                model_artifacts=list(object_registry.get_multiple(Artifact, artifact_names).values()),
+                model_artifacts=model_artifacts,
                 performance=performance,
                 test_performance=performance,  # Using the same performance for now
                 metadata=metadata,
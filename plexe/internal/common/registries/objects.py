@@ -2,6 +2,7 @@
 This module provides a generic Registry pattern implementation for storing and retrieving objects by name or prefix.
 """
 
+import threading
 from typing import Dict, List, Type, TypeVar
 
 
@@ -14,17 +15,20 @@ class ObjectRegistry:
 
     This class implements the Singleton pattern so that registry instances are shared
     across the application. It provides methods for registering, retrieving, and
-    managing objects in a type-safe manner.
+    managing objects in a type-safe manner. It is thread-safe, since executions run concurrently on
+    several threads read and register items at the same time.
     """
 
     _instance = None
     _items = {}
+    _lock = threading.RLock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ObjectRegistry, cls).__new__(cls)
-            cls._items = {}
-        return cls._instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ObjectRegistry, cls).__new__(cls)
+                cls._items = {}
+            return cls._instance
 
     @staticmethod
     def _get_uri(t: Type[T], name: str) -> str:
@@ -39,9 +43,10 @@ class ObjectRegistry:
         :param item: the item to register
         """
         uri = self._get_uri(t, name)
-        if uri in self._items:
-            raise ValueError(f"Item '{uri}' already registered, use a different name")
-        self._items[uri] = item
+        with self._lock:
+            if uri in self._items:
+                raise ValueError(f"Item '{uri}' already registered, use a different name")
+            self._items[uri] = item
 
     def register_multiple(self, t: Type[T], items: Dict[str, T]) -> None:
         """
@@ -50,8 +55,9 @@ class ObjectRegistry:
         :param t: type prefix for the items
         :param items: dictionary of item names and their corresponding objects
         """
-        for name, item in items.items():
-            self.register(t, name, item)
+        with self._lock:
+            for name, item in items.items():
+                self.register(t, name, item)
 
     def get(self, t: Type[T], name: str) -> T:
         """
@@ -63,9 +69,10 @@ class ObjectRegistry:
         :raises KeyError: If the item is not found in the registry
         """
         uri = self._get_uri(t, name)
-        if uri not in self._items:
-            raise KeyError(f"Item '{uri}' not found in registry")
-        return self._items[uri]
+        with self._lock:
+            if uri not in self._items:
+                raise KeyError(f"Item '{uri}' not found in registry")
+            return self._items[uri]
 
     def get_multiple(self, t: Type[T], names: List[str]) -> Dict[str, T]:
         """
@@ -76,7 +83,8 @@ class ObjectRegistry:
         :return: Dictionary mapping item names to items
         :raises KeyError: If any item is not found in the registry
         """
-        return {name: self.get(t, name) for name in names}
+        with self._lock:
+            return {name: self.get(t, name) for name in names}
 
     def get_all(self, t: Type[T]) -> Dict[str, T]:
         """
@@ -85,13 +93,15 @@ class ObjectRegistry:
         :param t: type prefix for the items
         :return: Dictionary mapping item names to items
         """
-        return {name: item for name, item in self._items.items() if name.startswith(str(t))}
+        with self._lock:
+            return {name: item for name, item in self._items.items() if name.startswith(str(t))}
 
     def clear(self) -> None:
         """
         Clear all registered items.
         """
-        self._items.clear()
+        with self._lock:
+            self._items.clear()
 
     def list(self) -> List[str]:
         """
@@ -99,4 +109,5 @@ class ObjectRegistry:
 
         :return: List of item names in the registry
         """
-        return list(self._items.keys())
+        with self._lock:
+            return list(self._items.keys())
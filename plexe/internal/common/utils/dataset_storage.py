@@ -4,17 +4,33 @@ This module provides utilities for dataset storage and transfer across processes
 These utilities work with any class implementing the DatasetInterface and provide
 functions for storing datasets to files, reading datasets from files, and using
 shared memory for cross-process dataset sharing.
+
+A shared memory segment starts with a fixed-size header holding a magic number, the payload's encoding and its size
+in bytes, so that readers never have to guess where the payload ends: segments are rounded up to whole pages, and
+the padding is not part of the payload. Tabular datasets are stored as an Arrow IPC stream, whose buffers readers
+can use in place, without copying them out of the segment; several processes can therefore work on one in-memory
+copy of a dataset. Other datasets are stored as their `to_bytes` serialization.
 """
 
-from typing import Type, TypeVar, Optional
+import struct
+import traceback
+from typing import Any, Optional, Tuple, Type, TypeVar
 import logging
 
-from plexe.internal.common.datasets.interface import Dataset
+from plexe.internal.common.datasets.interface import Dataset, TabularConvertible
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=Dataset)
 
+# Header of shared memory segments: magic number, payload encoding, payload size; padded so that the payload is
+# aligned for Arrow's buffers
+_SHM_MAGIC = b"PLXD"
+_SHM_HEADER = struct.Struct("<4sB3xQ")
+_SHM_PAYLOAD_OFFSET = 64
+_ENCODING_BYTES = 0
+_ENCODING_ARROW = 1
+
 
 def write_dataset_to_file(dataset: Dataset, path: str) -> None:
     """
@@ -39,66 +55,150 @@ def read_dataset_from_file(dataset_class: Type[T], path: str) -> T:
         return dataset_class.from_bytes(f.read())
 
 
-def dataset_to_shared_memory(dataset: Dataset, name: str) -> None:
+def dataset_to_shared_memory(dataset: Dataset, name: str) -> Any:
     """
     Place dataset in shared memory for cross-process access.
 
-    This function serializes a dataset and places it in shared memory
-    with the given name, allowing other processes to access it.
+    This function serializes a dataset into a new shared memory segment with the given name, allowing other
+    processes to access it. Tabular datasets are written as an Arrow IPC stream directly into the segment. The
+    caller owns the segment: it must close it, and unlink it once no process needs the dataset any more.
 
     :param dataset: The dataset to place in shared memory
     :param name: Name of the shared memory segment
+    :returns: The `multiprocessing.shared_memory.SharedMemory` segment
     :raises ImportError: If shared memory is not available
     """
     try:
         from multiprocessing import shared_memory
+    except ImportError:
+        raise ImportError("Shared memory requires Python 3.8+ and the multiprocessing module")
 
-        # Serialize the dataset
-        data = dataset.to_bytes()
+    if isinstance(dataset, TabularConvertible):
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(dataset.to_pandas())
+        # Measure the stream first, so that it can be written straight into the segment without an extra copy
+        sink = pa.MockOutputStream()
+        _write_arrow_stream(sink, table)
+        size = sink.size()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_SHM_PAYLOAD_OFFSET + max(size, 1))
+        payload = None
+        try:
+            payload = pa.py_buffer(shm.buf[_SHM_PAYLOAD_OFFSET : _SHM_PAYLOAD_OFFSET + size])
+            _write_arrow_stream(pa.FixedSizeBufferWriter(payload), table)
+            del payload
+            shm.buf[: _SHM_HEADER.size] = _SHM_HEADER.pack(_SHM_MAGIC, _ENCODING_ARROW, size)
+        except BaseException as e:
+            payload = None
+            _release_exported_buffers(e)
+            shm.close()
+            shm.unlink()
+            raise
+        return shm
 
-        # Create shared memory segment
-        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    data = dataset.to_bytes()
+    shm = shared_memory.SharedMemory(name=name, create=True, size=_SHM_PAYLOAD_OFFSET + max(len(data), 1))
+    shm.buf[_SHM_PAYLOAD_OFFSET : _SHM_PAYLOAD_OFFSET + len(data)] = data
+    shm.buf[: _SHM_HEADER.size] = _SHM_HEADER.pack(_SHM_MAGIC, _ENCODING_BYTES, len(data))
+    return shm
 
-        # Copy dataset bytes to shared memory
-        shm.buf[: len(data)] = data
 
-        return shm
+def table_from_shared_memory(name: str) -> Tuple[Any, Any]:
+    """
+    Map a tabular dataset in shared memory as an Arrow table, without copying it.
+
+    The table's buffers point into the shared memory segment, so the segment must stay open for as long as the
+    table, or any array or zero-copy DataFrame derived from it, is in use. Close the segment only after deleting them.
+
+    :param name: Name of the shared memory segment, written by `dataset_to_shared_memory`
+    :returns: The `pyarrow.Table` and the `multiprocessing.shared_memory.SharedMemory` segment it refers to
+    :raises ValueError: If the segment does not hold a tabular dataset
+    """
+    try:
+        from multiprocessing import shared_memory
     except ImportError:
         raise ImportError("Shared memory requires Python 3.8+ and the multiprocessing module")
+    import pyarrow as pa
+
+    shm = shared_memory.SharedMemory(name=name)
+    payload = reader = None
+    try:
+        encoding, size = _read_header(shm)
+        if encoding != _ENCODING_ARROW:
+            raise ValueError(f"Shared memory segment '{name}' does not hold a tabular dataset")
+        payload = pa.py_buffer(shm.buf[_SHM_PAYLOAD_OFFSET : _SHM_PAYLOAD_OFFSET + size])
+        with pa.ipc.open_stream(payload) as reader:
+            table = reader.read_all()
+    except BaseException as e:
+        payload = reader = None
+        _release_exported_buffers(e)
+        shm.close()
+        raise
+    return table, shm
 
 
 def dataset_from_shared_memory(dataset_class: Type[T], name: str, size: Optional[int] = None) -> T:
     """
     Retrieve dataset from shared memory.
 
-    This function retrieves a serialized dataset from shared memory
-    and deserializes it into an instance of the specified class.
+    This function retrieves a dataset written by `dataset_to_shared_memory` and deserializes it into an instance
+    of the specified class. The returned dataset does not refer to the segment; use `table_from_shared_memory` to
+    read a tabular dataset without copying it.
 
     :param dataset_class: The dataset class to instantiate
     :param name: Name of the shared memory segment
-    :param size: Size of the dataset in bytes (optional)
+    :param size: Size of the payload in bytes; defaults to the size recorded in the segment's header
     :returns: Instantiated dataset of the specified class
+    :raises ValueError: If the segment was not written by `dataset_to_shared_memory`
     """
     try:
         from multiprocessing import shared_memory
-
-        # Access the shared memory segment
-        shm = shared_memory.SharedMemory(name=name)
-
-        # Determine the size of the data
-        if size is None:
-            # Find the null terminator if size is not specified
-            # This assumes the shared memory was filled with zeros initially
-            # and data is not binary (contains no null bytes)
-            for i in range(shm.size):
-                if shm.buf[i] == 0:
-                    size = i
-                    break
-            else:
-                size = shm.size
-
-        # Deserialize the dataset
-        data = bytes(shm.buf[:size])
-        return dataset_class.from_bytes(data)
     except ImportError:
         raise ImportError("Shared memory requires Python 3.8+ and the multiprocessing module")
+
+    shm = shared_memory.SharedMemory(name=name)
+    payload = reader = table = None
+    try:
+        encoding, recorded = _read_header(shm)
+        size = recorded if size is None else min(size, recorded)
+        if encoding == _ENCODING_ARROW:
+            import pyarrow as pa
+
+            payload = pa.py_buffer(shm.buf[_SHM_PAYLOAD_OFFSET : _SHM_PAYLOAD_OFFSET + size])
+            with pa.ipc.open_stream(payload) as reader:
+                table = reader.read_all()
+            # The dataset gets its own copy of the data, so that the segment can be closed
+            return dataset_class(table.to_pandas())
+        return dataset_class.from_bytes(bytes(shm.buf[_SHM_PAYLOAD_OFFSET : _SHM_PAYLOAD_OFFSET + size]))
+    except BaseException as e:
+        _release_exported_buffers(e)
+        raise
+    finally:
+        # Buffers exported from the segment must be released before it can be closed
+        del payload, reader, table
+        shm.close()
+
+
+def _release_exported_buffers(error: BaseException) -> None:
+    """Clear the variables of the frames an error was raised through, which may hold buffers exported from a shared
+    memory segment: the segment cannot be closed while they exist, and closing it would hide the error."""
+    traceback.clear_frames(error.__traceback__)
+
+
+def _read_header(shm: Any) -> Tuple[int, int]:
+    """Read and validate the encoding and payload size from the header of a shared memory segment."""
+    if shm.size < _SHM_PAYLOAD_OFFSET:
+        raise ValueError(f"Shared memory segment '{shm.name}' is too small to hold a dataset")
+    magic, encoding, size = _SHM_HEADER.unpack_from(shm.buf)
+    if magic != _SHM_MAGIC or encoding not in (_ENCODING_BYTES, _ENCODING_ARROW):
+        raise ValueError(f"Shared memory segment '{shm.name}' does not hold a dataset")
+    if _SHM_PAYLOAD_OFFSET + size > shm.size:
+        raise ValueError(f"Shared memory segment '{shm.name}' is truncated")
+    return encoding, size
+
+
+def _write_arrow_stream(sink: Any, table: Any) -> None:
+    import pyarrow as pa
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
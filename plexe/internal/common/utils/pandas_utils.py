@@ -17,3 +17,20 @@ def convert_dtype_to_python(dtype) -> type:
             return float
     else:
         return str
+
+
+def to_dataframe(data) -> pd.DataFrame:
+    """
+    Convert a batch of records to a Pandas DataFrame.
+
+    :param data: a DataFrame, a pyarrow Table or RecordBatch, or a list of dictionaries.
+    :return: the batch as a DataFrame with a default integer index.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.reset_index(drop=True)
+    if isinstance(data, list):
+        return pd.DataFrame.from_records(data) if data else pd.DataFrame()
+    if hasattr(data, "to_pandas"):
+        # pyarrow Table or RecordBatch
+        return data.to_pandas().reset_index(drop=True)
+    raise TypeError(f"Unsupported batch type {type(data).__name__}: expected a DataFrame, Arrow table or list of dicts")
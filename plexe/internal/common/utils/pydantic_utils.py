@@ -2,8 +2,10 @@
 This module provides utility functions for manipulating Pydantic models.
 """
 
+from functools import lru_cache
+
 from pydantic import BaseModel, create_model
-from typing import Type, List, Dict, get_type_hints
+from typing import Any, Type, List, Dict, Tuple, get_type_hints
 
 
 def merge_models(model_name: str, models: List[Type[BaseModel]]) -> Type[BaseModel]:
@@ -51,23 +53,23 @@ def map_to_basemodel(name: str, schema: dict | Type[BaseModel]) -> Type[BaseMode
     if isinstance(schema, dict):
         try:
             # Handle both Dict[str, type] and Dict[str, str] formats
-            annotated_schema = {}
+            annotated_schema = []
 
             for k, v in schema.items():
                 # If v is a string like "int", convert it to the actual type
                 if isinstance(v, str):
                     type_mapping = {"int": int, "float": float, "str": str, "bool": bool, "list": list, "dict": dict}
                     if v in type_mapping:
-                        annotated_schema[k] = (type_mapping[v], ...)
+                        annotated_schema.append((k, type_mapping[v]))
                     else:
                         raise ValueError(f"Invalid type specification: {v} for field {k}")
                 # If v is already a type, use it directly
                 elif isinstance(v, type):
-                    annotated_schema[k] = (v, ...)
+                    annotated_schema.append((k, v))
                 else:
                     raise ValueError(f"Invalid field specification for {k}: {v}")
 
-            return create_model(name, **annotated_schema)
+            return _create_cached_model(name, tuple(annotated_schema))
         except Exception as e:
             raise ValueError(f"Invalid schema definition: {e}")
 
@@ -75,6 +77,37 @@ def map_to_basemodel(name: str, schema: dict | Type[BaseModel]) -> Type[BaseMode
     raise TypeError("Schema must be a Pydantic model or a dictionary of field names to types.")
 
 
+@lru_cache(maxsize=256)
+def _create_cached_model(name: str, fields: Tuple[Tuple[str, type], ...]) -> Type[BaseModel]:
+    """
+    Create a model with the given required fields, reusing the class created for an identical signature.
+
+    Creating a pydantic model class is expensive, and schemas are converted repeatedly, for example each time
+    a model is loaded or its inference code is validated.
+    """
+    return create_model(name, **{field: (annotation, ...) for field, annotation in fields})
+
+
+def create_placeholder_record(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Create a record conforming to a schema, with each field set to its default value, or else the zero value
+    of its type (for example 0, 0.0, "" or False).
+
+    :param schema: A pydantic model defining a schema
+    :return: A dictionary with one value per field of the schema
+    """
+    record = {}
+    for name, field in schema.model_fields.items():
+        if not field.is_required():
+            record[name] = field.get_default(call_default_factory=True)
+        else:
+            try:
+                record[name] = field.annotation()
+            except Exception:
+                record[name] = None
+    return record
+
+
 def format_schema(schema: Type[BaseModel]) -> Dict[str, str]:
     """
     Format a schema model into a dictionary representation of field names and types.
@@ -3,13 +3,16 @@ This module defines the "Artifact" dataclass, a simple representation of an exte
 
 An "external artifact" is a text or binary entity that is used by a model. The canonical example is
 a blob containing the weights of a neural network. The Artifact class can be used either to point to
-a file on disk by its path, or to hold the raw text or binary data in memory itself.
+a file on disk by its path, or to hold the raw text or binary data in memory itself. Artifacts of loaded models
+are lazy: their data is only mapped into memory when it is first accessed.
 """
 
 import io
-from typing import BinaryIO, Union
+from typing import BinaryIO, Callable, Optional, Union
 from pathlib import Path
 
+from plexe.internal.models.storage.mapped import MappedFile
+
 
 class Artifact:
     """
@@ -19,16 +22,42 @@ class Artifact:
     be accessed via the 'path' attribute. When the artifact holds raw data, the 'is_data' property is true
     and the data can be accessed via the 'data' attribute. In either case, the 'type' property indicates
     whether the data (in memory or in the file) is text or binary.
+
+    When the artifact holds a loader, the 'is_lazy' property is true. The loader returns a buffer, typically a
+    memory-mapped view of a file, which is only created when the artifact's data is first accessed and can be
+    dropped again with 'release'.
     """
 
-    def __init__(self, name: str, path: Path = None, handle: BinaryIO = None, data: bytes = None):
+    def __init__(
+        self,
+        name: str,
+        path: Path = None,
+        handle: BinaryIO = None,
+        data: bytes = None,
+        loader: Callable[[], memoryview] = None,
+    ):
         self.name: str = name
         self.path: Path = path
         self.handle: BinaryIO = handle
-        self.data: bytes = data
+        self.loader: Callable[[], memoryview] = loader
+        self._data: bytes = data
+        self._buffer: Optional[memoryview] = None
+
+        if sum([path is not None, handle is not None, data is not None, loader is not None]) != 1:
+            raise ValueError("Exactly one of 'handle', 'path', 'data' or 'loader' must be provided.")
+
+    @property
+    def data(self) -> bytes:
+        """
+        The artifact's data in memory; for lazy artifacts, this copies the data out of the buffer.
+        """
+        if self._data is None and self.is_lazy():
+            return self.get_buffer().tobytes()
+        return self._data
 
-        if sum([path is not None, handle is not None, data is not None]) != 1:
-            raise ValueError("Exactly one of 'handle', 'path', or 'data' must be provided.")
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._data = value
 
     def is_path(self) -> bool:
         """
@@ -46,7 +75,34 @@ class Artifact:
         """
         True if the artifact is a string or bytes object loaded in memory.
         """
-        return self.data is not None
+        return self._data is not None
+
+    def is_lazy(self) -> bool:
+        """
+        True if the artifact's data is loaded on demand.
+        """
+        return self.loader is not None
+
+    def get_buffer(self) -> memoryview:
+        """
+        Get a read-only buffer of a lazy artifact's data, loading it on first access.
+        """
+        if not self.is_lazy():
+            raise ValueError("Only lazy artifacts have a buffer.")
+        if self._buffer is None:
+            self._buffer = self.loader()
+        return self._buffer
+
+    def release(self) -> None:
+        """
+        Drop this artifact's reference to a lazy artifact's buffer. The memory is freed once no other object, such
+        as an array created from the buffer, refers to it; the buffer is loaded again if the artifact is accessed.
+        """
+        self._buffer = None
+
+    def __getstate__(self) -> dict:
+        # Buffers of memory-mapped files cannot be pickled; they are loaded again when needed
+        return {**self.__dict__, "_buffer": None}
 
     def get_as_handle(self) -> BinaryIO:
         """
@@ -58,6 +114,8 @@ class Artifact:
             return open(self.path, "rb")
         elif self.is_data():
             return io.BytesIO(self.data)
+        elif self.is_lazy():
+            return MappedFile(self.get_buffer())
         else:
             raise ValueError("Artifact does not have a valid handle, path, or data.")
 
@@ -75,3 +133,10 @@ class Artifact:
         Create an Artifact instance from an in-memory sequence of bytes.
         """
         return Artifact(name=name, data=data)
+
+    @staticmethod
+    def from_loader(name: str, loader: Callable[[], memoryview]):
+        """
+        Create a lazy Artifact instance whose data is loaded by a function on first access.
+        """
+        return Artifact(name=name, loader=loader)
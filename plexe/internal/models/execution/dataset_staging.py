@@ -0,0 +1,203 @@
+"""
+This module stages the datasets used by training code executions, so that each dataset is written only once per build.
+
+Executors hand datasets to training scripts as files in each execution's working directory. Serializing a large
+dataset is expensive, and a build runs many executions over the same datasets, so instead of writing the files for
+every execution, each dataset is written once to a staging directory shared by the build's executions, in a file
+named by a fingerprint of the dataset's content. Executions then get a hard link to the staged file, or a symbolic
+link where hard links are not supported, under the file name the training script expects. Removing an execution's
+link leaves the staged file in place for the next execution.
+
+Datasets are staged as parquet files by default. With `config.execution.dataset_format` set to "arrow", they are
+staged as uncompressed Arrow IPC files (Feather v2) instead, which are written faster and which training scripts can
+memory-map rather than decode: concurrent executions then read the same pages of the operating system's page cache,
+so a dataset is held in memory only once however many executions use it.
+
+Staged files are made read-only, so that a script opening its dataset for writing fails instead of changing the
+data seen by every later execution. The staging directory is removed with `clear_staging` when the build ends.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, List, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from plexe.config import config
+from plexe.internal.common.datasets.interface import TabularConvertible
+
+logger = logging.getLogger(__name__)
+
+# Name of the staging directory, created in the working directory shared by a build's executions
+STAGING_DIR = ".datasets"
+
+# Suffixes of the dataset files for each staging format
+DATASET_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+_lock = threading.Lock()
+# Locks held while a dataset is being staged, so that concurrent executions write each dataset only once
+_staging: Dict[str, threading.Lock] = {}
+# Fingerprints of the datasets already seen, so that the data is hashed once per dataset object
+_fingerprints: "weakref.WeakKeyDictionary[TabularConvertible, str]" = weakref.WeakKeyDictionary()
+
+
+def dataset_fingerprint(dataset: TabularConvertible) -> str:
+    """
+    Compute a digest of a dataset's columns, types, index and values. Datasets are treated as immutable: the digest
+    of each dataset object is computed once and remembered for as long as the object exists.
+
+    :param dataset: the dataset
+    :return: a hex digest identifying the dataset's content
+    """
+    try:
+        return _fingerprints[dataset]
+    except (KeyError, TypeError):
+        pass
+
+    df = dataset.to_pandas()
+    sha = hashlib.sha256()
+    sha.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode("utf-8"))
+    sha.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for _, column in df.items():
+        try:
+            hashes = pd.util.hash_pandas_object(column, index=False)
+        except TypeError:
+            # Columns of unhashable objects, such as lists, are hashed by their text representation
+            hashes = pd.util.hash_pandas_object(column.astype(str), index=False)
+        sha.update(hashes.to_numpy().tobytes())
+    digest = sha.hexdigest()
+
+    try:
+        _fingerprints[dataset] = digest
+    except TypeError:
+        pass  # datasets that cannot be weakly referenced are hashed on every use
+    return digest
+
+
+def dataset_file_name(name: str, format: str | None = None) -> str:
+    """
+    Return the name of the file through which a dataset is passed to training scripts.
+
+    :param name: name of the dataset
+    :param format: staging format, "parquet" or "arrow"; defaults to `config.execution.dataset_format`
+    :return: the file name, relative to the execution's working directory
+    """
+    return f"{name}{_suffix(format)}"
+
+
+def stage_dataset(dataset: TabularConvertible, staging_dir: Path, format: str | None = None) -> Path:
+    """
+    Write a dataset to the staging directory, unless it is already staged.
+
+    :param dataset: the dataset
+    :param staging_dir: the staging directory
+    :param format: staging format, "parquet" or "arrow"; defaults to `config.execution.dataset_format`
+    :return: path of the staged file
+    """
+    suffix = _suffix(format)
+    fingerprint = dataset_fingerprint(dataset)
+    path = staging_dir / f"{fingerprint}{suffix}"
+    with _lock:
+        staging = _staging.setdefault(str(path), threading.Lock())
+    try:
+        with staging:
+            if path.is_file():
+                logger.debug(f"Dataset {fingerprint[:12]} is already staged at {path}")
+                return path
+            staging_dir.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                table = pa.Table.from_pandas(df=dataset.to_pandas())
+                if suffix == DATASET_FORMATS["arrow"]:
+                    # Uncompressed, so that readers can memory-map the columns instead of decompressing them
+                    feather.write_feather(table, temporary, compression="uncompressed")
+                else:
+                    pq.write_table(table, temporary)
+                os.chmod(temporary, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                os.replace(temporary, path)
+            finally:
+                temporary.unlink(missing_ok=True)
+            logger.debug(f"Staged dataset {fingerprint[:12]} at {path}")
+        return path
+    finally:
+        # Once a dataset is staged, later callers find the file without waiting, so the lock is no longer needed
+        with _lock:
+            if _staging.get(str(path)) is staging:
+                del _staging[str(path)]
+
+
+def link_dataset(staged: Path, destination: Path) -> Path:
+    """
+    Make a staged dataset available at a path, with a hard link, a symbolic link, or as a last resort a copy.
+
+    :param staged: path of the staged file
+    :param destination: path at which the dataset should appear
+    :return: the destination path
+    """
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(staged, destination)
+    except OSError:
+        try:
+            os.symlink(staged.resolve(), destination)
+        except OSError as e:
+            logger.debug(f"Cannot link {staged} to {destination}, copying it: {e}")
+            shutil.copyfile(staged, destination)
+    return destination
+
+
+def stage_datasets(
+    datasets: Dict[str, TabularConvertible], staging_dir: Path, execution_dir: Path, format: str | None = None
+) -> List[Path]:
+    """
+    Stage datasets and link them into an execution's working directory, named as given by `dataset_file_name`.
+
+    :param datasets: the datasets, by name
+    :param staging_dir: the staging directory shared by the build's executions
+    :param execution_dir: the working directory of the execution
+    :param format: staging format, "parquet" or "arrow"; defaults to `config.execution.dataset_format`
+    :return: paths of the dataset files in the execution's working directory
+    """
+    return [
+        link_dataset(stage_dataset(dataset, staging_dir, format), execution_dir / dataset_file_name(name, format))
+        for name, dataset in datasets.items()
+    ]
+
+
+def clear_staging(working_dir: Union[str, Path]) -> None:
+    """
+    Remove the datasets staged for the executions in a working directory, such as at the end of a build.
+    Links in execution directories are hard links or copies where possible, so they remain readable.
+
+    :param working_dir: the working directory shared by the build's executions
+    """
+    staging_dir = Path(working_dir).resolve() / STAGING_DIR
+    if not staging_dir.exists():
+        return
+
+    def make_writable(function, path, _):
+        # Staged files are read-only, which prevents their removal on some platforms
+        os.chmod(path, stat.S_IWUSR | stat.S_IRUSR)
+        function(path)
+
+    try:
+        shutil.rmtree(staging_dir, onerror=make_writable)
+        logger.debug(f"Removed staged datasets in {staging_dir}")
+    except OSError as e:
+        logger.warning(f"Could not remove staged datasets in {staging_dir}: {e}")
+
+
+def _suffix(format: str | None) -> str:
+    format = format or config.execution.dataset_format
+    if format not in DATASET_FORMATS:
+        raise ValueError(f"Unknown dataset format '{format}', expected one of {', '.join(DATASET_FORMATS)}")
+    return DATASET_FORMATS[format]
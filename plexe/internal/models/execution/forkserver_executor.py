@@ -0,0 +1,181 @@
+"""
+Module: ForkServerExecutor for Python Code Execution in Warm Worker Processes
+
+This module provides a `ProcessExecutor` variant that runs each script in a process forked from a warm "zygote"
+process, instead of in a freshly started interpreter. Generated training scripts spend several seconds importing
+pandas, numpy, scikit-learn and the other allowed packages before they do any work; the zygote imports them once,
+and every process forked from it starts with them already imported.
+
+The zygote is the forkserver of Python's `multiprocessing` module, started on first use with the packages in
+`config.code_generation.allowed_packages` preloaded. Each execution still runs in a separate, newly forked process,
+in its own working directory, under the same timeout, and with its standard output and error captured, so it has
+the same isolation as a `ProcessExecutor` execution. The zygote never runs generated code itself, so a script cannot
+change the state later executions start from.
+
+Usage:
+    Set `config.execution.warm_workers` to use this executor for local execution; optionally call
+    `start_warm_worker_pool` early, so that the packages are imported while other work is in progress.
+"""
+
+import importlib.util
+import logging
+import multiprocessing
+import os
+import runpy
+import subprocess
+import sys
+import threading
+import traceback
+from multiprocessing.connection import Connection
+from typing import BinaryIO, List, Optional, Tuple
+
+from plexe.config import config
+from plexe.internal.models.execution.output import PIPE_GRACE_PERIOD, OutputCapture
+from plexe.internal.models.execution.process_executor import ProcessExecutor
+
+logger = logging.getLogger(__name__)
+
+# Modules whose names differ from the names of the packages that provide them
+_MODULE_NAMES = {"scikit-learn": "sklearn", "tensorflow-cpu": "tensorflow"}
+
+_lock = threading.Lock()
+_context: Optional[multiprocessing.context.BaseContext] = None
+
+
+def is_available() -> bool:
+    """
+    Return whether warm workers are supported on this platform, which requires the forkserver start method.
+    """
+    return "forkserver" in multiprocessing.get_all_start_methods()
+
+
+def preload_modules(packages: List[str]) -> List[str]:
+    """
+    Return the names of the installed modules that provide a list of packages, in order and without duplicates.
+
+    :param packages: package names, such as those in `config.code_generation.allowed_packages`
+    :return: names of the modules to import in the zygote
+    """
+    modules = []
+    for package in packages:
+        module = _MODULE_NAMES.get(package, package.replace("-", "_"))
+        if module not in modules and importlib.util.find_spec(module) is not None:
+            modules.append(module)
+    return modules
+
+
+def start_warm_worker_pool() -> None:
+    """
+    Start the zygote process if it is not running. It imports the allowed packages in the background, so calling
+    this ahead of the first execution hides the cost of the imports.
+    """
+    _get_context()
+    from multiprocessing import forkserver
+
+    forkserver.ensure_running()
+
+
+def _get_context() -> multiprocessing.context.BaseContext:
+    """Return the forkserver context, configuring the modules it preloads on first use."""
+    global _context
+    with _lock:
+        if _context is None:
+            context = multiprocessing.get_context("forkserver")
+            # This module is preloaded too, so that forked workers do not have to import plexe to find _run_script
+            modules = [*preload_modules(config.code_generation.allowed_packages), __name__]
+            context.set_forkserver_preload(modules)
+            logger.debug(f"Warm worker zygote preloads: {', '.join(modules)}")
+            _context = context
+        return _context
+
+
+class ForkServerExecutor(ProcessExecutor):
+    """
+    Execute Python code snippets in processes forked from a zygote that has already imported the allowed packages.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the ForkServerExecutor. Takes the same arguments as `ProcessExecutor`.
+        """
+        super().__init__(*args, **kwargs)
+        self.worker: Optional[multiprocessing.process.BaseProcess] = None
+
+    def _execute(self) -> Tuple[str, str, int]:
+        """
+        Run the code file in a process forked from the zygote and wait for it to finish.
+
+        :return: the process's standard output, standard error and exit code
+        :raises subprocess.TimeoutExpired: if the process does not finish within the timeout
+        """
+        context = _get_context()
+        stdout_reader, stdout_writer = context.Pipe(duplex=False)
+        stderr_reader, stderr_writer = context.Pipe(duplex=False)
+        self.worker = context.Process(
+            target=_run_script,
+            args=(str(self.code_file), str(self.working_dir), stdout_writer, stderr_writer),
+            name=f"plexe-worker-{self.working_dir.name}",
+        )
+        try:
+            self.worker.start()
+        finally:
+            # The worker has its own copies; closing these lets the readers see the end of the output
+            stdout_writer.close()
+            stderr_writer.close()
+
+        self.output = OutputCapture(_as_file(stdout_reader), _as_file(stderr_reader), on_output=self.on_output)
+        self.worker.join(self.timeout)
+        if self.worker.exitcode is None:
+            self.worker.kill()
+            self.worker.join()
+            raise subprocess.TimeoutExpired(str(self.code_file), self.timeout)
+
+        stdout, stderr = self.output.result(PIPE_GRACE_PERIOD)
+        return stdout, stderr, self.worker.exitcode
+
+    def cleanup(self):
+        """
+        Clean up resources after execution while preserving model artifacts.
+        """
+        try:
+            if self.worker is not None and self.worker.is_alive():
+                self.worker.kill()
+        except Exception as e:
+            logger.warning(f"Error terminating worker process: {str(e)}")
+        super().cleanup()
+
+
+def _as_file(connection: Connection) -> BinaryIO:
+    """Return the read end of a pipe as a binary file, so that its output can be read line by line."""
+    try:
+        return open(os.dup(connection.fileno()), "rb")
+    finally:
+        connection.close()
+
+
+def _run_script(code_file: str, working_dir: str, stdout: Connection, stderr: Connection) -> None:
+    """Entry point of forked workers: run a script as __main__ in its working directory, capturing its output."""
+    os.chdir(working_dir)
+    os.dup2(stdout.fileno(), 1)
+    os.dup2(stderr.fileno(), 2)
+    stdout.close()
+    stderr.close()
+    sys.argv = [code_file]
+    sys.path.insert(0, working_dir)
+
+    code = 0
+    try:
+        runpy.run_path(code_file, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    sys.exit(code)
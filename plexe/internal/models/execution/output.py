@@ -0,0 +1,162 @@
+"""
+Module: Streaming Capture of Execution Output
+
+This module reads the standard output and error of running executions incrementally, on background threads, instead
+of buffering everything until the process exits. Each line is passed to an optional callback as soon as it is read,
+so that progress can be shown while a script runs, and is kept in a `BoundedOutput`, which holds only the beginning
+and the end of the output: scripts that log every training batch cannot exhaust memory, and the most useful parts of
+the output, such as the setup messages and the final metric or traceback, are kept. Since the output is read as it
+is produced, whatever was printed before a process is killed, for example on timeout, is still available.
+
+Classes:
+    - BoundedOutput: text that keeps its head and tail, dropping the middle once it grows beyond a limit.
+    - OutputCapture: reads a process's stdout and stderr pipes into bounded outputs on background threads.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Callable, Deque, List, Optional, TextIO, Tuple, Union
+
+from plexe.config import config
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the output pipes to close after a process exits, in case processes it started still hold them
+PIPE_GRACE_PERIOD = 1.0
+# Longest line read at once; longer lines, such as progress bars redrawn with carriage returns, are split
+_MAX_LINE = 64 * 1024
+
+OutputCallback = Callable[[str, str], None]
+
+
+class BoundedOutput:
+    """
+    Thread-safe text buffer that keeps the first and the last characters appended to it, up to two limits.
+    """
+
+    def __init__(self, head_chars: int, tail_chars: int):
+        """
+        :param head_chars: number of characters kept from the start of the output
+        :param tail_chars: number of characters kept from the end of the output
+        """
+        if head_chars < 0 or tail_chars < 0:
+            raise ValueError("head_chars and tail_chars must not be negative")
+        self.head_chars: int = head_chars
+        self.tail_chars: int = tail_chars
+        self.dropped: int = 0
+        self._lock = threading.Lock()
+        self._head: List[str] = []
+        self._head_size = 0
+        self._tail: Deque[str] = deque()
+        self._tail_size = 0
+
+    def append(self, text: str) -> None:
+        """
+        Add text to the end of the output, dropping characters from the middle if the output exceeds its limits.
+        """
+        with self._lock:
+            if self._head_size < self.head_chars:
+                part = text[: self.head_chars - self._head_size]
+                self._head.append(part)
+                self._head_size += len(part)
+                text = text[len(part) :]
+            if not text:
+                return
+            self._tail.append(text)
+            self._tail_size += len(text)
+            while self._tail_size > self.tail_chars:
+                excess = self._tail_size - self.tail_chars
+                if len(self._tail[0]) <= excess:
+                    excess = len(self._tail.popleft())
+                else:
+                    self._tail[0] = self._tail[0][excess:]
+                self._tail_size -= excess
+                self.dropped += excess
+
+    def text(self) -> str:
+        """
+        Return the output kept, with a marker where characters were dropped.
+        """
+        with self._lock:
+            marker = f"\n[... {self.dropped} characters omitted ...]\n" if self.dropped else ""
+            return "".join(self._head) + marker + "".join(self._tail)
+
+
+class OutputCapture:
+    """
+    Reads the stdout and stderr pipes of a process on background threads, as the process writes to them.
+    """
+
+    def __init__(
+        self,
+        stdout: Union[TextIO, BinaryIO],
+        stderr: Union[TextIO, BinaryIO],
+        on_output: Optional[OutputCallback] = None,
+        head_chars: Optional[int] = None,
+        tail_chars: Optional[int] = None,
+    ):
+        """
+        Start reading the pipes. Each pipe is closed once it has been read to its end.
+
+        :param stdout: the process's standard output, in text or binary mode; binary output is decoded as UTF-8
+        :param stderr: the process's standard error, in text or binary mode
+        :param on_output: function called with the stream name, "stdout" or "stderr", and each line as it is read
+        :param head_chars: characters kept from the start of each stream; defaults to
+            `config.execution.output_head_chars`
+        :param tail_chars: characters kept from the end of each stream; defaults to
+            `config.execution.output_tail_chars`
+        """
+        head_chars = config.execution.output_head_chars if head_chars is None else head_chars
+        tail_chars = config.execution.output_tail_chars if tail_chars is None else tail_chars
+        self.stdout: BoundedOutput = BoundedOutput(head_chars, tail_chars)
+        self.stderr: BoundedOutput = BoundedOutput(head_chars, tail_chars)
+        self._on_output = on_output
+        self._threads = [
+            threading.Thread(target=self._read, args=(stdout, self.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._read, args=(stderr, self.stderr, "stderr"), daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until both pipes have been read to their end.
+
+        :param timeout: maximum time to wait in seconds, shared by both pipes, or None to wait indefinitely
+        :return: True if both pipes were read to their end
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self._threads)
+
+    def result(self, timeout: Optional[float] = PIPE_GRACE_PERIOD) -> Tuple[str, str]:
+        """
+        Return the output captured, waiting up to a timeout for the pipes to close.
+
+        :param timeout: maximum time to wait in seconds, or None to wait indefinitely
+        :return: the captured standard output and standard error
+        """
+        self.wait(timeout)
+        return self.stdout.text(), self.stderr.text()
+
+    def _read(self, stream: Union[TextIO, BinaryIO], output: BoundedOutput, name: str) -> None:
+        try:
+            while line := stream.readline(_MAX_LINE):
+                if isinstance(line, bytes):
+                    line = line.decode("utf-8", errors="replace")
+                output.append(line)
+                if self._on_output is not None:
+                    try:
+                        self._on_output(name, line)
+                    except Exception as e:
+                        logger.debug(f"Error in execution output callback: {e}")
+        except (OSError, ValueError) as e:
+            logger.debug(f"Error reading execution {name}: {e}")
+        finally:
+            try:
+                stream.close()
+            except OSError:
+                pass
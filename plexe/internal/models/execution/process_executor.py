@@ -3,7 +3,8 @@ Module: ProcessExecutor for Isolated Python Code Execution
 
 This module provides an implementation of the `Executor` interface for executing Python code snippets
 in an isolated process. It captures stdout, stderr, exceptions, and stack traces, and enforces
-timeout limits on execution.
+timeout limits on execution. Output is read as the process writes it, forwarded line by line to an optional
+callback, and bounded to its head and tail, so that it is kept even when the process is killed on timeout.
 
 Classes:
     - RedirectQueue: A helper class to redirect stdout and stderr to a multiprocessing Queue.
@@ -22,14 +23,14 @@ import logging
 import subprocess
 import sys
 import time
-import pyarrow.parquet as pq
-import pyarrow as pa
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from plexe.internal.common.datasets.interface import TabularConvertible
 from plexe.internal.common.utils.response import extract_performance
+from plexe.internal.models.execution.dataset_staging import STAGING_DIR, stage_datasets
 from plexe.internal.models.execution.executor import ExecutionResult, Executor
+from plexe.internal.models.execution.output import PIPE_GRACE_PERIOD, OutputCallback, OutputCapture
 from plexe.config import config
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,7 @@ class ProcessExecutor(Executor):
         datasets: Dict[str, TabularConvertible],
         timeout: int,
         code_execution_file_name: str = config.execution.runfile_name,
+        on_output: Optional[OutputCallback] = None,
     ):
         """
         Initialize the ProcessExecutor.
@@ -62,8 +64,12 @@ class ProcessExecutor(Executor):
             datasets (Dict[str, TabularConvertible]): Datasets to be used for execution.
             timeout (int): The maximum allowed execution time in seconds.
             code_execution_file_name (str): The filename to use for the executed script.
+            on_output (OutputCallback): Optional function called with the stream name, "stdout" or "stderr",
+                and each line of output as the process writes it.
         """
         super().__init__(code, timeout)
+        # Datasets are staged once in the shared working directory and linked into each execution's directory
+        self.staging_dir = Path(working_dir).resolve() / STAGING_DIR
         # Create a unique working directory for this execution
         self.working_dir = Path(working_dir).resolve() / execution_id
         self.working_dir.mkdir(parents=True, exist_ok=True)
@@ -74,6 +80,9 @@ class ProcessExecutor(Executor):
         self.dataset_files = []
         self.code_file = None
         self.process = None
+        # Output is read while the process runs, so that it is available even if the process is killed
+        self.on_output = on_output
+        self.output: Optional[OutputCapture] = None
 
     def run(self) -> ExecutionResult:
         """Execute code in a subprocess and return results."""
@@ -87,23 +96,10 @@ class ProcessExecutor(Executor):
             with open(self.code_file, "w", encoding="utf-8") as f:
                 f.write(module_setup + self.code)
 
-            # Write datasets to files
-            self.dataset_files = []
-            for dataset_name, dataset in self.datasets.items():
-                dataset_file: Path = self.working_dir / f"{dataset_name}.parquet"
-                pq.write_table(pa.Table.from_pandas(df=dataset.to_pandas()), dataset_file)
-                self.dataset_files.append(dataset_file)
-
-            # Execute the code in a subprocess
-            self.process = subprocess.Popen(
-                [sys.executable, str(self.code_file)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(self.working_dir),
-                text=True,
-            )
+            # Link the staged datasets into the working directory, writing them only if not yet staged
+            self.dataset_files = stage_datasets(self.datasets, self.staging_dir, self.working_dir)
 
-            stdout, stderr = self.process.communicate(timeout=self.timeout)
+            stdout, stderr, returncode = self._execute()
             exec_time = time.time() - start_time
 
             # Collect all model artifacts created by the execution - not code or datasets
@@ -117,11 +113,11 @@ class ProcessExecutor(Executor):
                     if file != self.code_file and file not in self.dataset_files:
                         model_artifacts.append(str(file))
 
-            if self.process.returncode != 0:
+            if returncode != 0:
                 return ExecutionResult(
                     term_out=[stdout],
                     exec_time=exec_time,
-                    exception=RuntimeError(f"Process exited with code {self.process.returncode}: {stderr}"),
+                    exception=RuntimeError(f"Process exited with code {returncode}: {stderr}"),
                     model_artifacts=model_artifacts,
                 )
 
@@ -137,25 +133,19 @@ class ProcessExecutor(Executor):
             if self.process:
                 self.process.kill()
 
+            # Keep whatever the process printed before it was killed
+            stdout, stderr = self.output.result() if self.output else ("", "")
+            message = f"Execution exceeded {self.timeout}s timeout - individual run timeout limit reached"
             return ExecutionResult(
-                term_out=[],
+                term_out=[stdout] if stdout else [],
                 exec_time=self.timeout,
-                exception=TimeoutError(
-                    f"Execution exceeded {self.timeout}s timeout - individual run timeout limit reached"
-                ),
+                exception=TimeoutError(f"{message}: {stderr}" if stderr else message),
             )
         except Exception as e:
-            stdout, stderr = "", ""
-
             if self.process:
-                # Try to collect any output that was produced before the exception
-                try:
-                    if hasattr(self.process, "stdout") and self.process.stdout:
-                        stdout = self.process.stdout.read() or ""
-                except Exception:
-                    pass  # Best effort to get output
-
                 self.process.kill()
+            # Collect any output that was produced before the exception
+            stdout, _ = self.output.result() if self.output else ("", "")
 
             return ExecutionResult(
                 term_out=[stdout or f"Process failed with exception: {str(e)}"],
@@ -166,6 +156,30 @@ class ProcessExecutor(Executor):
             # Always clean up resources regardless of execution path
             self.cleanup()
 
+    def _execute(self) -> Tuple[str, str, int]:
+        """
+        Run the code file in a new Python interpreter and wait for it to finish.
+
+        :return: the process's standard output, standard error and exit code
+        :raises subprocess.TimeoutExpired: if the process does not finish within the timeout
+        """
+        self.process = subprocess.Popen(
+            [sys.executable, str(self.code_file)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(self.working_dir),
+            text=True,
+        )
+        self.output = OutputCapture(self.process.stdout, self.process.stderr, on_output=self.on_output)
+        try:
+            self.process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+            raise
+        stdout, stderr = self.output.result(PIPE_GRACE_PERIOD)
+        return stdout, stderr, self.process.returncode
+
     def cleanup(self):
         """
         Clean up resources after execution while preserving model artifacts.
@@ -173,7 +187,7 @@ class ProcessExecutor(Executor):
         logger.debug(f"Cleaning up resources for execution in {self.working_dir}")
 
         try:
-            # Clean up dataset files
+            # Clean up dataset links; the staged files are kept for later executions
             for dataset_file in self.dataset_files:
                 dataset_file.unlink(missing_ok=True)
 
@@ -15,13 +15,12 @@ Usage:
 import logging
 import time
 import ray
-import pyarrow.parquet as pq
-import pyarrow as pa
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from plexe.internal.common.datasets.interface import TabularConvertible
 from plexe.internal.common.utils.response import extract_performance
+from plexe.internal.models.execution.dataset_staging import STAGING_DIR, stage_datasets
 from plexe.internal.models.execution.executor import ExecutionResult, Executor
 from plexe.config import config
 
@@ -96,6 +95,7 @@ class RayExecutor(Executor):
         datasets: Dict[str, TabularConvertible],
         timeout: int,
         code_execution_file_name: str = config.execution.runfile_name,
+        on_output: Optional[Callable[[str, str], None]] = None,
     ):
         """Initialize the RayExecutor.
 
@@ -106,9 +106,12 @@ class RayExecutor(Executor):
             datasets (Dict[str, TabularConvertible]): The datasets to be used.
             timeout (int): The maximum allowed execution time in seconds.
             code_execution_file_name (str): The filename to use for the executed script.
+            on_output (Callable[[str, str], None]): Accepted for compatibility with the local executors and
+                ignored; output of Ray tasks is only available once they finish.
         """
         RayExecutor._ray_was_used = True
         super().__init__(code, timeout)
+        self.staging_dir = Path(working_dir).resolve() / STAGING_DIR
         self.working_dir = Path(working_dir).resolve() / execution_id
         self.working_dir.mkdir(parents=True, exist_ok=True)
         self.code_file_name = code_execution_file_name
@@ -129,12 +132,8 @@ class RayExecutor(Executor):
         """Execute code using Ray and return results."""
         logger.debug(f"RayExecutor is executing code with working directory: {self.working_dir}")
 
-        # Write datasets to files
-        dataset_files = []
-        for dataset_name, dataset in self.dataset.items():
-            dataset_file = self.working_dir / f"{dataset_name}.parquet"
-            pq.write_table(pa.Table.from_pandas(df=dataset.to_pandas()), dataset_file)
-            dataset_files.append(str(dataset_file))
+        # Link the staged datasets into the working directory, writing them only if not yet staged
+        dataset_files = [str(path) for path in stage_datasets(self.dataset, self.staging_dir, self.working_dir)]
 
         try:
             # Execute the code using Ray
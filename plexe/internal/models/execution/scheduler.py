@@ -0,0 +1,163 @@
+"""
+Module: ExecutionScheduler for Concurrent Execution of Candidate Solutions
+
+This module provides a scheduler that runs several code executions at once on the local machine, without Ray.
+Each execution runs in its own process, started by an `Executor`; the scheduler runs the executions' blocking calls
+on a pool of threads, and limits how many run at once so that the machine is not oversubscribed:
+
+    - by CPU: each execution is assumed to use `config.execution.cpus_per_execution` cores, so a 32-core machine
+      runs 8 executions at once with the default of 4;
+    - by memory: each running execution reserves `config.execution.memory_per_execution`, since it may not have
+      allocated its memory yet, and an execution is only started if the memory available on the machine, less the
+      reservations, is enough for another one, unless no other execution is running;
+    - and by `config.execution.max_parallel_executions`, if set.
+
+Results are returned as futures, which complete in the order the executions finish.
+
+Usage:
+    scheduler = get_scheduler()
+    futures = [scheduler.submit(executor.run) for executor in executors]
+    for future in as_completed(futures):
+        result = future.result()
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from plexe.config import config
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_scheduler: Optional["ExecutionScheduler"] = None
+
+
+def available_cpus() -> int:
+    """
+    Return the number of CPUs this process may run on.
+    """
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def available_memory() -> Optional[int]:
+    """
+    Return the memory available for new processes without swapping, in bytes, or None if it cannot be determined.
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class ExecutionScheduler:
+    """
+    Run blocking code executions concurrently, up to a limit derived from the machine's CPUs and memory.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        cpus_per_execution: Optional[int] = None,
+        memory_per_execution: Optional[int] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        :param max_concurrent: maximum number of concurrent executions; defaults to
+            `config.execution.max_parallel_executions`, or to no limit other than the CPUs and memory
+        :param cpus_per_execution: number of CPUs each execution is assumed to use; defaults to
+            `config.execution.cpus_per_execution`
+        :param memory_per_execution: memory each execution is assumed to need, in bytes; defaults to
+            `config.execution.memory_per_execution`
+        """
+        if cpus_per_execution is None:
+            cpus_per_execution = config.execution.cpus_per_execution
+        if memory_per_execution is None:
+            memory_per_execution = config.execution.memory_per_execution
+        if max_concurrent is None:
+            max_concurrent = config.execution.max_parallel_executions
+        if cpus_per_execution <= 0 or memory_per_execution <= 0:
+            raise ValueError("cpus_per_execution and memory_per_execution must be positive")
+        if max_concurrent is not None and max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        self.cpus_per_execution: int = cpus_per_execution
+        self.memory_per_execution: int = memory_per_execution
+
+        self.capacity: int = max(1, available_cpus() // self.cpus_per_execution)
+        if max_concurrent is not None:
+            self.capacity = min(self.capacity, max_concurrent)
+
+        self._condition = threading.Condition()
+        self._running = 0
+        self._pool = ThreadPoolExecutor(self.capacity, thread_name_prefix="plexe-execution")
+        logger.debug(f"Execution scheduler runs up to {self.capacity} executions at once")
+
+    @property
+    def running(self) -> int:
+        """
+        The number of executions currently running.
+        """
+        with self._condition:
+            return self._running
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule a blocking execution, such as `Executor.run`, to run as soon as resources allow.
+
+        :param fn: the function running the execution
+        :param args: positional arguments for the function
+        :param kwargs: keyword arguments for the function
+        :return: a future for the function's result
+        """
+        return self._pool.submit(self._run, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting executions, cancelling those that have not started.
+
+        :param wait: whether to wait for running executions to finish
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self._admit()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._condition.notify_all()
+
+    def _admit(self) -> None:
+        """Wait until there is enough free memory for another execution; one execution may always run."""
+        with self._condition:
+            while self._running > 0:
+                memory = available_memory()
+                # Running executions may not have allocated their memory yet, so their reservations are deducted
+                if memory is None or memory - self._running * self.memory_per_execution >= self.memory_per_execution:
+                    break
+                logger.debug(f"Waiting for memory to start an execution: {memory} bytes available")
+                # Memory is freed by executions finishing, but also by other processes, so check again periodically
+                self._condition.wait(timeout=1.0)
+            self._running += 1
+
+
+def get_scheduler() -> ExecutionScheduler:
+    """
+    Return the process-wide execution scheduler, creating it from the configuration on first use.
+    """
+    global _scheduler
+    with _lock:
+        if _scheduler is None:
+            _scheduler = ExecutionScheduler()
+        return _scheduler
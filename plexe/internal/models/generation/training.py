@@ -16,13 +16,13 @@ Classes:
 import json
 import logging
 from typing import List, Dict
-from pathlib import Path
 
 from pydantic import BaseModel
 
 from plexe.config import config, prompt_templates
 from plexe.internal.common.provider import Provider
 from plexe.internal.common.utils.response import extract_code
+from plexe.internal.models.execution.dataset_staging import dataset_file_name
 
 logger = logging.getLogger(__name__)
 
@@ -67,8 +67,9 @@ class TrainingCodeGenerator:
                     plan=plan,
                     history=self.history,
                     allowed_packages=config.code_generation.allowed_packages,
-                    training_data_files=[Path(f"{file}.parquet").as_posix() for file in train_dataset_names],
-                    validation_data_files=[Path(f"{file}.parquet").as_posix() for file in validation_dataset_names],
+                    training_data_files=[dataset_file_name(file) for file in train_dataset_names],
+                    validation_data_files=[dataset_file_name(file) for file in validation_dataset_names],
+                    dataset_format=config.execution.dataset_format,
                 ),
             )
         )
@@ -107,8 +108,9 @@ class TrainingCodeGenerator:
                         training_code=training_code,
                         review=review,
                         problems=problems,
-                        training_data_files=[Path(f"{file}.parquet").as_posix() for file in train_dataset_names],
-                        validation_data_files=[Path(f"{file}.parquet").as_posix() for file in validation_dataset_names],
+                        training_data_files=[dataset_file_name(file) for file in train_dataset_names],
+                        validation_data_files=[dataset_file_name(file) for file in validation_dataset_names],
+                        dataset_format=config.execution.dataset_format,
                         allowed_packages=config.code_generation.allowed_packages,
                     ),
                     response_format=FixResponse,
@@ -0,0 +1,201 @@
+"""
+This module defines the `MicroBatcher`, which coalesces concurrent single-record requests into batches.
+
+Requests submitted from an asyncio event loop are queued, and a background task collects them into a batch
+until either `max_batch_size` requests are waiting or the oldest request has waited `max_wait_ms`. The batch is
+then scored with a single `predict_batch` call on an executor thread, so the event loop is never blocked, and
+each caller's future is resolved with its own output. Raising `max_wait_ms` trades latency for throughput.
+Closing the batcher fails every request that is still queued, while batches already being scored complete.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests into batches and scores each batch with one call on an executor thread.
+
+    A batcher serves requests from one event loop at a time; if it is used from a new event loop, pending
+    state is reset and the batcher attaches to the new loop.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        max_concurrency: int = 1,
+    ):
+        """
+        Initialise the batcher.
+
+        :param predict_fn: function mapping a list of input records to a list of output records, in order
+        :param max_batch_size: maximum number of requests scored in one batch
+        :param max_wait_ms: maximum time the first request of a batch waits for more requests to arrive
+        :param max_concurrency: maximum number of batches scored at the same time
+        """
+        if max_batch_size <= 0 or max_concurrency <= 0 or max_wait_ms < 0:
+            raise ValueError("max_batch_size and max_concurrency must be positive, max_wait_ms non-negative")
+        self.predict_fn = predict_fn
+        self.max_batch_size: int = max_batch_size
+        self.max_wait_ms: float = max_wait_ms
+        self.max_concurrency: int = max_concurrency
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="plexe-batcher")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._collector: Optional[asyncio.Task] = None
+        # Scoring tasks are referenced until they finish, since the event loop only keeps weak references to tasks
+        self._scoring: Set[asyncio.Task] = set()
+        self._closed = False
+
+        # Counters are only updated from the event loop thread; the lock guards reads from other threads
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._batch_sizes: Dict[int, int] = {}
+
+    async def submit(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a record for scoring and wait for its output.
+
+        :param record: input record conforming to the input schema
+        :return: the output record for this input
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit a request to a closed MicroBatcher")
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._collector is None or self._collector.done():
+            self._attach(loop)
+        future = loop.create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return counters describing the batches formed so far.
+
+        :return: dictionary with request and batch counts, mean batch size and a histogram of batch sizes
+        """
+        with self._stats_lock:
+            return {
+                "requests": self._requests,
+                "batches": self._batches,
+                "failed_batches": self._failed_batches,
+                "mean_batch_size": self._requests / self._batches if self._batches else 0.0,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+            }
+
+    def close(self) -> None:
+        """
+        Stop collecting batches and shut down the executor threads. Requests that are still queued fail with
+        a `RuntimeError`; batches that are already being scored complete normally.
+        """
+        self._closed = True
+        if self._collector is not None and not self._collector.done():
+            try:
+                self._collector.get_loop().call_soon_threadsafe(self._stop, self._collector, self._queue)
+            except RuntimeError:
+                pass  # the event loop is closed, so nobody is awaiting the queued requests
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _stop(collector: asyncio.Task, queue: asyncio.Queue) -> None:
+        """Cancel the collector and fail the requests left in its queue; runs on the batcher's event loop."""
+        collector.cancel()
+        while not queue.empty():
+            MicroBatcher._fail([queue.get_nowait()])
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Fail the futures of requests that will not be scored because the batcher was closed."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("MicroBatcher was closed before the request was scored"))
+
+    def _attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the queue and the collector task to the running event loop."""
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._collector = loop.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        """Form batches from the queue, and start scoring each one as soon as a concurrency slot is free."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for a free slot first, so that requests keep accumulating while all slots are busy
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            try:
+                await self._fill(loop, batch)
+            except asyncio.CancelledError:
+                self._fail(batch)
+                raise
+            task = loop.create_task(self._score(batch))
+            self._scoring.add(task)
+            task.add_done_callback(self._scoring.discard)
+
+    async def _fill(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Add queued requests to a batch until it is full or its first request has waited `max_wait_ms`."""
+        deadline = loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _score(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Score one batch on the executor and resolve the callers' futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            with self._stats_lock:
+                self._requests += len(batch)
+                self._batches += 1
+                self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+
+            records = [record for record, _ in batch]
+            try:
+                outputs = await loop.run_in_executor(self._executor, self.predict_fn, records)
+                results = [(output, None) for output in outputs]
+            except Exception as e:
+                with self._stats_lock:
+                    self._failed_batches += 1
+                if len(batch) == 1:
+                    results = [(None, e)]
+                else:
+                    # Score records one by one, so that a single bad request does not fail the whole batch
+                    logger.debug(f"Batch of {len(batch)} failed ({e}); retrying records individually")
+                    results = [await self._score_one(loop, record) for record in records]
+
+            for (_, future), (output, error) in zip(batch, results):
+                if future.done():
+                    continue  # the caller has cancelled the request
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(output)
+        finally:
+            self._slots.release()
+
+    async def _score_one(self, loop, record: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        try:
+            return (await loop.run_in_executor(self._executor, self.predict_fn, [record]))[0], None
+        except Exception as e:
+            return None, e
@@ -0,0 +1,152 @@
+"""
+This module defines the `PredictionCache`, which memoises model outputs keyed on a canonical hash of the inputs.
+
+Entries are evicted in least-recently-used order once the cache exceeds its maximum number of entries or its
+approximate memory budget, and expire once they are older than the configured time-to-live. The cache is tied
+to a model identifier: when it is used with a different identifier, for example after the model is rebuilt or
+replaced, all entries are dropped so that stale predictions are never served.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def record_key(record: Dict[str, Any]) -> bytes:
+    """
+    Compute the canonical cache key of an input record, independent of the order of its fields.
+
+    :param record: input record
+    :return: 16-byte digest of the record
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _record_size(key: bytes, record: Dict[str, Any]) -> int:
+    """Approximate the memory held by a cache entry, in bytes."""
+    fields = sum(sys.getsizeof(name) + sys.getsizeof(value) for name, value in record.items())
+    return sys.getsizeof(key) + sys.getsizeof(record) + fields
+
+
+class PredictionCache:
+    """
+    A thread-safe LRU cache of prediction outputs with optional time-to-live and memory bounds.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialise an empty cache.
+
+        :param max_entries: maximum number of cached outputs, or None for no limit on the count
+        :param max_bytes: approximate maximum memory used by cached outputs, or None for no limit on size
+        :param ttl: seconds after which a cached output expires, or None if outputs never expire
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("At least one of max_entries and max_bytes must be set")
+        if (max_entries is not None and max_entries <= 0) or (max_bytes is not None and max_bytes <= 0):
+            raise ValueError("max_entries and max_bytes must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"TTL must be positive, got {ttl}")
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.ttl: Optional[float] = ttl
+
+        self._lock = threading.Lock()
+        # Maps each key to (output, expiry time, size); ordered from least to most recently used
+        self._entries: OrderedDict[bytes, Tuple[Dict[str, Any], float, int]] = OrderedDict()
+        self._identifier: Optional[str] = None
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_many(self, identifier: str, keys: List[bytes]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up the outputs for a list of keys.
+
+        :param identifier: identifier of the model whose outputs are requested
+        :param keys: keys computed with `record_key`
+        :return: the cached output for each key, or None where there is no live entry
+        """
+        now = time.monotonic()
+        results = []
+        with self._lock:
+            self._check_identifier(identifier)
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] < now:
+                    self._remove(key)
+                    entry = None
+                if entry is None:
+                    self._misses += 1
+                    results.append(None)
+                else:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    results.append(entry[0])
+        return results
+
+    def put_many(self, identifier: str, keys: List[bytes], outputs: List[Dict[str, Any]]) -> None:
+        """
+        Store the outputs for a list of keys, evicting the least recently used entries if over capacity.
+
+        :param identifier: identifier of the model that produced the outputs
+        :param keys: keys computed with `record_key`
+        :param outputs: output records, in the same order as the keys
+        """
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._check_identifier(identifier)
+            for key, output in zip(keys, outputs):
+                if key in self._entries:
+                    self._remove(key)
+                size = _record_size(key, output)
+                self._entries[key] = (output, expiry, size)
+                self._bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all cached outputs. Statistics are preserved.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit and miss counters and the current size of the cache.
+
+        :return: dictionary with hits, misses, hit rate, evictions, entries and approximate bytes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _check_identifier(self, identifier: str) -> None:
+        """Drop all entries if the cache is used for a different model than the one that filled it."""
+        if identifier != self._identifier:
+            self._entries.clear()
+            self._bytes = 0
+            self._identifier = identifier
+
+    def _remove(self, key: bytes) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
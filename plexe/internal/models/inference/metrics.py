@@ -0,0 +1,350 @@
+"""
+This module collects inference latency and throughput metrics for each model identifier.
+
+Every prediction path (for example `predict`, `predict_batch` or an HTTP endpoint) records its calls, errors,
+rows, in-flight requests and a latency histogram. To keep the cost on the hot path well below a microsecond,
+recording is lock-free: each thread updates its own counters, which are only combined when a snapshot is taken.
+When a thread exits, its counters are merged into a shared total, so short-lived threads, such as the one
+serving each HTTP request, do not accumulate.
+Latencies are bucketed in a fixed log-scale histogram with four buckets per doubling, whose index is computed
+with integer bit operations, so percentiles are accurate to within 25%.
+
+The metrics can be read as a dictionary with `snapshot`, rendered in the Prometheus text exposition format with
+`prometheus_text`, served over HTTP with `start_metrics_server`, or written periodically to a JSON file with
+`SnapshotWriter`.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Layout of the counters recorded for each path by each thread. A latency of n nanoseconds, with n >= 8 and
+# b = n.bit_length(), falls in bucket 4 * b + s, where s is given by the two bits following the leading bit;
+# the bucket covers [(4 + s) << (b - 3), (5 + s) << (b - 3)).
+_STARTED, _ERRORS, _ROWS, _LATENCY_NS, _BUCKETS = range(5)
+_NUM_BUCKETS = 4 * 64
+_COUNTERS_SIZE = _BUCKETS + _NUM_BUCKETS
+
+# Powers of two, from about 1µs to about 2 minutes, exported as Prometheus bucket bounds
+_EXPORTED_POWERS = range(10, 38)
+
+
+class _ThreadExit:
+    """Stored in a thread's local state, so that it is released, and its finalizer runs, when the thread exits."""
+
+
+def _bucket_upper_bound_ns(bucket: int) -> int:
+    bits, step = divmod(bucket, 4)
+    return (5 + step) << max(bits - 3, 0)
+
+
+class InferenceMetrics:
+    """
+    Latency and throughput metrics for the prediction paths of one model.
+
+    Example:
+        token = metrics.start("predict")
+        ... # score the inputs
+        metrics.finish(token, rows=1)
+    """
+
+    def __init__(self, model_id: str):
+        """
+        :param model_id: identifier of the model whose predictions are measured
+        """
+        self.model_id: str = model_id
+        self._created = time.perf_counter()
+        self._local = threading.local()
+        # Reentrant, since a finalizer retiring a thread's counters may run while the lock is held
+        self._lock = threading.RLock()
+        # Counters of live threads, keyed by thread, and the combined counters of threads that have exited
+        self._shards: Dict[threading.Thread, Dict[str, List[int]]] = {}
+        self._retired: Dict[str, List[int]] = {}
+
+    def start(self, path: str) -> Tuple[List[int], int]:
+        """
+        Record the start of a call.
+
+        :param path: name of the prediction path
+        :return: token identifying the call, to be passed to `finish` from the same thread
+        """
+        try:
+            counters = self._local.shard[path]
+        except (AttributeError, KeyError):
+            counters = self._counters(path)
+        counters[_STARTED] += 1
+        return counters, time.perf_counter_ns()
+
+    @staticmethod
+    def finish(token: Tuple[List[int], int], rows: int = 0, error: bool = False) -> None:
+        """
+        Record the end of a call.
+
+        :param token: token returned by `start`
+        :param rows: number of rows scored by the call
+        :param error: whether the call failed
+        """
+        counters, started = token
+        elapsed = (time.perf_counter_ns() - started) | 8
+        bits = elapsed.bit_length()
+        counters[_BUCKETS + (bits << 2) + ((elapsed >> (bits - 3)) & 3)] += 1
+        counters[_LATENCY_NS] += elapsed
+        if rows:
+            counters[_ROWS] += rows
+        if error:
+            counters[_ERRORS] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Combine the counters of all threads into a summary of each path.
+
+        :return: dictionary with the model identifier, in-flight calls, and per-path calls, errors, rows,
+            mean rows per second since the metrics were created, and latency percentiles in seconds
+        """
+        uptime = time.perf_counter() - self._created
+        paths = {}
+        for path, counters in sorted(self._combined().items()):
+            buckets = counters[_BUCKETS:]
+            calls = sum(buckets)
+            paths[path] = {
+                "calls": calls,
+                "errors": counters[_ERRORS],
+                "in_flight": counters[_STARTED] - calls,
+                "rows": counters[_ROWS],
+                "mean_rows_per_second_since_start": counters[_ROWS] / uptime if uptime > 0 else 0.0,
+                "latency_seconds": {
+                    "mean": counters[_LATENCY_NS] / calls / 1e9 if calls else 0.0,
+                    "p50": _percentile(buckets, 0.50),
+                    "p90": _percentile(buckets, 0.90),
+                    "p99": _percentile(buckets, 0.99),
+                },
+            }
+        return {
+            "model_id": self.model_id,
+            "timestamp": time.time(),
+            "uptime_seconds": uptime,
+            "in_flight": sum(path["in_flight"] for path in paths.values()),
+            "paths": paths,
+        }
+
+    def _counters(self, path: str) -> List[int]:
+        """Return the calling thread's counters for a path, creating them on first use."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            thread = threading.current_thread()
+            with self._lock:
+                self._shards[thread] = shard
+            self._local.exit = _ThreadExit()
+            weakref.finalize(self._local.exit, self._retire, thread)
+        counters = shard.get(path)
+        if counters is None:
+            counters = shard[path] = [0] * _COUNTERS_SIZE
+        return counters
+
+    def _retire(self, thread: threading.Thread) -> None:
+        """Fold the counters of a thread that has exited into the retired counters."""
+        with self._lock:
+            shard = self._shards.pop(thread, None)
+            if shard is not None:
+                _add_counters(self._retired, shard)
+
+    def _combined(self) -> Dict[str, List[int]]:
+        with self._lock:
+            combined = {path: list(counters) for path, counters in self._retired.items()}
+            for shard in list(self._shards.values()):
+                _add_counters(combined, shard)
+        return combined
+
+    def _prometheus_lines(self) -> Iterable[str]:
+        """Render the histogram and counters of each path as Prometheus samples."""
+        model = _escape_label(self.model_id)
+        for path, counters in sorted(self._combined().items()):
+            labels = f'model="{model}",path="{_escape_label(path)}"'
+            buckets = counters[_BUCKETS:]
+            calls = sum(buckets)
+            for power in _EXPORTED_POWERS:
+                # Buckets below index 4 * (power + 1) hold latencies under 2 ** power nanoseconds
+                cumulative = sum(buckets[: 4 * (power + 1)])
+                le = f"{2**power / 1e9:.9g}"
+                yield f'plexe_inference_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+            yield f'plexe_inference_latency_seconds_bucket{{{labels},le="+Inf"}} {calls}'
+            yield f"plexe_inference_latency_seconds_sum{{{labels}}} {counters[_LATENCY_NS] / 1e9:.9g}"
+            yield f"plexe_inference_latency_seconds_count{{{labels}}} {calls}"
+            yield f"plexe_inference_errors_total{{{labels}}} {counters[_ERRORS]}"
+            yield f"plexe_inference_rows_total{{{labels}}} {counters[_ROWS]}"
+            yield f"plexe_inference_in_flight{{{labels}}} {counters[_STARTED] - calls}"
+
+
+def _add_counters(target: Dict[str, List[int]], source: Dict[str, List[int]]) -> None:
+    for path, counters in list(source.items()):
+        existing = target.setdefault(path, [0] * _COUNTERS_SIZE)
+        for i, value in enumerate(counters):
+            existing[i] += value
+
+
+def _percentile(buckets: List[int], q: float) -> float:
+    """Estimate a latency percentile in seconds, as the upper bound of the bucket containing it."""
+    total = sum(buckets)
+    if total == 0:
+        return 0.0
+    rank, cumulative = q * total, 0
+    for i, count in enumerate(buckets):
+        cumulative += count
+        if cumulative >= rank and count:
+            return _bucket_upper_bound_ns(i) / 1e9
+    return _bucket_upper_bound_ns(len(buckets) - 1) / 1e9
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Metrics of all models in this process, keyed by model identifier
+_registry: Dict[str, InferenceMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def get_inference_metrics(model_id: str) -> InferenceMetrics:
+    """
+    Return the metrics of a model, creating them on first use.
+
+    :param model_id: the model's identifier
+    :return: the model's metrics
+    """
+    metrics = _registry.get(model_id)
+    if metrics is None:
+        with _registry_lock:
+            metrics = _registry.setdefault(model_id, InferenceMetrics(model_id))
+    return metrics
+
+
+def all_inference_metrics() -> List[InferenceMetrics]:
+    """
+    Return the metrics of every model that has been used for predictions in this process.
+    """
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def prometheus_text(metrics: Optional[Iterable[InferenceMetrics]] = None) -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    :param metrics: the metrics to render; defaults to the metrics of all models
+    :return: the metrics as Prometheus text
+    """
+    lines = [
+        "# HELP plexe_inference_latency_seconds Latency of prediction calls.",
+        "# TYPE plexe_inference_latency_seconds histogram",
+    ]
+    samples = [line for m in (metrics or all_inference_metrics()) for line in m._prometheus_lines()]
+    lines += [line for line in samples if line.startswith("plexe_inference_latency_seconds")]
+    for name, kind, description in [
+        ("plexe_inference_errors_total", "counter", "Prediction calls that failed."),
+        ("plexe_inference_rows_total", "counter", "Rows scored by prediction calls."),
+        ("plexe_inference_in_flight", "gauge", "Prediction calls in progress."),
+    ]:
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+        lines += [line for line in samples if line.startswith(name + "{")]
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve the metrics of all models in Prometheus format at `/metrics`, from a background thread.
+
+    :param port: port to listen on; 0 picks a free port
+    :param host: interface to listen on
+    :return: the running server; call its `shutdown` method to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="plexe-metrics", daemon=True).start()
+    return server
+
+
+class SnapshotWriter:
+    """
+    Periodically writes snapshots of the metrics of all models to a JSON file, from a background thread.
+
+    Each write replaces the file atomically, so readers never see a partially written snapshot.
+
+    Example:
+        with SnapshotWriter("metrics.json", interval=30):
+            serve_requests()
+    """
+
+    def __init__(self, path: str, interval: float = 60.0):
+        """
+        :param path: file to write the snapshots to
+        :param interval: seconds between snapshots
+        """
+        if interval <= 0:
+            raise ValueError(f"Snapshot interval must be positive, got {interval}")
+        self.path: str = str(path)
+        self.interval: float = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SnapshotWriter":
+        """Start writing snapshots in the background."""
+        self._thread = threading.Thread(target=self._run, name="plexe-metrics-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread, writing one final snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self) -> None:
+        """Write a snapshot of the metrics of all models now."""
+        snapshots = [metrics.snapshot() for metrics in all_inference_metrics()]
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"timestamp": time.time(), "models": snapshots}, f, indent=2)
+        os.replace(temporary, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._safe_write()
+        self._safe_write()
+
+    def _safe_write(self) -> None:
+        try:
+            self.write()
+        except Exception as e:
+            logger.warning(f"Failed to write metrics snapshot to {self.path}: {e}")
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
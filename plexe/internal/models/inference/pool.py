@@ -0,0 +1,142 @@
+"""
+This module defines the `PredictorPool`, which scores batches across several worker processes.
+
+The pool follows the "preload" model of pre-forking application servers: the model and its predictor are
+initialised once in the parent process, and the workers are then forked from it. Each worker therefore
+inherits the already-loaded artifacts through copy-on-write memory pages, instead of loading its own copy,
+and Python-heavy pre- and post-processing is no longer serialised by a single interpreter's GIL.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from typing import Any, Dict, Iterable, Iterator, List
+
+import pandas as pd
+
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.common.utils.pandas_utils import to_dataframe
+
+logger = logging.getLogger(__name__)
+
+# The model served by the pool in a worker process; set by the pool's initializer in each worker
+_pool_model = None
+
+
+def _init_worker(model) -> None:
+    """Set the model served by a worker. The model is passed by the fork itself, so it is not copied or pickled."""
+    global _pool_model
+    _pool_model = model
+
+
+def _predict_shard(shard: pd.DataFrame) -> pd.DataFrame:
+    """Score one shard of a batch in a worker process, using the model inherited from the parent."""
+    return _pool_model.predict_batch(shard)
+
+
+class PredictorPool:
+    """
+    A pool of worker processes that share a single, already-loaded model through copy-on-write memory.
+
+    Batches are split into shards, scored concurrently by the workers, and reassembled in their original
+    order. The pool requires the 'fork' start method, which is available on Linux and macOS; where it is not
+    available, batches are scored in the calling process instead.
+
+    Example:
+        with PredictorPool(plexe.load_model("model.tar.gz"), workers=32) as pool:
+            predictions = pool.predict_batch(df)
+    """
+
+    def __init__(self, model, workers: int = None, shard_size: int = 1024):
+        """
+        Start the worker processes for a model that is ready for predictions.
+
+        :param model: the `Model` whose predictor the workers share; its predictor must already be loaded
+        :param workers: number of worker processes; defaults to the number of CPUs
+        :param shard_size: maximum number of rows sent to a worker in one task
+        """
+        if model.state != ModelState.READY or model.predictor is None:
+            raise RuntimeError("The model is not ready for predictions.")
+        if shard_size <= 0:
+            raise ValueError(f"Shard size must be positive, got {shard_size}")
+
+        self.model = model
+        self.workers: int = workers or os.cpu_count() or 1
+        self.shard_size: int = shard_size
+        self._pool = None
+        self._closed = False
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("The 'fork' start method is not available; PredictorPool will score in-process")
+            return
+
+        # Workers are forked from this process, so they inherit the loaded model without copying it; the pool keeps
+        # the initializer's arguments, so that workers it re-forks to replace dead ones get the model too
+        self._pool = multiprocessing.get_context("fork").Pool(
+            processes=self.workers, initializer=_init_worker, initargs=(model,)
+        )
+        logger.debug(f"Started PredictorPool with {self.workers} workers for model {model.identifier}")
+
+    def predict_batch(self, x: pd.DataFrame | List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Score a batch across the workers.
+
+        :param x: batch of inputs, as a DataFrame, a pyarrow Table or a list of input dictionaries
+        :return: DataFrame with one row of outputs per input row, in the same order as the inputs
+        """
+        self._check_open()
+        inputs = to_dataframe(x)
+        if self._pool is None or len(inputs) <= self.shard_size:
+            return self.model.predict_batch(inputs)
+
+        # Shard evenly across the workers, but never beyond the configured maximum shard size
+        shard_size = min(self.shard_size, math.ceil(len(inputs) / self.workers))
+        shards = (inputs.iloc[start : start + shard_size] for start in range(0, len(inputs), shard_size))
+        return pd.concat(list(self._map(shards)), ignore_index=True)
+
+    def map(self, batches: Iterable[pd.DataFrame | List[Dict[str, Any]]]) -> Iterator[pd.DataFrame]:
+        """
+        Score a sequence of batches across the workers, yielding results in the order of the input batches.
+
+        Each batch is scored whole by one worker, so this is best suited to many small or medium batches.
+
+        :param batches: iterable of batches, as DataFrames, pyarrow Tables or lists of input dictionaries
+        :return: iterator over output DataFrames, one per input batch
+        """
+        self._check_open()
+        batches = (to_dataframe(batch) for batch in batches)
+        if self._pool is None:
+            return (self.model.predict_batch(batch) for batch in batches)
+        return self._map(batches)
+
+    def _map(self, shards: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Score shards in the workers, yielding the results in the order of the shards."""
+        return self._pool.imap(_predict_shard, shards)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("The predictor pool has been closed.")
+
+    def close(self) -> None:
+        """
+        Stop the worker processes once outstanding work has completed.
+        """
+        self._closed = True
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "PredictorPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            if self._pool is not None:
+                self._pool.terminate()
+        except Exception:
+            pass
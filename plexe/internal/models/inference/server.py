@@ -0,0 +1,366 @@
+"""
+This module provides a lightweight HTTP server for serving a model's predictions.
+
+The server exposes the following endpoints:
+- `POST /predict`: scores a single JSON record; concurrent requests are micro-batched via `Model.apredict`.
+- `POST /predict_batch`: scores a batch sent as JSON lines, a JSON array, or an Arrow IPC stream, and
+  responds in the same format.
+- `GET /healthz`: readiness probe, which only reports ready once the serving process has been warmed up.
+- `GET /metrics`: inference metrics in the Prometheus text format. With several workers, each scrape is answered
+  by one worker with its own metrics.
+
+Like pre-forking application servers, the model is loaded and warmed up once in a parent process, which then
+forks the worker processes; the workers share the loaded artifacts through copy-on-write memory and accept
+connections from the same listening socket. Under overload, requests are rejected immediately with 429 once
+the number of in-flight requests reaches its limit, rather than being queued without bound.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.common.utils.pydantic_utils import create_placeholder_record
+from plexe.internal.models.inference.metrics import SnapshotWriter, get_inference_metrics, prometheus_text
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+JSON_LINES = ("application/x-ndjson", "application/jsonl", "application/json-lines")
+JSON = "application/json"
+
+
+class ModelServer:
+    """
+    Serves a loaded model over HTTP, optionally across several pre-forked worker processes.
+
+    Example:
+        server = ModelServer(plexe.load_model("model.tar.gz"), port=8000, workers=4)
+        server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        model,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 1,
+        max_inflight_requests: int = 256,
+        max_request_bytes: int = 16 * 1024 * 1024,
+        request_timeout: float = 30.0,
+        metrics_file: Optional[str] = None,
+        metrics_interval: float = 60.0,
+    ):
+        """
+        Bind the listening socket for a model that is ready for predictions.
+
+        :param model: the `Model` to serve
+        :param host: interface to listen on
+        :param port: port to listen on; 0 picks a free port
+        :param workers: number of worker processes; with 1, requests are served from the current process
+        :param max_inflight_requests: requests accepted concurrently by each worker before shedding load with 429
+        :param max_request_bytes: largest accepted request body; larger requests are rejected with 413
+        :param request_timeout: seconds a single-record request may wait for its prediction before a 503
+        :param metrics_file: JSON file to which metrics snapshots are written periodically; with several
+            workers, each worker writes its own file, suffixed with its process ID
+        :param metrics_interval: seconds between metrics snapshots
+        """
+        if model.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+
+        self.model = model
+        self.workers: int = max(1, workers)
+        self.max_inflight_requests: int = max_inflight_requests
+        self.max_request_bytes: int = max_request_bytes
+        self.request_timeout: float = request_timeout
+        self.metrics = get_inference_metrics(model.identifier)
+        self.metrics_file: Optional[str] = metrics_file
+        self.metrics_interval: float = metrics_interval
+
+        self.ready = threading.Event()
+        self._slots = threading.BoundedSemaphore(max_inflight_requests)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._processes: List[multiprocessing.Process] = []
+        self._stopping = False
+        # With several workers, this process only supervises them and never runs the HTTP server's serve_forever
+        self._supervisor = self.workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+
+        self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.model_server = self
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The (host, port) the server is listening on."""
+        return self.httpd.server_address[:2]
+
+    def serve_forever(self) -> None:
+        """
+        Warm up the model, then serve requests until the process is interrupted or `shutdown` is called.
+        """
+        # Warming up before forking means that every worker inherits the warmed-up state
+        try:
+            self.model.warmup()
+        except Exception as e:
+            logger.warning(f"Model warm-up failed, serving anyway: {e}")
+        if self._supervisor:
+            self._supervise()
+        else:
+            self._serve_worker()
+
+    def shutdown(self) -> None:
+        """
+        Stop serving requests. Must be called from a thread other than the one running `serve_forever`.
+        """
+        if self._supervisor:
+            # The supervisor loop exits once it sees the workers have been stopped
+            self._stop_workers()
+            self.httpd.server_close()
+            return
+        self._stopping = True
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), self._loop).result(timeout=10)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _supervise(self) -> None:
+        """Fork the worker processes and replace any worker that exits unexpectedly."""
+        context = multiprocessing.get_context("fork")
+        # Signal handlers can only be installed from the main thread, e.g. when run from the CLI
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if in_main_thread:
+            previous_handler = signal.signal(signal.SIGTERM, lambda *_: self._stop_workers())
+
+        def spawn(index: int) -> multiprocessing.Process:
+            process = context.Process(target=self._run_worker, name=f"plexe-server-{index}", daemon=True)
+            process.start()
+            return process
+
+        try:
+            self._processes = [spawn(i) for i in range(self.workers)]
+            logger.info(f"Serving on http://{self.address[0]}:{self.address[1]} with {self.workers} workers")
+            while not self._stopping:
+                multiprocessing.connection.wait([p.sentinel for p in self._processes], timeout=1.0)
+                for i, process in enumerate(self._processes):
+                    if not process.is_alive() and not self._stopping:
+                        logger.warning(f"Worker {process.name} exited with code {process.exitcode}; restarting")
+                        self._processes[i] = spawn(i)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stop_workers()
+            if in_main_thread:
+                signal.signal(signal.SIGTERM, previous_handler)
+            self.httpd.server_close()
+
+    def _stop_workers(self) -> None:
+        self._stopping = True
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout=10)
+
+    def _run_worker(self) -> None:
+        """Entry point of a forked worker process."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles interrupts and stops the workers
+        self._processes = []
+        self._supervisor = False
+        self._serve_worker()
+
+    def _serve_worker(self) -> None:
+        """Serve requests from the current process; run in each worker after it has been forked."""
+        # Threads do not survive a fork, so each worker starts its own event loop for micro-batching
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="plexe-server-loop", daemon=True).start()
+        threading.Thread(target=self._mark_ready, name="plexe-server-warmup", daemon=True).start()
+        if self.metrics_file is not None:
+            path = self.metrics_file if self.workers == 1 else f"{self.metrics_file}.{os.getpid()}"
+            SnapshotWriter(path, self.metrics_interval).start()
+        if self.workers == 1:
+            logger.info(f"Serving on http://{self.address[0]}:{self.address[1]}")
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    def _mark_ready(self) -> None:
+        """Send one request through the micro-batching path of this process, then report readiness."""
+        record = (self.model.input_sample or [create_placeholder_record(self.model.input_schema)])[0]
+        try:
+            asyncio.run_coroutine_threadsafe(self.model.apredict(record), self._loop).result(self.request_timeout)
+        except Exception as e:
+            logger.warning(f"Warm-up request failed, serving anyway: {e}")
+        self.ready.set()
+
+    def predict_one(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Score one record through the micro-batcher running on this process's event loop."""
+        future = asyncio.run_coroutine_threadsafe(self.model.apredict(record), self._loop)
+        try:
+            return future.result(timeout=self.request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handles the HTTP endpoints of a `ModelServer`."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "plexe"
+
+    @property
+    def app(self) -> ModelServer:
+        return self.server.model_server
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            body = prometheus_text().encode()
+            return self._send(HTTPStatus.OK, body, "text/plain; version=0.0.4")
+        if self.path != "/healthz":
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint {self.path}"})
+        if self.app.ready.is_set():
+            return self._send_json(HTTPStatus.OK, {"status": "ready"})
+        return self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"status": "warming_up"})
+
+    def do_POST(self) -> None:
+        if self.path not in ("/predict", "/predict_batch"):
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint {self.path}"})
+        # Requests are measured per endpoint, e.g. as 'serve_predict', including rejected requests
+        path = f"serve_{self.path[1:]}"
+        started = self.app.metrics.start(path)
+        rows = 0
+        try:
+            rows = self._handle_post()
+        finally:
+            self.app.metrics.finish(started, rows=rows or 0, error=rows is None)
+
+    def _handle_post(self) -> Optional[int]:
+        """Handle a prediction request, returning the number of rows scored, or None if the request failed."""
+        if not self.app.ready.is_set():
+            self.close_connection = True
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Model is warming up"})
+            return None
+
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self._send_json(HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length is required"})
+            return None
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Content-Length must be a non-negative integer"})
+            return None
+        if length > self.app.max_request_bytes:
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            self._send_json(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                {"error": f"Request body exceeds {self.app.max_request_bytes} bytes"},
+            )
+            return None
+
+        if not self.app._slots.acquire(blocking=False):
+            self.close_connection = True
+            self._send_json(
+                HTTPStatus.TOO_MANY_REQUESTS, {"error": "Server is overloaded"}, headers={"Retry-After": "1"}
+            )
+            return None
+        try:
+            body = self.rfile.read(length)
+            if self.path == "/predict":
+                return self._predict(body)
+            return self._predict_batch(body)
+        except FutureTimeoutError:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Prediction timed out"})
+        except (ValueError, TypeError, pa.ArrowInvalid) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid request: {e}"})
+        except Exception as e:
+            logger.debug(f"Prediction failed: {e}", exc_info=True)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+        finally:
+            self.app._slots.release()
+        return None
+
+    def _predict(self, body: bytes) -> int:
+        record = json.loads(body)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        self._send_json(HTTPStatus.OK, self.app.predict_one(record))
+        return 1
+
+    def _predict_batch(self, body: bytes) -> int:
+        content_type = self.headers.get_content_type()
+        if content_type == ARROW_STREAM:
+            outputs = self.app.model.predict_batch(pa.ipc.open_stream(body).read_all())
+            sink = pa.BufferOutputStream()
+            table = pa.Table.from_pandas(outputs, preserve_index=False)
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            self._send(HTTPStatus.OK, sink.getvalue().to_pybytes(), ARROW_STREAM)
+            return len(outputs)
+
+        if content_type in JSON_LINES:
+            records = [json.loads(line) for line in body.splitlines() if line.strip()]
+            outputs = self.app.model.predict_batch(records)
+            self._send(HTTPStatus.OK, outputs.to_json(orient="records", lines=True).encode(), content_type)
+            return len(outputs)
+
+        records = json.loads(body)
+        if not isinstance(records, list):
+            raise ValueError("expected a JSON array of records")
+        outputs = self.app.model.predict_batch(records)
+        self._send(HTTPStatus.OK, outputs.to_json(orient="records").encode(), JSON)
+        return len(outputs)
+
+    def _send_json(self, status: HTTPStatus, payload: Any, headers: Dict[str, str] = None) -> None:
+        self._send(status, json.dumps(payload, default=_to_json_native).encode(), JSON, headers)
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, headers: Dict[str, str] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def _to_json_native(value: Any) -> Any:
+    """Convert numpy and pandas scalars, which the json module cannot encode, to native Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel the tasks on the running event loop, such as the micro-batcher's collector, and wait for them."""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
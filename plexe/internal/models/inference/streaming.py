@@ -0,0 +1,293 @@
+"""
+This module provides streaming batch inference over datasets that do not fit in memory.
+
+Input batches are read on a background thread, scored on the calling thread, and optionally written to an
+output file on a second background thread, so that reading, prediction and writing overlap. Each stage hands
+batches to the next through a bounded queue, which keeps memory usage flat regardless of the size of the input.
+
+Column types come from the model's schemas where they are known, rather than being inferred from whichever
+rows happen to be read or written first: a CSV column whose first block looks like integers is still read as
+a float column if the schema says so, and every batch of the output file has the same types.
+"""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+from types import UnionType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from plexe.internal.common.utils.pandas_utils import to_dataframe
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()
+
+_ARROW_TYPES = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_()}
+
+
+class _Failure:
+    """Carries an exception raised on a pipeline thread over to the consuming thread."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def arrow_types(schema: Type[BaseModel]) -> Dict[str, pa.DataType]:
+    """
+    Map the fields of a schema to Arrow types. Fields without a fixed Arrow equivalent, such as lists and
+    dictionaries, are left out, so that their type is inferred from the data.
+
+    :param schema: a pydantic model defining a schema
+    :return: dictionary of field names to Arrow types
+    """
+    types = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        # Optional[X] is stored as a nullable X
+        if get_origin(annotation) in (Union, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = args[0] if len(args) == 1 else annotation
+        if annotation in _ARROW_TYPES:
+            types[name] = _ARROW_TYPES[annotation]
+    return types
+
+
+def iter_input_batches(
+    source,
+    batch_size: int,
+    columns: Optional[List[str]] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a data source in DataFrame batches of at most `batch_size` rows.
+
+    :param source: path to a parquet or CSV file, a pyarrow Table, a DataFrame, or an iterable of DataFrames,
+        Arrow record batches or lists of records
+    :param batch_size: maximum number of rows per batch
+    :param columns: columns to read from files and Arrow tables; other columns are never loaded
+    :param column_types: types of CSV columns, which are otherwise inferred from the first block of the file
+    :return: iterator over DataFrame batches
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+
+    if isinstance(source, (str, Path)):
+        for table in _rebatch(_iter_file_record_batches(Path(source), columns, column_types), batch_size):
+            yield table.to_pandas()
+    elif isinstance(source, pa.Table):
+        table = source.select(columns) if columns else source
+        for batch in _rebatch(table.to_batches(), batch_size):
+            yield batch.to_pandas()
+    elif isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), batch_size):
+            yield source.iloc[start : start + batch_size].reset_index(drop=True)
+    else:
+        # An iterable of batches: batch boundaries are chosen by the caller
+        for batch in source:
+            yield to_dataframe(batch)
+
+
+def _iter_file_record_batches(
+    path: Path, columns: Optional[List[str]], column_types: Optional[Dict[str, pa.DataType]]
+) -> Iterator[pa.RecordBatch]:
+    """Read a parquet or CSV file incrementally as Arrow record batches."""
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        yield from pq.ParquetFile(path).iter_batches(columns=columns)
+    elif suffix == ".csv":
+        options = pa_csv.ConvertOptions(include_columns=columns or [], column_types=column_types or {})
+        reader = pa_csv.open_csv(path, convert_options=options)
+        yield from reader
+    else:
+        raise ValueError(f"Unsupported input file type '{suffix}': expected .parquet or .csv")
+
+
+def _rebatch(batches: Iterable[pa.RecordBatch], batch_size: int) -> Iterator[pa.Table]:
+    """Re-slice a stream of record batches into tables of exactly `batch_size` rows, except the last one."""
+    pending: List[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        while batch.num_rows > 0:
+            take = min(batch_size - pending_rows, batch.num_rows)
+            pending.append(batch.slice(0, take))
+            pending_rows += take
+            batch = batch.slice(take)
+            if pending_rows == batch_size:
+                yield pa.Table.from_batches(pending)
+                pending, pending_rows = [], 0
+    if pending_rows > 0:
+        yield pa.Table.from_batches(pending)
+
+
+def prefetch(items: Iterable[T], depth: int, name: str = "plexe-prefetch") -> Iterator[T]:
+    """
+    Produce items from an iterable on a background thread, at most `depth` items ahead of the consumer.
+
+    :param items: the iterable to consume in the background
+    :param depth: maximum number of items buffered between the producer and the consumer
+    :param name: name of the producer thread
+    :return: iterator over the same items, in the same order
+    """
+    buffer = queue.Queue(maxsize=max(1, depth))
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_END)
+        except BaseException as e:
+            put(_Failure(e))
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        # Unblocks the producer if the consumer stops early
+        stopped.set()
+
+
+def stream_predictions(
+    predict_fn: Callable[[pd.DataFrame], pd.DataFrame],
+    source,
+    batch_size: int,
+    columns: Optional[List[str]] = None,
+    prefetch_depth: int = 2,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Score a data source batch by batch, reading the next batches while the current one is being scored.
+
+    :param predict_fn: function mapping a batch of inputs to a batch of outputs
+    :param source: any source supported by `iter_input_batches`
+    :param batch_size: maximum number of rows per batch
+    :param columns: columns to read from files and Arrow tables
+    :param prefetch_depth: number of input batches read ahead of prediction
+    :param column_types: types of CSV columns, which are otherwise inferred from the first block of the file
+    :return: iterator over (inputs, outputs) batch pairs
+    """
+    batches = iter_input_batches(source, batch_size, columns, column_types)
+    for inputs in prefetch(batches, prefetch_depth, name="plexe-stream-reader"):
+        yield inputs, predict_fn(inputs)
+
+
+class _BatchWriter:
+    """
+    Appends DataFrame batches to a parquet or CSV file. Columns with a known type are written with that type;
+    the types of other columns are taken from the first batch.
+    """
+
+    def __init__(self, path: Path, empty_columns: List[str], column_types: Dict[str, pa.DataType]):
+        self.path = path
+        self.empty_columns = empty_columns
+        self.column_types = column_types
+        self.schema: Optional[pa.Schema] = None
+        self.writer = None
+
+        if path.suffix.lower() not in (".parquet", ".pq", ".csv"):
+            raise ValueError(f"Unsupported output file type '{path.suffix}': expected .parquet or .csv")
+
+    def write(self, batch: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(batch, preserve_index=False)
+        if self.writer is None:
+            self.schema = pa.schema([(f.name, self.column_types.get(f.name, f.type)) for f in table.schema])
+            if self.path.suffix.lower() == ".csv":
+                self.writer = pa_csv.CSVWriter(self.path, self.schema)
+            else:
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+        if table.schema != self.schema:
+            table = table.cast(self.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is None:
+            # No batches were written: still produce a valid, empty file with the expected columns
+            self.write(pd.DataFrame(columns=self.empty_columns))
+        self.writer.close()
+
+
+def write_batches(
+    batches: Iterable[pd.DataFrame],
+    path: str | Path,
+    depth: int = 2,
+    empty_columns: List[str] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+) -> int:
+    """
+    Write DataFrame batches to a parquet or CSV file on a background thread.
+
+    The output file is removed if any batch fails to be produced or written.
+
+    :param batches: the batches to write; consumed on the calling thread
+    :param path: output file path, ending in .parquet or .csv
+    :param depth: maximum number of batches buffered for the writer thread
+    :param empty_columns: columns of the output file if there are no batches
+    :param column_types: types of output columns, which are otherwise taken from the first batch
+    :return: the number of rows written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = _BatchWriter(path, empty_columns or [], column_types or {})
+    buffer = queue.Queue(maxsize=max(1, depth))
+    failures: List[BaseException] = []
+
+    def consume():
+        try:
+            while (item := buffer.get()) is not _END:
+                writer.write(item)
+            writer.close()
+        except BaseException as e:
+            failures.append(e)
+            if writer.writer is not None:
+                writer.writer.close()
+            # Keep draining so that the producer never blocks on a dead writer
+            while buffer.get() is not _END:
+                pass
+
+    thread = threading.Thread(target=consume, name="plexe-stream-writer", daemon=True)
+    thread.start()
+    rows = 0
+    try:
+        for batch in batches:
+            if failures:
+                break
+            buffer.put(batch)
+            rows += len(batch)
+    except BaseException:
+        buffer.put(_END)
+        thread.join()
+        path.unlink(missing_ok=True)
+        raise
+    buffer.put(_END)
+    thread.join()
+
+    if failures:
+        path.unlink(missing_ok=True)
+        raise failures[0]
+    return rows
@@ -3,7 +3,10 @@ This module defines the Predictor interface, which all dynamically generated inf
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
+
+import pandas as pd
+
 from plexe.internal.models.entities.artifact import Artifact
 
 
@@ -13,8 +16,14 @@ class Predictor(ABC):
 
     Every implementation of predictor must provide a mechanism for instantiating the underlying model(s)
     by reading the binary or text data from the `ModelArtifact` class.
+
+    Predictors whose `__init__` is slow can opt in to snapshots by setting `snapshot_serializer` to "pickle" or
+    "cloudpickle". A model saved with `save_model(..., snapshot=True)` then stores the initialised predictor,
+    and `load_model` restores it instead of calling `__init__`, as long as the Python and library versions match.
     """
 
+    snapshot_serializer: Optional[str] = None
+
     @abstractmethod
     def __init__(self, artifacts: List[Artifact]):
         pass
@@ -22,3 +31,14 @@ class Predictor(ABC):
     @abstractmethod
     def predict(self, inputs: dict) -> dict:
         pass
+
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Given a DataFrame whose rows conform to the input schema, return a DataFrame with one row per input
+        row, whose columns conform to the output schema.
+
+        The default implementation calls `predict` once per row, so that predictors written before the batch
+        API existed keep working. Implementations should override this with a vectorized version.
+        """
+        outputs = [self.predict(record) for record in inputs.to_dict(orient="records")]
+        return pd.DataFrame(outputs, index=range(len(outputs)))
@@ -0,0 +1,188 @@
+"""
+This module defines the `ArtifactStore`, a content-addressed store of model artifacts shared between models.
+
+Model versions often share large artifacts, such as encoders and vocabularies, and embedding a full copy in every
+saved archive wastes both disk space and save time. When a model is saved with a store, each artifact is written
+to the store once, as a blob named by the SHA-256 digest of its content, and the archive holds only a small
+manifest mapping artifact names to digests. Blobs that are already in the store are not written again, and
+artifacts of models loaded from a store are not even re-hashed, since their paths reveal their digests.
+
+Layout:
+    - blobs/<first two hex digits>/<sha256 hex digest>: artifact content, written once and never modified
+    - refs/<digest of archive path>.json: the archive saved with the store, and the blobs it references
+
+Blobs referenced by no existing archive are removed by `gc`.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class ArtifactStore:
+    """
+    A directory of artifact blobs keyed by SHA-256, with references from the archives that use them.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Open a store, creating its directory if it does not exist.
+
+        :param root: directory of the store
+        """
+        self.root: Path = Path(root).resolve()
+        self.blobs: Path = self.root / "blobs"
+        self.refs: Path = self.root / "refs"
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.refs.mkdir(parents=True, exist_ok=True)
+
+    def blob_path(self, digest: str) -> Path:
+        """
+        Return the path of the blob with a given digest.
+
+        :param digest: SHA-256 hex digest of the blob
+        """
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid blob digest: {digest}")
+        return self.blobs / digest[:2] / digest
+
+    def __contains__(self, digest: str) -> bool:
+        return self.blob_path(digest).is_file()
+
+    def put(self, source: Union[bytes, Path, BinaryIO]) -> Tuple[str, int]:
+        """
+        Add content to the store, unless a blob with the same content is already present. Content is hashed
+        before it is copied, so that content already in the store is only read, never written.
+
+        :param source: the content, as bytes, a path to a file, or a binary file-like object
+        :return: the SHA-256 hex digest and the size of the content
+        """
+        if isinstance(source, Path) and source.resolve().parent.parent == self.blobs:
+            # Artifacts loaded from this store are named by their digest
+            self._touch(source.name)
+            return source.name, source.stat().st_size
+
+        if isinstance(source, bytes):
+            digest = hashlib.sha256(source).hexdigest()
+            if not self._touch(digest):
+                self._write(digest, io.BytesIO(source))
+            return digest, len(source)
+
+        if isinstance(source, Path):
+            with open(source, "rb") as f:
+                digest, size = _hash(f)
+                if not self._touch(digest):
+                    f.seek(0)
+                    self._write(digest, f)
+            return digest, size
+
+        if source.seekable():
+            start = source.tell()
+            digest, size = _hash(source)
+            if not self._touch(digest):
+                source.seek(start)
+                self._write(digest, source)
+            return digest, size
+
+        # Streams that cannot be read twice are hashed while they are copied
+        return self._write(None, source)
+
+    def _touch(self, digest: str) -> bool:
+        """Refresh the modification time of a blob if it exists, so that gc keeps it while a save is in progress."""
+        try:
+            os.utime(self.blob_path(digest))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _write(self, digest: Optional[str], f: BinaryIO) -> Tuple[str, int]:
+        """Copy content to a blob through a temporary file, computing its digest while copying if it is not known."""
+        sha = hashlib.sha256() if digest is None else None
+        temporary = self.blobs / f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            size = 0
+            with open(temporary, "wb") as out:
+                while block := f.read(_HASH_BLOCK_SIZE):
+                    if sha is not None:
+                        sha.update(block)
+                    out.write(block)
+                    size += len(block)
+            if sha is not None:
+                digest = sha.hexdigest()
+                if self._touch(digest):
+                    return digest, size
+            self.blob_path(digest).parent.mkdir(exist_ok=True)
+            os.replace(temporary, self.blob_path(digest))
+        finally:
+            temporary.unlink(missing_ok=True)
+        return digest, size
+
+    def add_reference(self, archive: Union[str, Path], digests: Iterable[str]) -> None:
+        """
+        Record that an archive references a set of blobs, replacing any earlier record for the same archive.
+
+        :param archive: path of the archive
+        :param digests: digests of the blobs the archive references
+        """
+        archive = str(Path(archive).resolve())
+        record = {"archive": archive, "blobs": sorted(set(digests))}
+        path = self.refs / f"{hashlib.sha256(archive.encode('utf-8')).hexdigest()}.json"
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_text(json.dumps(record))
+        os.replace(temporary, path)
+
+    def gc(self, grace_period: float = 3600.0, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Remove blobs that are not referenced by any existing archive. References of archives that have been deleted
+        are removed too.
+
+        :param grace_period: seconds for which new blobs are kept even if unreferenced, so that blobs written by a
+            save that is still in progress are not removed
+        :param dry_run: whether to only report what would be removed
+        :return: dictionary with the number of removed blobs and references, and the bytes freed
+        """
+        referenced = set()
+        removed_refs = 0
+        for ref in self.refs.glob("*.json"):
+            record = json.loads(ref.read_text())
+            if Path(record["archive"]).exists():
+                referenced.update(record["blobs"])
+            else:
+                removed_refs += 1
+                if not dry_run:
+                    ref.unlink(missing_ok=True)
+
+        removed_blobs, freed = 0, 0
+        cutoff = time.time() - grace_period
+        for blob in self.blobs.glob("*/*"):
+            if blob.name in referenced or blob.name.startswith("."):
+                continue
+            stat = blob.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            removed_blobs += 1
+            freed += stat.st_size
+            if not dry_run:
+                blob.unlink(missing_ok=True)
+
+        logger.info(f"Artifact store gc removed {removed_blobs} blobs ({freed} bytes) and {removed_refs} references")
+        return {"blobs": removed_blobs, "references": removed_refs, "bytes": freed}
+
+
+def _hash(f: BinaryIO) -> Tuple[str, int]:
+    """Compute the SHA-256 hex digest and size of the rest of a file."""
+    sha, size = hashlib.sha256(), 0
+    while block := f.read(_HASH_BLOCK_SIZE):
+        sha.update(block)
+        size += len(block)
+    return sha.hexdigest(), size
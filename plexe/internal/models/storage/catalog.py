@@ -0,0 +1,263 @@
+"""
+This module defines the `ModelCatalog`, a queryable index of the models saved in a directory.
+
+Selecting a model by its metric, intent or age would otherwise mean loading every archive in the directory. The
+catalog instead keeps a SQLite index file in the directory, with one row per saved model holding the metadata
+read by `load_model(path, metadata_only=True)`. Refreshing the catalog only reads archives that were added or
+changed since the last refresh, identified by their size and modification time, so queries over thousands of
+models take milliseconds.
+
+Example:
+    catalog = ModelCatalog("models/")
+    best = catalog.find(intent="sentiment", metric="accuracy", order_by="metric", limit=1)[0]
+    model = plexe.load_model(best.path)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from plexe.fileio import INTENT, load_model
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ".plexe-catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    identifier TEXT,
+    intent TEXT,
+    state TEXT,
+    metric_name TEXT,
+    metric_value REAL,
+    created_at TEXT,
+    metadata TEXT,
+    input_schema TEXT,
+    output_schema TEXT
+);
+CREATE INDEX IF NOT EXISTS models_by_metric ON models (metric_name, metric_value);
+CREATE INDEX IF NOT EXISTS models_by_created_at ON models (created_at);
+"""
+
+_ORDERS = {"created_at": "created_at", "metric": "metric_value", "intent": "intent", "path": "path"}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """
+    A saved model, as listed in a catalog.
+    """
+
+    path: Path
+    identifier: str
+    intent: str
+    state: str
+    metric_name: Optional[str]
+    metric_value: Optional[float]
+    created_at: datetime
+    metadata: Dict[str, Any]
+    input_schema: Dict[str, str]
+    output_schema: Dict[str, str]
+
+
+class ModelCatalog:
+    """
+    An incrementally updated index of the models saved in a directory and its subdirectories.
+    """
+
+    def __init__(self, directory: Union[str, Path], refresh: bool = True):
+        """
+        Open the catalog of a directory, creating its index file if needed.
+
+        :param directory: directory containing saved models
+        :param refresh: whether to bring the index up to date with the directory immediately
+        """
+        self.directory: Path = Path(directory).resolve()
+        if not self.directory.is_dir():
+            raise ValueError(f"Not a directory: {directory}")
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.directory / INDEX_FILE, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        if refresh:
+            self.refresh()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Update the index with the models added, changed or removed since the last refresh. Only new and changed
+        archives are read, and only their metadata.
+
+        :return: dictionary with the number of models added, updated and removed
+        """
+        with self._lock:
+            known = {row[0]: (row[1], row[2]) for row in self._db.execute("SELECT path, size, mtime_ns FROM models")}
+            found = dict(self._scan())
+            counts = {"added": 0, "updated": 0, "removed": 0}
+            with self._db:
+                for path, signature in found.items():
+                    if known.get(path) == signature:
+                        continue
+                    try:
+                        model = load_model(self.directory / path, metadata_only=True)
+                    except Exception as e:
+                        logger.warning(f"Skipping {path} in model catalog, it could not be read: {e}")
+                        continue
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (path, *signature, *_row(model, signature[1])),
+                    )
+                    counts["updated" if path in known else "added"] += 1
+                removed = [(path,) for path in known if path not in found]
+                self._db.executemany("DELETE FROM models WHERE path = ?", removed)
+                counts["removed"] = len(removed)
+        if any(counts.values()):
+            logger.debug(f"Model catalog for {self.directory} refreshed: {counts}")
+        return counts
+
+    def find(
+        self,
+        intent: Optional[str] = None,
+        metric: Optional[str] = None,
+        min_metric: Optional[float] = None,
+        max_metric: Optional[float] = None,
+        state: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[CatalogEntry]:
+        """
+        Query the indexed models. The index is not refreshed; call `refresh` first to pick up new models.
+
+        :param intent: text that the model's intent must contain, ignoring case
+        :param metric: name of the metric the model must have been evaluated with
+        :param min_metric: minimum metric value, inclusive
+        :param max_metric: maximum metric value, inclusive
+        :param state: model state, such as "ready"
+        :param created_after: earliest creation time, inclusive
+        :param created_before: latest creation time, exclusive
+        :param order_by: one of "created_at", "metric", "intent" or "path"
+        :param descending: whether to sort in descending order
+        :param limit: maximum number of models to return
+        :return: the matching models
+        """
+        if order_by not in _ORDERS:
+            raise ValueError(f"Cannot order by '{order_by}', expected one of {', '.join(_ORDERS)}")
+        clauses, params = [], []
+        for clause, value in [
+            ("intent LIKE ? ESCAPE '\\'", None if intent is None else f"%{_escape_like(intent)}%"),
+            ("metric_name = ?", metric),
+            ("metric_value >= ?", min_metric),
+            ("metric_value <= ?", max_metric),
+            ("state = ?", state),
+            ("created_at >= ?", None if created_after is None else _timestamp(created_after)),
+            ("created_at < ?", None if created_before is None else _timestamp(created_before)),
+        ]:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        query = "SELECT * FROM models"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {_ORDERS[order_by]} IS NULL, {_ORDERS[order_by]} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM models").fetchone()[0]
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(self.find(order_by="path", descending=False))
+
+    def close(self) -> None:
+        """
+        Close the index file.
+        """
+        self._db.close()
+
+    def __enter__(self) -> "ModelCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _scan(self) -> Iterator[Tuple[str, Tuple[int, int]]]:
+        """Yield the relative path and (size, modification time) of every saved model under the directory."""
+        for root, directories, files in os.walk(self.directory):
+            root = Path(root)
+            # Hidden entries include the index and the temporary files of saves in progress
+            directories[:] = [d for d in directories if not d.startswith(".")]
+            for name in list(directories):
+                if (root / name / INTENT).is_file():
+                    # Directory models are rewritten as a whole, so their intent file identifies their version;
+                    # their contents, such as artifacts, are not models themselves
+                    directories.remove(name)
+                    stat = (root / name / INTENT).stat()
+                    yield (root / name).relative_to(self.directory).as_posix(), (stat.st_size, stat.st_mtime_ns)
+            for name in files:
+                if name.endswith((".tar.gz", ".plexe")) and not name.startswith("."):
+                    stat = (root / name).stat()
+                    yield (root / name).relative_to(self.directory).as_posix(), (stat.st_size, stat.st_mtime_ns)
+
+    def _entry(self, row: tuple) -> CatalogEntry:
+        path, _, _, identifier, intent, state, metric_name, metric_value, created_at, metadata, inputs, outputs = row
+        return CatalogEntry(
+            path=self.directory / path,
+            identifier=identifier,
+            intent=intent,
+            state=state,
+            metric_name=metric_name,
+            metric_value=metric_value,
+            created_at=datetime.fromisoformat(created_at),
+            metadata=json.loads(metadata),
+            input_schema=json.loads(inputs),
+            output_schema=json.loads(outputs),
+        )
+
+
+def _row(model, mtime_ns: int) -> tuple:
+    """Catalog columns of a model loaded with metadata only; models saved without a creation time use mtime."""
+    created_at = model.metadata.get("created_at") or datetime.fromtimestamp(mtime_ns / 1e9, timezone.utc).isoformat()
+    return (
+        model.identifier,
+        model.intent,
+        model.state.value,
+        model.metric.name if model.metric else None,
+        _to_float(model.metric.value) if model.metric else None,
+        _timestamp(datetime.fromisoformat(created_at)),
+        json.dumps(model.metadata, default=str),
+        json.dumps({name: f.annotation.__name__ for name, f in model.input_schema.model_fields.items()}),
+        json.dumps({name: f.annotation.__name__ for name, f in model.output_schema.model_fields.items()}),
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    """Normalise a time to a UTC ISO 8601 string, which sorts chronologically; naive times are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
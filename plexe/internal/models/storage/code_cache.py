@@ -0,0 +1,149 @@
+"""
+This module loads generated predictor code as real, importable Python modules, with cached bytecode.
+
+Executing predictor source with `exec` compiles it on every load and leaves no file behind, so tracebacks and
+profilers cannot show the code. Instead, each distinct source is written once to the code cache directory, in a
+file named by the SHA-256 digest of the source, and imported from there with the standard import machinery.
+Python caches the compiled bytecode in `__pycache__` next to the file, tagged with the interpreter version, so
+later loads of the same source in any process skip compilation; within a process, the code object is kept and
+reused. Each load still executes the code in a new module, so that models loaded from the same source never share
+module globals. The module of the latest load is the one registered in `sys.modules`.
+"""
+
+import contextlib
+import hashlib
+import importlib.util
+import linecache
+import logging
+import os
+import sys
+import threading
+import types
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.RLock()
+# Compiled code of each source loaded in this process, by module name, with the spec its modules are created from
+_compiled: Dict[str, Tuple[Optional[ModuleSpec], types.CodeType]] = {}
+
+
+def module_name(source: str) -> str:
+    """
+    Return the name under which a predictor source is registered as a module.
+
+    :param source: the predictor source code
+    :return: a module name unique to the source
+    """
+    return f"plexe_predictor_{hashlib.sha256(source.encode('utf-8')).hexdigest()[:32]}"
+
+
+def load_source_module(source: str, cache_dir: Union[str, Path, None] = None) -> types.ModuleType:
+    """
+    Import predictor source code as a new module, compiling it only if its bytecode is not already cached.
+
+    :param source: the predictor source code
+    :param cache_dir: directory for source files and bytecode; defaults to the "code" directory in
+        `config.file_storage.model_cache_dir`
+    :return: the module, registered in `sys.modules`
+    """
+    name = module_name(source)
+    with _lock:
+        if name not in _compiled:
+            _compiled[name] = _compile(name, source, cache_dir)
+        spec, code = _compiled[name]
+        if spec is not None:
+            module = importlib.util.module_from_spec(spec)
+        else:
+            module = types.ModuleType(name)
+            module.__file__ = code.co_filename
+        previous = sys.modules.get(name)
+        sys.modules[name] = module
+        try:
+            exec(code, module.__dict__)
+        except BaseException:
+            if previous is not None:
+                sys.modules[name] = previous
+            else:
+                del sys.modules[name]
+            raise
+        return module
+
+
+def defining_module(cls: type) -> Optional[types.ModuleType]:
+    """
+    Return the module that defines a class. If a later load of the same source replaced the module in
+    `sys.modules`, a module holding the namespace of the class's own module is returned instead.
+
+    :param cls: the class, such as the type of a predictor
+    :return: the module, or None if it cannot be found
+    """
+    module = sys.modules.get(cls.__module__)
+    if module is not None and getattr(module, cls.__name__, None) is cls:
+        return module
+    # The globals of the class's methods are the namespace of the module that defined it
+    for value in vars(cls).values():
+        namespace = getattr(getattr(value, "__func__", value), "__globals__", None)
+        if namespace is not None and namespace.get(cls.__name__) is cls:
+            module = types.ModuleType(cls.__module__)
+            module.__dict__.update(namespace)
+            return module
+    return None
+
+
+@contextlib.contextmanager
+def registered(module: types.ModuleType) -> Iterator[types.ModuleType]:
+    """
+    Register a module in `sys.modules` while the context is active, such as to pickle or unpickle objects of the
+    classes it defines, which are looked up there by name.
+
+    :param module: the module
+    """
+    with _lock:
+        previous = sys.modules.get(module.__name__)
+        sys.modules[module.__name__] = module
+        try:
+            yield module
+        finally:
+            if previous is not None:
+                sys.modules[module.__name__] = previous
+
+
+def _compile(name: str, source: str, cache_dir: Union[str, Path, None]) -> Tuple[Optional[ModuleSpec], types.CodeType]:
+    """Compile a source from the code cache, writing the source file and its bytecode if they are missing."""
+    if cache_dir is None:
+        # Imported here, since the file storage module imports this one
+        from plexe.fileio import _cache_dir
+
+        directory = _cache_dir() / "code"
+    else:
+        directory = Path(cache_dir).resolve()
+    path = directory / f"{name}.py"
+    try:
+        _write_source(path, source)
+    except OSError as e:
+        logger.warning(f"Cannot write predictor code to {directory}, compiling it without a cache: {e}")
+        filename = f"<{name}>"
+        # Keep the source available to tracebacks
+        linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+        return None, compile(source, filename, "exec")
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    # The loader reads the cached bytecode if it is up to date, and otherwise compiles the source and caches it
+    return spec, spec.loader.get_code(name)
+
+
+def _write_source(path: Path, source: str) -> None:
+    """Write a source file unless it already exists; rewriting it would invalidate its cached bytecode."""
+    content = source.encode("utf-8")
+    if path.is_file() and path.read_bytes() == content:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temporary.write_bytes(content)
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
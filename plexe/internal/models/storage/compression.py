@@ -0,0 +1,154 @@
+"""
+This module provides multi-threaded compression for writing model archives.
+
+`ParallelGzipWriter` compresses a stream in fixed-size blocks on a pool of threads, in the manner of pigz, and
+writes each block as a separate gzip member. Concatenated gzip members form a valid gzip file, which any gzip
+reader, including Python's `gzip` and `tarfile` modules, decompresses as one stream. `compress_chunks` does the
+same for the independently compressed chunks of `.plexe` container entries. In both cases only a bounded number
+of blocks is held in memory at once, however large the data is. zlib and pyarrow's codecs release the GIL while
+compressing, so the threads compress in parallel.
+"""
+
+import os
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Deque, Iterable, Iterator, Optional
+
+import pyarrow as pa
+
+# Number of blocks each worker may have queued or in progress before the writer waits for results
+_BLOCKS_PER_WORKER = 2
+
+_codecs = threading.local()
+
+
+def default_workers() -> int:
+    """
+    Return the default number of compression threads: one per available CPU.
+    """
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def compress_chunk(codec: str, chunk: bytes) -> bytes:
+    """
+    Compress a chunk with a pyarrow codec, using a codec instance private to the calling thread.
+
+    :param codec: name of the codec, such as "zstd" or "lz4"
+    :param chunk: data to compress
+    :return: the compressed chunk
+    """
+    instance = getattr(_codecs, codec, None)
+    if instance is None:
+        instance = pa.Codec(codec)
+        setattr(_codecs, codec, instance)
+    return instance.compress(chunk, asbytes=True)
+
+
+def compress_chunks(
+    compress: Callable[[bytes], bytes],
+    chunks: Iterable[bytes],
+    executor: Optional[ThreadPoolExecutor] = None,
+    workers: int = 1,
+) -> Iterator[bytes]:
+    """
+    Compress a sequence of chunks, in parallel if an executor is given, yielding the results in order.
+
+    :param compress: function compressing one chunk
+    :param chunks: the chunks to compress, read lazily
+    :param executor: thread pool to compress on, or None to compress on the calling thread
+    :param workers: number of threads in the executor, which bounds the number of chunks held in memory
+    :return: iterator of compressed chunks, in the order of the input chunks
+    """
+    if executor is None:
+        yield from map(compress, chunks)
+        return
+    pending: Deque[Future] = deque()
+    limit = max(workers, 1) * _BLOCKS_PER_WORKER
+    for chunk in chunks:
+        pending.append(executor.submit(compress, chunk))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class ParallelGzipWriter:
+    """
+    A write-only binary file that gzip-compresses everything written to it on multiple threads.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level: int = 6, workers: Optional[int] = None, block_size: int = 1024 * 1024):
+        """
+        :param fileobj: binary file to write the compressed stream to; it is not closed by this writer
+        :param level: gzip compression level, from 1 (fastest) to 9 (smallest)
+        :param workers: number of compression threads, or None for one per CPU
+        :param block_size: size of the independently compressed blocks, in bytes
+        """
+        if not 1 <= level <= 9:
+            raise ValueError(f"Compression level must be between 1 and 9, got {level}")
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive, got {block_size}")
+        self.level: int = level
+        self.block_size: int = block_size
+        self.workers: int = workers or default_workers()
+        self._fileobj = fileobj
+        self._buffer = bytearray()
+        self._written = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="gzip") if self.workers > 1 else None
+        self._pending: Deque[Future] = deque()
+
+    def write(self, data) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on closed file")
+        self._buffer += data
+        self._written += len(data)
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[: self.block_size]))
+            del self._buffer[: self.block_size]
+        return len(data)
+
+    def tell(self) -> int:
+        """
+        Return the number of uncompressed bytes written.
+        """
+        return self._written
+
+    def close(self) -> None:
+        """
+        Compress and write any remaining data. The underlying file is left open.
+        """
+        if self._closed:
+            return
+        try:
+            if self._buffer or not self._written:
+                # An empty stream is still written as one gzip member, so that the output is a valid gzip file
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+            self._fileobj.flush()
+        finally:
+            self._closed = True
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+
+    def _submit(self, block: bytes) -> None:
+        if self._executor is None:
+            self._fileobj.write(self._compress(block))
+            return
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) >= self.workers * _BLOCKS_PER_WORKER:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def _compress(self, block: bytes) -> bytes:
+        # wbits=31 produces a complete gzip member, with header and trailer
+        return zlib.compress(block, self.level, wbits=31)
+
+    def __enter__(self) -> "ParallelGzipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
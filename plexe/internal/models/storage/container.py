@@ -0,0 +1,384 @@
+"""
+This module implements the `.plexe` model container, an indexed archive format with random access to its entries.
+
+A tar.gz archive is a single compressed stream: reading any member means decompressing everything stored before
+it, so reading a model's intent from a multi-gigabyte archive costs as much as reading its weights. A container
+instead compresses each entry independently and records where every entry lives in a central index at the end
+of the file, so any entry can be read with one seek.
+
+Layout:
+    - 8-byte header: the magic bytes b"PLEXE" followed by a format version
+    - entry payloads, one after the other; uncompressed payloads are aligned to 64 bytes
+    - the index, a UTF-8 JSON object mapping each entry name to its offset, sizes, codec, chunks and CRC-32
+    - 24-byte footer: the offset and length of the index, followed by the magic bytes b"PLXINDEX"
+
+Compressed entries are split into independently compressed chunks, so that large files can be written and read
+without holding them in memory, and chunks can be compressed on several threads at once. Entries are compressed
+with zstd or lz4, or stored as-is; data that is already compressed, such as gzip files, zip-based formats or
+images, is always stored as-is, since compressing it again costs time without saving space.
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Union
+
+import pyarrow as pa
+
+from plexe.internal.models.storage.compression import compress_chunk, compress_chunks, default_workers
+
+MAGIC = b"PLEXE"
+VERSION = 1
+HEADER = MAGIC + struct.pack("<H", VERSION) + b"\x00"
+FOOTER_MAGIC = b"PLXINDEX"
+FOOTER = struct.Struct("<QQ8s")
+
+CODECS = ("zstd", "lz4", "none")
+
+# Uncompressed payloads are aligned so that they can be memory-mapped and viewed as arrays without copying
+ALIGNMENT = 64
+
+# File suffixes of formats that are already compressed
+COMPRESSED_SUFFIXES = {
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".lz4",
+    ".zip",
+    ".7z",
+    ".npz",
+    ".pt",
+    ".pth",
+    ".keras",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".webp",
+    ".parquet",
+}
+
+# Leading bytes of compressed formats, for data whose name does not reveal its format
+COMPRESSED_SIGNATURES = (
+    b"\x1f\x8b",  # gzip
+    b"PK\x03\x04",  # zip, and the formats based on it
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"\x04\x22\x4d\x18",  # lz4 frame
+    b"\xfd7zXZ\x00",  # xz
+    b"BZh",  # bzip2
+    b"\x89PNG",
+    b"\xff\xd8\xff",  # jpeg
+)
+
+# Compressed chunks that are not at least this much smaller than the original are stored as-is instead
+_MIN_SAVING = 0.9
+
+Source = Union[bytes, bytearray, memoryview, str, Path, BinaryIO]
+
+
+def is_container(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file is a `.plexe` container.
+
+    :param path: path to the file
+    :return: True if the file starts with the container magic bytes
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except (IsADirectoryError, FileNotFoundError):
+        return False
+
+
+def is_compressed(name: str, sample: bytes) -> bool:
+    """
+    Guess whether data is already compressed, from its name or its leading bytes.
+
+    :param name: name of the entry
+    :param sample: the first bytes of the data
+    :return: True if the data should be stored without compressing it again
+    """
+    return Path(name).suffix.lower() in COMPRESSED_SUFFIXES or sample.startswith(COMPRESSED_SIGNATURES)
+
+
+def _get_codec(codec: str) -> Optional[pa.Codec]:
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported codec '{codec}', expected one of {', '.join(CODECS)}")
+    if codec == "none":
+        return None
+    if not pa.Codec.is_available(codec):
+        raise RuntimeError(f"Codec '{codec}' is not available in this build of pyarrow")
+    return pa.Codec(codec)
+
+
+def _iter_chunks(source: Source, chunk_size: int) -> Iterator[bytes]:
+    """Yield the content of a source in chunks of at most `chunk_size` bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+        return
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from _iter_chunks(f, chunk_size)
+        return
+    while chunk := source.read(chunk_size):
+        yield chunk
+
+
+class ContainerWriter:
+    """
+    Writes entries to a new `.plexe` container. Use as a context manager, or call `close` to write the index.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        codec: str = "zstd",
+        chunk_size: int = 4 * 1024 * 1024,
+        workers: Optional[int] = None,
+    ):
+        """
+        Create the container file, replacing any existing file at the path.
+
+        :param path: path of the container
+        :param codec: default codec for entries, one of "zstd", "lz4" or "none"
+        :param chunk_size: size of the independently compressed chunks of an entry, in bytes
+        :param workers: number of threads compressing chunks in parallel, or None for one per CPU
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        _get_codec(codec)
+        self.path: Path = Path(path)
+        self.codec: str = codec
+        self.chunk_size: int = chunk_size
+        self.workers: int = workers or default_workers()
+        self._index: Dict[str, dict] = {}
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="compress") if self.workers > 1 else None
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER)
+
+    def add(self, name: str, source: Source, codec: Optional[str] = None) -> dict:
+        """
+        Add an entry to the container. Data that is already compressed is stored as-is regardless of the codec.
+        Sources are read one chunk at a time, and chunks are compressed in parallel.
+
+        :param name: name of the entry, unique within the container
+        :param source: the entry's content, as bytes, a path to a file, or a binary file-like object
+        :param codec: codec for this entry, or None to use the container's default codec
+        :return: the entry's index record
+        """
+        if name in self._index:
+            raise ValueError(f"Duplicate entry '{name}'")
+        codec = codec or self.codec
+        compressor = _get_codec(codec)
+        chunks = _iter_chunks(source, self.chunk_size)
+        first = next(chunks, b"")
+
+        if compressor is not None and first:
+            compressed = compress_chunk(codec, first)
+            if is_compressed(name, first) or len(compressed) > _MIN_SAVING * len(first):
+                compressor, codec = None, "none"
+        if compressor is None:
+            codec = "none"
+            self._file.write(b"\x00" * (-self._file.tell() % ALIGNMENT))
+
+        record = {"offset": self._file.tell(), "size": 0, "stored": 0, "codec": codec, "crc32": 0}
+        sizes: Deque[int] = deque()
+
+        def track(chunks: Iterator[bytes]) -> Iterator[bytes]:
+            # Runs on this thread as chunks are read, so sizes and checksum are computed in order
+            for chunk in chunks:
+                record["size"] += len(chunk)
+                record["crc32"] = zlib.crc32(chunk, record["crc32"])
+                sizes.append(len(chunk))
+                yield chunk
+
+        if compressor is None:
+            stored_chunks = track(_prepend(first, chunks))
+        else:
+            record["chunks"] = []
+            compress = functools.partial(compress_chunk, codec)
+            rest = compress_chunks(compress, track(chunks), self._executor, self.workers)
+            stored_chunks = itertools.chain([compressed], rest) if first else rest
+            if first:
+                sizes.append(len(first))
+                record["size"], record["crc32"] = len(first), zlib.crc32(first)
+
+        for stored in stored_chunks:
+            if compressor is not None:
+                record["chunks"].append([len(stored), sizes.popleft()])
+            self._file.write(stored)
+            record["stored"] += len(stored)
+
+        self._index[name] = record
+        return record
+
+    def close(self) -> None:
+        """
+        Write the index and footer, and close the file.
+        """
+        if self._file.closed:
+            return
+        self._shutdown()
+        index = json.dumps(self._index, separators=(",", ":")).encode("utf-8")
+        offset = self._file.tell()
+        self._file.write(index)
+        self._file.write(FOOTER.pack(offset, len(index), FOOTER_MAGIC))
+        self._file.close()
+
+    def abort(self) -> None:
+        """
+        Close and delete the partially written container.
+        """
+        self._shutdown()
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ContainerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _prepend(first: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    if first:
+        yield first
+    yield from chunks
+
+
+class ContainerReader:
+    """
+    Reads entries from a `.plexe` container. Only the index is read when the container is opened; entries are
+    read on demand, so reading one entry does not touch the bytes of any other.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a container and read its index.
+
+        :param path: path of the container
+        :raises ValueError: if the file is not a valid container
+        """
+        self.path: Path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            header = self._file.read(len(HEADER))
+            if not header.startswith(MAGIC):
+                raise ValueError(f"Not a plexe container: {path}")
+            version = struct.unpack("<H", header[len(MAGIC) : len(MAGIC) + 2])[0]
+            if version > VERSION:
+                raise ValueError(f"Container {path} has format version {version}, newer than supported {VERSION}")
+            self._file.seek(-FOOTER.size, os.SEEK_END)
+            offset, length, magic = FOOTER.unpack(self._file.read(FOOTER.size))
+            if magic != FOOTER_MAGIC:
+                raise ValueError(f"Container {path} is truncated or corrupt: missing index")
+            self._file.seek(offset)
+            self._index: Dict[str, dict] = json.loads(self._file.read(length).decode("utf-8"))
+        except Exception:
+            self._file.close()
+            raise
+
+    def names(self) -> List[str]:
+        """
+        Return the names of all entries, in the order they were written.
+        """
+        return list(self._index)
+
+    def info(self, name: str) -> dict:
+        """
+        Return the index record of an entry.
+
+        :param name: name of the entry
+        :raises KeyError: if there is no such entry
+        """
+        return self._index[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def digest(self) -> str:
+        """
+        Return a SHA-256 digest of the index, which identifies the container's content, since the index records
+        the checksum and size of every entry.
+        """
+        return hashlib.sha256(json.dumps(self._index, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def read(self, name: str, verify: bool = True) -> bytes:
+        """
+        Read and decompress an entry.
+
+        :param name: name of the entry
+        :param verify: whether to check the entry's CRC-32
+        :return: the entry's content
+        :raises KeyError: if there is no such entry
+        :raises ValueError: if the entry's content does not match its checksum
+        """
+        record = self._index[name]
+        self._file.seek(record["offset"])
+        if record["codec"] == "none":
+            data = self._file.read(record["size"])
+        else:
+            codec = _get_codec(record["codec"])
+            data = b"".join(
+                codec.decompress(self._file.read(stored), decompressed_size=size, asbytes=True)
+                for stored, size in record["chunks"]
+            )
+        if verify and zlib.crc32(data) != record["crc32"]:
+            raise ValueError(f"Entry '{name}' in {self.path} is corrupt: checksum mismatch")
+        return data
+
+    def extract(self, name: str, destination: Union[str, Path]) -> Path:
+        """
+        Decompress an entry to a file, one chunk at a time, without holding the whole entry in memory.
+
+        :param name: name of the entry
+        :param destination: path of the file to write
+        :return: the path of the written file
+        :raises ValueError: if the entry's content does not match its checksum
+        """
+        record = self._index[name]
+        codec = _get_codec(record["codec"])
+        chunks = record.get("chunks") or [[record["size"], record["size"]]]
+        crc = 0
+        self._file.seek(record["offset"])
+        with open(destination, "wb") as out:
+            for stored, size in chunks:
+                chunk = self._file.read(stored)
+                if codec is not None:
+                    chunk = codec.decompress(chunk, decompressed_size=size, asbytes=True)
+                crc = zlib.crc32(chunk, crc)
+                out.write(chunk)
+        if crc != record["crc32"]:
+            Path(destination).unlink()
+            raise ValueError(f"Entry '{name}' in {self.path} is corrupt: checksum mismatch")
+        return Path(destination)
+
+    def close(self) -> None:
+        """
+        Close the container file.
+        """
+        self._file.close()
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
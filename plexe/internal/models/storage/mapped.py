@@ -0,0 +1,97 @@
+"""
+This module provides read-only memory maps of files and of byte ranges within files, and a file-like view of them.
+
+Mapping a file instead of reading it into memory means its pages are only loaded when they are accessed, are
+shared with other processes mapping the same file, and can be dropped by the operating system under memory
+pressure. Libraries that accept buffers, such as numpy, can view the mapped bytes without copying them.
+"""
+
+import io
+import mmap
+from pathlib import Path
+from typing import Optional, Union
+
+
+def map_file(path: Union[str, Path], offset: int = 0, length: Optional[int] = None) -> memoryview:
+    """
+    Map a byte range of a file into memory, read-only.
+
+    :param path: path of the file
+    :param offset: position of the first byte of the range
+    :param length: number of bytes in the range, or None for the rest of the file
+    :return: a read-only view of the range; the mapping is released once no view of it remains
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        if length is None:
+            length = size - offset
+        if offset < 0 or length < 0 or offset + length > size:
+            raise ValueError(f"Range [{offset}, {offset + length}) is outside {path}, which is {size} bytes")
+        if length == 0:
+            return memoryview(b"")
+        # Mappings must start at a multiple of the allocation granularity
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        mapping = mmap.mmap(f.fileno(), length + offset - start, access=mmap.ACCESS_READ, offset=start)
+    return memoryview(mapping)[offset - start :]
+
+
+class MappedFile(io.RawIOBase):
+    """
+    A read-only, seekable binary file over an in-memory buffer, such as a memory-mapped file. Unlike `io.BytesIO`,
+    it does not copy the buffer; only the bytes that are read are copied.
+    """
+
+    def __init__(self, buffer: memoryview):
+        """
+        :param buffer: the bytes to read
+        """
+        super().__init__()
+        self._buffer = buffer.cast("B") if buffer.format != "B" else buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        data = self._buffer[self._position : self._position + len(b)]
+        n = len(data)
+        memoryview(b).cast("B")[:n] = data
+        self._position += n
+        return n
+
+    def readall(self) -> bytes:
+        data = self._buffer[self._position :].tobytes()
+        self._position = len(self._buffer)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def getbuffer(self) -> memoryview:
+        """
+        Return the underlying buffer, for zero-copy access, for example with `numpy.frombuffer`.
+        """
+        return self._buffer
+
+    def close(self) -> None:
+        self._buffer = memoryview(b"")
+        super().close()
@@ -0,0 +1,146 @@
+"""
+This module defines the `LoadedModelCache`, a process-wide cache of models loaded from archives.
+
+Loading a model executes its predictor source and deserializes its artifacts, which is wasteful when the same
+archive is loaded repeatedly, for example once per request path or tenant, or after every configuration reload.
+With the cache enabled, `load_model` returns the same `Model` instance for as long as the archive is unchanged.
+Entries are keyed by a digest of the archive's content plus its modification time, so a rewritten archive is
+always loaded afresh, and are evicted in least-recently-used order when the cache holds too many models or their
+estimated memory footprint exceeds the configured budget.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    model: Any
+    footprint: int
+    paths: Set[str] = field(default_factory=set)
+
+
+class LoadedModelCache:
+    """
+    A thread-safe LRU cache of loaded models, bounded by the number of models and their estimated memory footprint.
+    """
+
+    def __init__(self, max_models: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Initialise an empty cache.
+
+        :param max_models: maximum number of resident models, or None for no limit on the count
+        :param max_bytes: maximum estimated memory footprint of resident models, or None for no limit on size
+        """
+        if (max_models is not None and max_models <= 0) or (max_bytes is not None and max_bytes <= 0):
+            raise ValueError("max_models and max_bytes must be positive")
+        self.max_models: Optional[int] = max_models
+        self.max_bytes: Optional[int] = max_bytes
+
+        self._lock = threading.Lock()
+        # Ordered from least to most recently used
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Locks held while a key is being loaded, so that concurrent requests for it load the model only once
+        self._loading: Dict[str, threading.Lock] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_load(self, key: str, path: str | Path, load: Callable[[], Tuple[Any, int]]) -> Any:
+        """
+        Return the cached model for a key, loading and caching it if it is not resident.
+
+        :param key: identifies the archive's content and version
+        :param path: path the archive was loaded from, so that it can be evicted by path
+        :param load: function loading the model, returning the model and its estimated footprint in bytes
+        :return: the shared model instance
+        """
+        path = str(Path(path).resolve())
+        with self._lock:
+            entry = self._lookup(key, path)
+            if entry is not None:
+                return entry.model
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                # Another thread may have loaded the model while this one waited
+                entry = self._lookup(key, path)
+                if entry is not None:
+                    return entry.model
+                self._misses += 1
+            try:
+                model, footprint = load()
+                with self._lock:
+                    self._insert(key, _Entry(model, footprint, {path}))
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+        return model
+
+    def evict(self, path: str | Path) -> bool:
+        """
+        Drop the cached models loaded from an archive. Callers that still hold the model can keep using it.
+
+        :param path: path of the archive
+        :return: True if a model was evicted
+        """
+        path = str(Path(path).resolve())
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if path in entry.paths]
+            for key in keys:
+                self._remove(key)
+        return bool(keys)
+
+    def clear(self) -> None:
+        """
+        Drop all cached models. Statistics are preserved.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit and miss counters and the current size of the cache.
+
+        :return: dictionary with hits, misses, evictions, resident models and their estimated bytes
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "models": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _lookup(self, key: str, path: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            entry.paths.add(path)
+            self._hits += 1
+        return entry
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        if self.max_bytes is not None and entry.footprint > self.max_bytes:
+            logger.warning(f"Model of about {entry.footprint} bytes exceeds the model cache budget; not caching it")
+            return
+        self._entries[key] = entry
+        self._bytes += entry.footprint
+        while (self.max_models is not None and len(self._entries) > self.max_models) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).footprint
@@ -0,0 +1,127 @@
+"""
+This module creates and restores snapshots of fully initialised predictors.
+
+Some predictors spend seconds in `__init__` parsing artifacts, rebuilding tokenizers or fitting lookup tables,
+which delays every cold start. A predictor that opts in, by setting `snapshot_serializer`, can be serialized
+after initialisation when its model is saved, and restored from the snapshot when the model is loaded. A
+snapshot is only valid in the environment it was taken in: it is stored with a fingerprint of the Python
+version, the platform, and the versions of the packages the predictor module uses, and it is ignored, so that
+the predictor is initialised normally, when the fingerprint of the loading environment differs.
+"""
+
+import functools
+import importlib.metadata
+import inspect
+import logging
+import pickle
+import platform
+import sys
+import types
+from typing import Any, Dict, Optional, Tuple
+
+from plexe.config import is_package_available
+from plexe.internal.models.storage.code_cache import registered
+from plexe.internal.models.interfaces.predictor import Predictor
+
+logger = logging.getLogger(__name__)
+
+SERIALIZERS = ("pickle", "cloudpickle")
+
+
+def fingerprint(module: types.ModuleType) -> Dict[str, Any]:
+    """
+    Describe the environment a predictor module runs in, as far as it affects deserializing its objects.
+
+    :param module: the predictor module
+    :return: the Python implementation and version, the platform, and the versions of the packages the module uses
+    """
+    roots = {"plexe"}
+    for value in vars(module).values():
+        name = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+        if isinstance(name, str) and name != module.__name__:
+            roots.add(name.split(".")[0])
+    distributions = _packages_distributions()
+    packages = {}
+    for root in sorted(roots):
+        # Editable installs are not always listed, so a package is also looked up as a distribution of its own name
+        for distribution in distributions.get(root, [root]):
+            version = _version(distribution)
+            if version is not None:
+                packages[distribution] = version
+    return {
+        "python": f"{sys.implementation.name}-{platform.python_version()}",
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "packages": packages,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _packages_distributions() -> Dict[str, Tuple[str, ...]]:
+    """Map top-level packages to the distributions providing them; scanning the installed distributions is slow,
+    so it is done once per process."""
+    return {root: tuple(names) for root, names in importlib.metadata.packages_distributions().items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _version(distribution: str) -> Optional[str]:
+    """Return the installed version of a distribution, or None if it is not installed."""
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def create_snapshot(predictor: Predictor, module: types.ModuleType) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    """
+    Serialize an initialised predictor, if it opts in to snapshots.
+
+    :param predictor: the predictor to serialize
+    :param module: the module defining the predictor's class
+    :return: the snapshot and its environment fingerprint, or None if the predictor does not support snapshots
+    :raises ValueError: if the predictor names an unknown serializer
+    :raises RuntimeError: if cloudpickle is requested but not installed
+    """
+    serializer = getattr(predictor, "snapshot_serializer", None)
+    if serializer is None:
+        return None
+    if serializer not in SERIALIZERS:
+        raise ValueError(f"Unknown snapshot serializer '{serializer}', expected one of {', '.join(SERIALIZERS)}")
+    if serializer == "cloudpickle":
+        if not is_package_available("cloudpickle"):
+            raise RuntimeError("Predictor snapshots with cloudpickle require the cloudpickle package")
+        import cloudpickle
+
+        dumps = cloudpickle.dumps
+    else:
+        dumps = pickle.dumps
+    # Classes are pickled by reference to their module, which must be the one registered under the module's name
+    with registered(module):
+        data = dumps(predictor, protocol=pickle.HIGHEST_PROTOCOL)
+    return data, {**fingerprint(module), "serializer": serializer}
+
+
+def restore_snapshot(data: bytes, expected: Dict[str, Any], module: types.ModuleType) -> Optional[Predictor]:
+    """
+    Restore a predictor from a snapshot, if the snapshot was taken in an environment matching the current one.
+
+    :param data: the snapshot
+    :param expected: the fingerprint stored with the snapshot
+    :param module: the predictor module, which must be imported before the snapshot is restored
+    :return: the restored predictor, or None if the snapshot cannot be used and the predictor must be initialised
+    """
+    current = {**fingerprint(module), "serializer": expected.get("serializer")}
+    if current != expected:
+        changed = sorted(key for key in set(current) | set(expected) if current.get(key) != expected.get(key))
+        logger.info(f"Predictor snapshot was taken in a different environment ({', '.join(changed)}); not using it")
+        return None
+    try:
+        # Snapshots taken with cloudpickle are read by the standard unpickler
+        with registered(module):
+            predictor = pickle.loads(data)
+    except Exception as e:
+        logger.warning(f"Predictor snapshot could not be restored, initialising the predictor instead: {e}")
+        return None
+    if not isinstance(predictor, Predictor):
+        logger.warning(f"Predictor snapshot holds a {type(predictor).__name__}, not a predictor; not using it")
+        return None
+    return predictor
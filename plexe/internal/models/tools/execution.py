@@ -6,19 +6,25 @@ ensuring that artifacts generated during the execution can be retrieved later in
 """
 
 import logging
+import threading
 import uuid
-from typing import Dict, List, Callable
+from concurrent.futures import FIRST_COMPLETED, ALL_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Callable, Set
 
 from smolagents import tool
 
 from plexe.callbacks import Callback
+from plexe.config import config
 from plexe.internal.common.datasets.interface import TabularConvertible
 from plexe.internal.common.registries.objects import ObjectRegistry
 from plexe.internal.models.entities.code import Code
 from plexe.internal.models.entities.artifact import Artifact
 from plexe.internal.models.entities.metric import Metric, MetricComparator, ComparisonMethod
 from plexe.internal.models.entities.node import Node
+from plexe.internal.models.execution import forkserver_executor
 from plexe.internal.models.execution.process_executor import ProcessExecutor
+from plexe.internal.models.execution.scheduler import get_scheduler
 from typing import Type
 
 logger = logging.getLogger(__name__)
@@ -26,6 +32,9 @@ logger = logging.getLogger(__name__)
 
 def get_executor_tool(distributed: bool = False) -> Callable:
     """Get the appropriate executor tool based on the distributed flag."""
+    if _get_executor_class(distributed=distributed) is forkserver_executor.ForkServerExecutor:
+        # Import the allowed packages in the warm worker while the agent plans its first solutions
+        forkserver_executor.start_warm_worker_pool()
 
     @tool
     def execute_training_code(
@@ -51,140 +60,290 @@ def get_executor_tool(distributed: bool = False) -> Callable:
         Returns:
             A dictionary containing execution results with model artifacts and their registry names
         """
-        # Log the distributed flag
-        logger.debug(f"execute_training_code called with distributed={distributed}")
+        return _execute_training_code(
+            node_id,
+            code,
+            working_dir,
+            dataset_names,
+            timeout,
+            metric_to_optimise_name,
+            metric_to_optimise_comparison_method,
+            distributed,
+        )
 
-        from plexe.callbacks import BuildStateInfo
+    return execute_training_code
 
-        object_registry = ObjectRegistry()
 
-        execution_id = f"{node_id}-{uuid.uuid4()}"
-        try:
-            # Get actual datasets from registry
-            datasets = object_registry.get_multiple(TabularConvertible, dataset_names)
-
-            # Convert string to enum if needed
-            if "HIGHER_IS_BETTER" in metric_to_optimise_comparison_method:
-                comparison_method = ComparisonMethod.HIGHER_IS_BETTER
-            elif "LOWER_IS_BETTER" in metric_to_optimise_comparison_method:
-                comparison_method = ComparisonMethod.LOWER_IS_BETTER
-            elif "TARGET_IS_BETTER" in metric_to_optimise_comparison_method:
-                comparison_method = ComparisonMethod.TARGET_IS_BETTER
-            else:
-                comparison_method = ComparisonMethod.HIGHER_IS_BETTER
-
-            # Create a node to store execution results
-            node = Node(solution_plan="")  # We only need this for execute_node
-
-            # Get callbacks from the registry and notify them
-            node.training_code = code
-            # Create state info once for all callbacks
-            state_info = BuildStateInfo(
-                intent="Unknown",  # Will be filled by agent context
-                provider="Unknown",  # Will be filled by agent context
-                input_schema=None,  # Will be filled by agent context
-                output_schema=None,  # Will be filled by agent context
-                datasets=datasets,
-                iteration=0,  # Default value, no longer used for MLFlow run naming
-                node=node,
-            )
+def get_batch_executor_tools(distributed: bool = False) -> List[Callable]:
+    """Get the tools to execute several candidate solutions concurrently and collect their results as they finish."""
 
-            # Notify all callbacks about execution start
-            _notify_callbacks(object_registry.get_all(Callback), "start", state_info)
-
-            # Import here to avoid circular imports
-            from plexe.config import config
+    @tool
+    def submit_training_code_batch(
+        candidates: List[dict],
+        working_dir: str,
+        dataset_names: List[str],
+        timeout: int,
+        metric_to_optimise_name: str,
+        metric_to_optimise_comparison_method: str,
+    ) -> Dict:
+        """Starts executing several training codes concurrently, each in its own isolated environment, and returns
+        without waiting for them. As many run at once as the machine's CPUs and memory allow; the others are queued.
 
-            # Get the appropriate executor class via the factory
-            executor_class = _get_executor_class(distributed=distributed)
+        Args:
+            candidates: List of candidates, each a dictionary with a unique 'node_id' and the 'code' to execute
+            working_dir: Directory to use for execution
+            dataset_names: List of dataset names to retrieve from the registry
+            timeout: Maximum execution time of each candidate in seconds
+            metric_to_optimise_name: The name of the metric to optimize for
+            metric_to_optimise_comparison_method: The comparison method for the metric
 
-            # Create an instance of the executor
-            logger.debug(f"Creating {executor_class.__name__} for execution ID: {execution_id}")
-            executor = executor_class(
-                execution_id=execution_id,
-                code=code,
-                working_dir=working_dir,
-                datasets=datasets,
-                timeout=timeout,
-                code_execution_file_name=config.execution.runfile_name,
+        Returns:
+            A dictionary with the 'batch_id' to pass to 'collect_training_results' and the 'submitted' node ids
+        """
+        for candidate in candidates:
+            if not isinstance(candidate, dict) or not {"node_id", "code"} <= candidate.keys():
+                raise ValueError("Each candidate must be a dictionary with a 'node_id' and the 'code' to execute")
+
+        scheduler = get_scheduler()
+        batch = _Batch()
+        for candidate in candidates:
+            future = scheduler.submit(
+                _execute_training_code,
+                candidate["node_id"],
+                candidate["code"],
+                working_dir,
+                dataset_names,
+                timeout,
+                metric_to_optimise_name,
+                metric_to_optimise_comparison_method,
+                distributed,
             )
+            batch.futures[future] = candidate["node_id"]
 
-            # Execute and collect results - ProcessExecutor.run() handles cleanup internally
-            logger.debug(f"Executing node {node} using executor {executor}")
-            result = executor.run()
-            logger.debug(f"Execution result: {result}")
-            node.execution_time = result.exec_time
-            node.execution_stdout = result.term_out
-            node.exception_was_raised = result.exception is not None
-            node.exception = result.exception or None
-            node.model_artifacts = result.model_artifacts
-
-            # Handle the performance metric properly using the consolidated validation logic
-            performance_value = None
-            is_worst = True
-
-            if result.is_valid_performance():
-                performance_value = result.performance
-                is_worst = False
-
-            # Create a metric object with proper handling of None or invalid values
-            node.performance = Metric(
-                name=metric_to_optimise_name,
-                value=performance_value,
-                comparator=MetricComparator(comparison_method=comparison_method),
-                is_worst=is_worst,
-            )
+        batch_id = str(uuid.uuid4())
+        with _batches_lock:
+            _batches[batch_id] = batch
+        logger.debug(f"Submitted batch {batch_id} of {len(candidates)} candidates")
+        return {"batch_id": batch_id, "submitted": [candidate["node_id"] for candidate in candidates]}
 
-            node.training_code = code
-
-            # Notify callbacks about the execution end with the same state_info
-            # The node reference in state_info automatically reflects the updates to node
-            _notify_callbacks(object_registry.get_all(Callback), "end", state_info)
-
-            # Check if the execution failed in any way
-            if node.exception is not None:
-                raise RuntimeError(f"Execution failed with exception: {node.exception}")
-            if not result.is_valid_performance():
-                raise RuntimeError(f"Execution failed due to not producing a valid performance: {result.performance}")
-
-            # Register code and artifacts
-            artifact_paths = node.model_artifacts if node.model_artifacts else []
-            artifacts = [Artifact.from_path(p) for p in artifact_paths]
-            object_registry.register_multiple(Artifact, {a.name: a for a in artifacts})
-            object_registry.register(Code, execution_id, Code(node.training_code))
-
-            # Return results
-            return {
-                "success": not node.exception_was_raised,
-                "performance": (
-                    {
-                        "name": node.performance.name if node.performance else None,
-                        "value": node.performance.value if node.performance else None,
-                        "comparison_method": (
-                            str(node.performance.comparator.comparison_method) if node.performance else None
-                        ),
-                    }
-                    if node.performance
-                    else None
-                ),
-                "exception": str(node.exception) if node.exception else None,
-                "model_artifact_names": [a.name for a in artifacts],
-                "training_code_id": execution_id,
-            }
-        except Exception as e:
-            # Log full stack trace at debug level
-            import traceback
-
-            logger.debug(f"Error executing training code: {str(e)}\n{traceback.format_exc()}")
-
-            return {
-                "success": False,
-                "performance": None,
-                "exception": str(e),
-                "model_artifact_names": [],
-            }
+    @tool
+    def collect_training_results(batch_id: str, wait_for_all: bool) -> Dict:
+        """Collects the results of the executions in a batch that have finished since the results were last collected,
+        waiting until at least one more has finished. Call it repeatedly to handle results as soon as they are ready.
 
-    return execute_training_code
+        Args:
+            batch_id: The batch identifier returned by 'submit_training_code_batch'
+            wait_for_all: Whether to wait until every execution in the batch has finished, instead of at least one
+
+        Returns:
+            A dictionary with the new 'results', each in the same format as returned by 'execute_training_code' plus
+            the candidate's 'node_id', and the number of executions still 'pending'
+        """
+        with _batches_lock:
+            batch = _batches.get(batch_id)
+        if batch is None:
+            raise ValueError(f"Unknown batch '{batch_id}', or all of its results have already been collected")
+
+        pending = [future for future in batch.futures if future not in batch.collected]
+        if pending:
+            wait(pending, return_when=ALL_COMPLETED if wait_for_all else FIRST_COMPLETED)
+
+        results = []
+        for future, node_id in batch.futures.items():
+            if future in batch.collected or not future.done():
+                continue
+            batch.collected.add(future)
+            try:
+                results.append({"node_id": node_id, **future.result()})
+            except Exception as e:
+                results.append({"node_id": node_id, **_failure(e)})
+
+        remaining = len(batch.futures) - len(batch.collected)
+        if remaining == 0:
+            with _batches_lock:
+                _batches.pop(batch_id, None)
+        return {"results": results, "pending": remaining}
+
+    return [submit_training_code_batch, collect_training_results]
+
+
+@dataclass
+class _Batch:
+    futures: Dict[Future, str] = field(default_factory=dict)
+    collected: Set[Future] = field(default_factory=set)
+
+
+# Batches submitted for concurrent execution whose results have not all been collected, by batch id
+_batches: Dict[str, _Batch] = {}
+_batches_lock = threading.Lock()
+# Executions run concurrently, but callbacks are not required to be thread-safe
+_callbacks_lock = threading.Lock()
+
+
+def _execute_training_code(
+    node_id: str,
+    code: str,
+    working_dir: str,
+    dataset_names: List[str],
+    timeout: int,
+    metric_to_optimise_name: str,
+    metric_to_optimise_comparison_method: str,
+    distributed: bool,
+) -> Dict:
+    """Execute training code, notify callbacks, register its artifacts and code, and return the tool's result."""
+    logger.debug(f"Executing training code for node {node_id} with distributed={distributed}")
+
+    from plexe.callbacks import BuildStateInfo
+
+    object_registry = ObjectRegistry()
+
+    execution_id = f"{node_id}-{uuid.uuid4()}"
+    try:
+        # Get actual datasets from registry
+        datasets = object_registry.get_multiple(TabularConvertible, dataset_names)
+
+        # Convert string to enum if needed
+        if "HIGHER_IS_BETTER" in metric_to_optimise_comparison_method:
+            comparison_method = ComparisonMethod.HIGHER_IS_BETTER
+        elif "LOWER_IS_BETTER" in metric_to_optimise_comparison_method:
+            comparison_method = ComparisonMethod.LOWER_IS_BETTER
+        elif "TARGET_IS_BETTER" in metric_to_optimise_comparison_method:
+            comparison_method = ComparisonMethod.TARGET_IS_BETTER
+        else:
+            comparison_method = ComparisonMethod.HIGHER_IS_BETTER
+
+        # Create a node to store execution results
+        node = Node(solution_plan="")  # We only need this for execute_node
+
+        # Get callbacks from the registry and notify them
+        node.training_code = code
+        # Create state info once for all callbacks
+        state_info = BuildStateInfo(
+            intent="Unknown",  # Will be filled by agent context
+            provider="Unknown",  # Will be filled by agent context
+            input_schema=None,  # Will be filled by agent context
+            output_schema=None,  # Will be filled by agent context
+            datasets=datasets,
+            iteration=0,  # Default value, no longer used for MLFlow run naming
+            node=node,
+        )
+
+        # Notify all callbacks about execution start
+        callbacks = object_registry.get_all(Callback)
+        _notify_callbacks(callbacks, "start", state_info)
+
+        # Get the appropriate executor class via the factory
+        executor_class = _get_executor_class(distributed=distributed)
+
+        # Create an instance of the executor
+        logger.debug(f"Creating {executor_class.__name__} for execution ID: {execution_id}")
+        executor = executor_class(
+            execution_id=execution_id,
+            code=code,
+            working_dir=working_dir,
+            datasets=datasets,
+            timeout=timeout,
+            code_execution_file_name=config.execution.runfile_name,
+            on_output=lambda stream, line: _notify_output(callbacks, state_info, stream, line),
+        )
+
+        # Execute and collect results - ProcessExecutor.run() handles cleanup internally
+        logger.debug(f"Executing node {node} using executor {executor}")
+        result = executor.run()
+        logger.debug(f"Execution result: {result}")
+        node.execution_time = result.exec_time
+        node.execution_stdout = result.term_out
+        node.exception_was_raised = result.exception is not None
+        node.exception = result.exception or None
+        node.model_artifacts = result.model_artifacts
+
+        # Handle the performance metric properly using the consolidated validation logic
+        performance_value = None
+        is_worst = True
+
+        if result.is_valid_performance():
+            performance_value = result.performance
+            is_worst = False
+
+        # Create a metric object with proper handling of None or invalid values
+        node.performance = Metric(
+            name=metric_to_optimise_name,
+            value=performance_value,
+            comparator=MetricComparator(comparison_method=comparison_method),
+            is_worst=is_worst,
+        )
+
+        node.training_code = code
+
+        # Notify callbacks about the execution end with the same state_info
+        # The node reference in state_info automatically reflects the updates to node
+        _notify_callbacks(object_registry.get_all(Callback), "end", state_info)
+
+        # Check if the execution failed in any way
+        if node.exception is not None:
+            raise RuntimeError(f"Execution failed with exception: {node.exception}")
+        if not result.is_valid_performance():
+            raise RuntimeError(f"Execution failed due to not producing a valid performance: {result.performance}")
+
+        # Register code and artifacts; artifacts are registered under the execution's ID, since candidates
+        # executed in the same build often write files with the same names
+        artifact_paths = node.model_artifacts if node.model_artifacts else []
+        artifacts = {f"{execution_id}/{a.name}": a for a in (Artifact.from_path(p) for p in artifact_paths)}
+        object_registry.register_multiple(Artifact, artifacts)
+        object_registry.register(Code, execution_id, Code(node.training_code))
+
+        # Return results
+        return {
+            "success": not node.exception_was_raised,
+            "performance": (
+                {
+                    "name": node.performance.name if node.performance else None,
+                    "value": node.performance.value if node.performance else None,
+                    "comparison_method": (
+                        str(node.performance.comparator.comparison_method) if node.performance else None
+                    ),
+                }
+                if node.performance
+                else None
+            ),
+            "exception": str(node.exception) if node.exception else None,
+            "model_artifact_names": list(artifacts),
+            "training_code_id": execution_id,
+        }
+    except Exception as e:
+        # Log full stack trace at debug level
+        import traceback
+
+        logger.debug(f"Error executing training code: {str(e)}\n{traceback.format_exc()}")
+
+        return _failure(e)
+
+
+def _failure(e: Exception) -> Dict:
+    """Result of an execution that failed before producing any results."""
+    return {
+        "success": False,
+        "performance": None,
+        "exception": str(e),
+        "model_artifact_names": [],
+    }
+
+
+def _notify_output(callbacks: Dict, build_state_info, stream: str, line: str) -> None:
+    """Forward a line of execution output to the callbacks; errors are logged, never raised into the reader thread.
+
+    Args:
+        callbacks: Dictionary of callbacks from the registry
+        build_state_info: The state info of the running execution
+        stream: The stream the line was written to, either "stdout" or "stderr"
+        line: The line of output
+    """
+    with _callbacks_lock:
+        for callback in callbacks.values():
+            try:
+                callback.on_execution_output(build_state_info, stream, line)
+            except Exception as e:
+                logger.debug(f"Error in callback {callback.__class__.__name__}.on_execution_output: {e}")
 
 
 def _get_executor_class(distributed: bool = False) -> Type:
@@ -210,6 +369,12 @@ def _get_executor_class(distributed: bool = False) -> Type:
             logger.warning("Ray not available, falling back to ProcessExecutor")
             return ProcessExecutor
 
+    if config.execution.warm_workers:
+        if forkserver_executor.is_available():
+            logger.debug("Using ForkServerExecutor (non-distributed, warm workers)")
+            return forkserver_executor.ForkServerExecutor
+        logger.warning("Warm workers are not supported on this platform, falling back to ProcessExecutor")
+
     # Default to ProcessExecutor for non-distributed execution
     logger.debug("Using ProcessExecutor (non-distributed)")
     return ProcessExecutor
@@ -225,15 +390,16 @@ def _notify_callbacks(callbacks: Dict, event_type: str, build_state_info) -> Non
     """
     method_name = f"on_iteration_{event_type}"
 
-    for callback in callbacks.values():
-        try:
-            getattr(callback, method_name)(build_state_info)
-        except Exception as e:
-            # Log full stack trace at debug level
-            import traceback
-
-            logger.debug(
-                f"Error in callback {callback.__class__.__name__}.{method_name}: {e}\n{traceback.format_exc()}"
-            )
-            # Log a shorter message at warning level
-            logger.warning(f"Error in callback {callback.__class__.__name__}.{method_name}: {str(e)[:50]}")
+    with _callbacks_lock:
+        for callback in callbacks.values():
+            try:
+                getattr(callback, method_name)(build_state_info)
+            except Exception as e:
+                # Log full stack trace at debug level
+                import traceback
+
+                logger.debug(
+                    f"Error in callback {callback.__class__.__name__}.{method_name}: {e}\n{traceback.format_exc()}"
+                )
+                # Log a shorter message at warning level
+                logger.warning(f"Error in callback {callback.__class__.__name__}.{method_name}: {str(e)[:50]}")
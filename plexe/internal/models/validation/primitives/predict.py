@@ -5,12 +5,15 @@ Classes:
     - PredictorValidator: A validator class that checks the behavior of a predictor.
 """
 
+import math
 import types
 import warnings
 from typing import Type, List, Dict, Any
 
+import pandas as pd
 from pydantic import BaseModel
 
+from plexe.internal.common.utils.schema_validation import compile_validator
 from plexe.internal.models.validation.validator import Validator, ValidationResult
 from plexe.internal.models.interfaces.predictor import Predictor
 
@@ -83,6 +86,12 @@ class PredictorValidator(Validator):
         except Exception as e:
             return validation_error("prediction", e)
 
+        # Stage 5: Test batch prediction
+        try:
+            self._batch_matches_single_predictions(predictor)
+        except Exception as e:
+            return validation_error("batch_prediction", e)
+
         # All validation steps passed
         return ValidationResult(self.name, True, "Prediction code is valid.")
 
@@ -140,3 +149,52 @@ class PredictorValidator(Validator):
 
         if len(issues) > 0:
             raise RuntimeError(f"{len(issues)}/{total_tests} calls to 'predict' failed. Issues: {issues}")
+
+    def _batch_matches_single_predictions(self, predictor) -> None:
+        """
+        Tests that `predict_batch` on the whole input sample returns the same outputs as calling `predict`
+        on each sample individually.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = [predictor.predict(sample) for sample in self.input_sample]
+            batch_output = predictor.predict_batch(pd.DataFrame(self.input_sample))
+
+        if not isinstance(batch_output, pd.DataFrame):
+            raise TypeError(f"'predict_batch' must return a pandas DataFrame, got {type(batch_output).__name__}")
+        if len(batch_output) != len(expected):
+            raise RuntimeError(
+                f"'predict_batch' returned {len(batch_output)} rows for {len(expected)} inputs; "
+                f"it must return exactly one row per input row"
+            )
+        compile_validator(self.output_schema).validate(batch_output, label="'predict_batch' output")
+
+        actual = batch_output.to_dict(orient="records")
+        mismatches = [
+            i for i, (single, batch) in enumerate(zip(expected, actual)) if not self._outputs_equal(single, batch)
+        ]
+        if mismatches:
+            i = mismatches[0]
+            raise RuntimeError(
+                f"'predict_batch' and 'predict' returned different outputs for {len(mismatches)}/{len(expected)} "
+                f"samples (indices {mismatches[:10]}). First mismatch: predict={expected[i]}, predict_batch={actual[i]}"
+            )
+
+    @staticmethod
+    def _outputs_equal(single: Dict[str, Any], batch: Dict[str, Any]) -> bool:
+        """
+        Compares two output records, tolerating float rounding differences between scalar and vectorized code.
+        """
+        if set(single.keys()) != set(batch.keys()):
+            return False
+        for key, a in single.items():
+            b = batch[key]
+            if isinstance(a, float) or isinstance(b, float):
+                try:
+                    if not (math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-9) or (math.isnan(a) and math.isnan(b))):
+                        return False
+                except TypeError:
+                    return False
+            elif a != b:
+                return False
+        return True
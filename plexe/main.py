@@ -1,12 +1,99 @@
 """
-Application entry point for using the plexe package as a conversational agent.
+Application entry point for the plexe command line interface.
+
+Usage:
+    plexe serve model.tar.gz --port 8000 --workers 4
 """
 
+import argparse
+from typing import List, Optional
+
+from plexe.config import config
+
 # TODO: launch chat UI from here
 
 
-def main():
-    pass
+def _serve(args: argparse.Namespace) -> None:
+    """Load a saved model and serve it over HTTP until interrupted."""
+    # Imported here so that the server's dependencies are only loaded when serving
+    from plexe.fileio import load_model
+    from plexe.internal.models.inference.server import ModelServer
+
+    model = load_model(args.model_path)
+    model.configure_batching(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    if args.cache_max_entries:
+        model.enable_cache(max_entries=args.cache_max_entries, ttl=args.cache_ttl)
+    server = ModelServer(
+        model,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_inflight_requests=args.max_inflight,
+        max_request_bytes=args.max_request_bytes,
+        request_timeout=args.request_timeout,
+        metrics_file=args.metrics_file,
+        metrics_interval=args.metrics_interval,
+    )
+    server.serve_forever()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="plexe", description="Build and serve ML models from natural language.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="serve a saved model over HTTP")
+    serve.add_argument("model_path", help="path to a model saved with plexe.save_model")
+    serve.add_argument("--host", default=config.serving.host, help="interface to listen on")
+    serve.add_argument("--port", type=int, default=config.serving.port, help="port to listen on")
+    serve.add_argument("--workers", type=int, default=config.serving.workers, help="number of worker processes")
+    serve.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=config.inference.max_batch_size,
+        help="maximum number of concurrent /predict requests scored together",
+    )
+    serve.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=config.inference.max_wait_ms,
+        help="maximum time a /predict request waits for a batch to fill",
+    )
+    serve.add_argument(
+        "--max-inflight",
+        type=int,
+        default=config.serving.max_inflight_requests,
+        help="requests accepted concurrently per worker before rejecting with 429",
+    )
+    serve.add_argument(
+        "--max-request-bytes",
+        type=int,
+        default=config.serving.max_request_bytes,
+        help="largest accepted request body, in bytes",
+    )
+    serve.add_argument(
+        "--request-timeout",
+        type=float,
+        default=config.serving.request_timeout,
+        help="seconds a /predict request may wait for its prediction",
+    )
+    serve.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=0,
+        help="cache the outputs of up to this many distinct inputs; 0 disables caching",
+    )
+    serve.add_argument("--cache-ttl", type=float, default=None, help="seconds after which cached outputs expire")
+    serve.add_argument("--metrics-file", default=None, help="JSON file to write inference metrics snapshots to")
+    serve.add_argument(
+        "--metrics-interval", type=float, default=60.0, help="seconds between inference metrics snapshots"
+    )
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _build_parser().parse_args(argv)
+    args.handler(args)
 
 
 if __name__ == "__main__":
@@ -33,19 +33,24 @@ Example:
 >>>
 >>>    prediction = model.predict({"bedrooms": 3, "bathrooms": 2, "square_footage": 1500.0})
 >>>    print(prediction)
+>>>
+>>>    predictions = model.predict_batch(pd.read_csv("houses_to_score.csv"))
+>>>    model.predict_file("all_houses.parquet", "all_prices.parquet")
 """
 
 import os
 import json
 import logging
+import time
 import uuid
-from typing import Dict, List, Type, Any
+from pathlib import Path
+from typing import Dict, List, Type, Any, Iterable, Iterator, Tuple
 from datetime import datetime
 
 import pandas as pd
 from pydantic import BaseModel
 
-from plexe.config import prompt_templates
+from plexe.config import config, prompt_templates
 from plexe.constraints import Constraint
 from plexe.datasets import DatasetGenerator
 from plexe.callbacks import Callback, BuildStateInfo, ChainOfThoughtModelCallback
@@ -56,7 +61,9 @@ from plexe.internal.common.datasets.adapter import DatasetAdapter
 from plexe.internal.common.provider import Provider, ProviderConfig
 from plexe.internal.common.registries.objects import ObjectRegistry
 from plexe.internal.common.utils.model_utils import calculate_model_size, format_code_snippet
-from plexe.internal.common.utils.pydantic_utils import map_to_basemodel, format_schema
+from plexe.internal.common.utils.pandas_utils import to_dataframe
+from plexe.internal.common.utils.pydantic_utils import map_to_basemodel, format_schema, create_placeholder_record
+from plexe.internal.common.utils.schema_validation import compile_validator
 from plexe.internal.common.utils.model_state import ModelState
 from plexe.internal.models.entities.artifact import Artifact
 from plexe.internal.models.entities.description import (
@@ -67,6 +74,11 @@ from plexe.internal.models.entities.description import (
     CodeInfo,
 )
 from plexe.internal.models.entities.metric import Metric
+from plexe.internal.models.execution.dataset_staging import clear_staging
+from plexe.internal.models.inference.batching import MicroBatcher
+from plexe.internal.models.inference.cache import PredictionCache, record_key
+from plexe.internal.models.inference.metrics import get_inference_metrics
+from plexe.internal.models.inference.streaming import arrow_types, stream_predictions, write_batches
 from plexe.internal.models.interfaces.predictor import Predictor
 from plexe.internal.schemas.resolver import SchemaResolver
 
@@ -134,12 +146,20 @@ class Model:
         self.trainer_source: str | None = None
         self.predictor_source: str | None = None
         self.artifacts: List[Artifact] = []
+        self.input_sample: List[Dict[str, Any]] = []
         self.metric: Metric | None = None
         self.metadata: Dict[str, str] = dict()  # todo: initialise metadata, etc
 
         # Generator objects used to create schemas, datasets, and the model itself
         self.schema_resolver: SchemaResolver | None = None
 
+        # Micro-batching queue for asynchronous predictions, created on first use
+        self._batcher: MicroBatcher | None = None
+        # Optional cache of prediction outputs, enabled with enable_cache()
+        self._cache: PredictionCache | None = None
+        # Whether the predictor has been warmed up in this process; unlike the warm-up stats, this is never saved
+        self._warmed: bool = False
+
         # Registries used to make datasets, artifacts and other objects available across the system
         self.object_registry = ObjectRegistry()
 
@@ -159,6 +179,7 @@ class Model:
         callbacks: List[Callback] = None,
         verbose: bool = False,
         chain_of_thought: bool = True,
+        check_constraints: bool = False,
     ) -> None:
         """
         Build the model using the provided dataset and optional data generation configuration.
@@ -172,6 +193,8 @@ class Model:
         :param callbacks: list of callbacks to notify during the model building process
         :param verbose: whether to display detailed agent logs during model building (default: False)
         :param chain_of_thought: whether to display chain of thought output (default: True)
+        :param check_constraints: whether to evaluate the constraints on the validation split after building,
+                                  storing the violation rates in the model metadata (default: False)
         :return:
         """
         # Ensure the object registry is cleared before building
@@ -330,6 +353,11 @@ class Model:
             self.predictor_source = generated.inference_source_code
             self.predictor = generated.predictor
             self.artifacts = generated.model_artifacts
+            try:
+                # Keep the inputs used to validate the predictor, so that they can be replayed to warm it up
+                self.input_sample = list(self.object_registry.get(list, "predictor_input_sample"))
+            except KeyError:
+                self.input_sample = []
 
             # Convert Metric object to a dictionary with the entire metric object as the value
             self.metric = generated.test_performance
@@ -347,6 +375,12 @@ class Model:
 
             self.state = ModelState.READY
 
+            if check_constraints and self.constraints:
+                try:
+                    self.metadata["constraint_violations"] = self.check_constraints()
+                except Exception as e:
+                    logger.warning(f"Could not check constraints on the validation split: {str(e)[:50]}")
+
             # Run callbacks for 'on_build_end' event
             for callback in self.object_registry.get_all(Callback).values():
                 try:
@@ -377,6 +411,9 @@ class Model:
             # Log a shorter message at error level
             logger.error(f"Error during model building: {str(e)[:50]}")
             raise e
+        finally:
+            # Datasets are staged once per build for its executions, and are not needed once the build ends
+            clear_staging(self.working_dir)
 
     def predict(self, x: Dict[str, Any], validate_input: bool = False, validate_output: bool = False) -> Dict[str, Any]:
         """
@@ -388,16 +425,372 @@ class Model:
         """
         if self.state != ModelState.READY:
             raise RuntimeError("The model is not ready for predictions.")
+        metrics = get_inference_metrics(self.identifier)
+        started = metrics.start("predict")
+        try:
+            if validate_input:
+                self.input_schema.model_validate(x)
+            if self._cache is None:
+                y = self.predictor.predict(x)
+            else:
+                key = record_key(x)
+                y = self._cache.get_many(self.identifier, [key])[0]
+                if y is None:
+                    y = self.predictor.predict(x)
+                    self._cache.put_many(self.identifier, [key], [dict(y)])
+                y = dict(y)
+            if validate_output:
+                self.output_schema.model_validate(y)
+            metrics.finish(started, rows=1)
+            return y
+        except Exception as e:
+            metrics.finish(started, error=True)
+            raise RuntimeError(f"Error during prediction: {str(e)}") from e
+
+    async def apredict(
+        self, x: Dict[str, Any], validate_input: bool = False, validate_output: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Call the model with input x from an asyncio event loop, without blocking the loop.
+
+        Concurrent calls are coalesced into micro-batches that are scored with a single `predict_batch` call
+        on an executor thread; see `configure_batching` to tune the batch size and waiting time.
+
+        :param x: input to the model
+        :param validate_input: whether to validate the input against the input schema
+        :param validate_output: whether to validate the output against the output schema
+        :return: output of the model
+        """
+        if self.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+        if self._batcher is None:
+            self.configure_batching()
+        metrics = get_inference_metrics(self.identifier)
+        started = metrics.start("apredict")
         try:
             if validate_input:
                 self.input_schema.model_validate(x)
-            y = self.predictor.predict(x)
+            y = await self._batcher.submit(x)
             if validate_output:
                 self.output_schema.model_validate(y)
+            metrics.finish(started, rows=1)
             return y
+        except RuntimeError:
+            # Batch failures are already reported by predict_batch
+            metrics.finish(started, error=True)
+            raise
         except Exception as e:
+            metrics.finish(started, error=True)
             raise RuntimeError(f"Error during prediction: {str(e)}") from e
 
+    def configure_batching(
+        self, max_batch_size: int = None, max_wait_ms: float = None, max_concurrent_batches: int = None
+    ) -> None:
+        """
+        Configure the micro-batching used by `apredict`. Unset values default to `config.inference`.
+
+        :param max_batch_size: maximum number of concurrent requests scored in one batch
+        :param max_wait_ms: maximum time a request waits for others to join its batch
+        :param max_concurrent_batches: maximum number of batches scored at the same time
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+        self._batcher = MicroBatcher(
+            lambda records: self.predict_batch(records).to_dict(orient="records"),
+            max_batch_size=max_batch_size or config.inference.max_batch_size,
+            max_wait_ms=max_wait_ms if max_wait_ms is not None else config.inference.max_wait_ms,
+            max_concurrency=max_concurrent_batches or config.inference.max_concurrent_batches,
+        )
+
+    def batching_stats(self) -> dict:
+        """
+        Return counters for the micro-batches formed by `apredict`, including a histogram of batch sizes.
+        :return: batching statistics, or an empty dictionary if `apredict` has not been used
+        """
+        return self._batcher.stats() if self._batcher is not None else {}
+
+    def warmup(self, n: int = None, sample: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Warm up the predictor by replaying sample inputs through both the single and the batch prediction paths.
+
+        The first calls to a freshly loaded predictor are often much slower than later ones, because of lazy
+        imports, first-call allocations in ML libraries and page faults on artifacts. Warming up pays these
+        costs before the model serves real requests. The latency of the first (cold) and the last (warm) round
+        is recorded in the model metadata under 'warmup'. Warm-up calls are not counted in `inference_stats`.
+
+        :param n: number of times the sample is replayed; defaults to `config.inference.warmup_rounds`
+        :param sample: input records to replay; defaults to the input sample stored with the model, or else a
+            placeholder record built from the input schema
+        :return: the recorded warm-up latencies, in milliseconds
+        """
+        if self.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+        rounds = n if n is not None else config.inference.warmup_rounds
+        if rounds <= 0:
+            raise ValueError(f"Number of warm-up rounds must be positive, got {rounds}")
+        records = list(sample or self.input_sample or [create_placeholder_record(self.input_schema)])
+        records = records[: config.inference.warmup_max_samples]
+
+        # Compile the batch validators, which are otherwise compiled on the first validated call
+        compile_validator(self.input_schema)
+        compile_validator(self.output_schema)
+
+        latencies = []
+        try:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for record in records:
+                    self.predictor.predict(record)
+                single = (time.perf_counter() - start) / len(records)
+                start = time.perf_counter()
+                self.predictor.predict_batch(pd.DataFrame(records))
+                latencies.append((single, time.perf_counter() - start))
+        except Exception as e:
+            raise RuntimeError(f"Error during warm-up: {str(e)}") from e
+
+        stats = {
+            "rounds": rounds,
+            "samples": len(records),
+            "cold_predict_ms": latencies[0][0] * 1000,
+            "warm_predict_ms": latencies[-1][0] * 1000,
+            "cold_predict_batch_ms": latencies[0][1] * 1000,
+            "warm_predict_batch_ms": latencies[-1][1] * 1000,
+        }
+        self.metadata["warmup"] = stats
+        self._warmed = True
+        logger.info(
+            f"Warmed up model {self.identifier}: predict {stats['cold_predict_ms']:.2f}ms cold, "
+            f"{stats['warm_predict_ms']:.2f}ms warm"
+        )
+        return stats
+
+    def inference_stats(self) -> dict:
+        """
+        Return latency and throughput statistics for this model's predictions in the current process.
+
+        Statistics are reported per prediction path ('predict', 'predict_batch', 'apredict' and the serving
+        endpoints), with call, error and row counts, mean rows per second since start, in-flight calls, and latency percentiles.
+
+        :return: snapshot of the model's inference metrics
+        """
+        return get_inference_metrics(self.identifier).snapshot()
+
+    def predict_batch(
+        self,
+        x: pd.DataFrame | List[Dict[str, Any]],
+        validate_input: bool = False,
+        validate_output: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Call the model with a batch of inputs and return the outputs as a DataFrame.
+
+        Predictors that implement a vectorized `predict_batch` score the whole batch in one call; older
+        predictors fall back to calling `predict` once per row.
+
+        :param x: batch of inputs, as a DataFrame, a pyarrow Table or a list of input dictionaries
+        :param validate_input: whether to validate each input row against the input schema
+        :param validate_output: whether to validate each output row against the output schema
+        :return: DataFrame with one row of outputs per input row, in the same order as the inputs
+        """
+        if self.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+        metrics = get_inference_metrics(self.identifier)
+        started = metrics.start("predict_batch")
+        try:
+            inputs = to_dataframe(x)
+            if len(inputs) == 0:
+                metrics.finish(started)
+                return pd.DataFrame(columns=list(self.output_schema.model_fields.keys()))
+            if validate_input:
+                compile_validator(self.input_schema).validate(inputs, label="Input")
+            y = self.predictor.predict_batch(inputs) if self._cache is None else self._predict_batch_cached(inputs)
+            if len(y) != len(inputs):
+                raise ValueError(f"Predictor returned {len(y)} outputs for {len(inputs)} inputs")
+            y = y.reset_index(drop=True)
+            if validate_output:
+                compile_validator(self.output_schema).validate(y, label="Output")
+            metrics.finish(started, rows=len(y))
+            return y
+        except Exception as e:
+            metrics.finish(started, error=True)
+            raise RuntimeError(f"Error during batch prediction: {str(e)}") from e
+
+    def _predict_batch_cached(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """Score a batch through the prediction cache, sending each distinct uncached row to the predictor once."""
+        keys = [record_key(record) for record in inputs.to_dict(orient="records")]
+        outputs = self._cache.get_many(self.identifier, keys)
+
+        # Map each distinct missing key to the position of its first occurrence in the batch
+        missing: Dict[bytes, int] = {}
+        for position, (key, output) in enumerate(zip(keys, outputs)):
+            if output is None:
+                missing.setdefault(key, position)
+        if not missing:
+            return pd.DataFrame(outputs)
+
+        positions = list(missing.values())
+        y = self.predictor.predict_batch(inputs.iloc[positions].reset_index(drop=True))
+        if len(y) != len(positions):
+            raise ValueError(f"Predictor returned {len(y)} outputs for {len(positions)} inputs")
+        computed = y.to_dict(orient="records")
+        self._cache.put_many(self.identifier, list(missing), computed)
+        if len(positions) == len(inputs):
+            return y  # every row was scored, so the predictor's output can be returned as is
+
+        by_key = dict(zip(missing, computed))
+        return pd.DataFrame([output if output is not None else by_key[key] for key, output in zip(keys, outputs)])
+
+    def enable_cache(self, max_entries: int = None, max_bytes: int = None, ttl: float = None) -> None:
+        """
+        Cache prediction outputs, so that repeated inputs are not scored again. Any existing cache is replaced.
+
+        If neither limit is given, the limits default to `config.inference`. Cached outputs are dropped
+        automatically if the model's identifier changes.
+
+        :param max_entries: maximum number of cached outputs
+        :param max_bytes: approximate maximum memory used by cached outputs
+        :param ttl: seconds after which a cached output expires; defaults to `config.inference.cache_ttl`
+        """
+        if max_entries is None and max_bytes is None:
+            max_entries, max_bytes = config.inference.cache_max_entries, config.inference.cache_max_bytes
+        self._cache = PredictionCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl=ttl if ttl is not None else config.inference.cache_ttl,
+        )
+
+    def disable_cache(self) -> None:
+        """
+        Stop caching prediction outputs and release the cached outputs.
+        """
+        self._cache = None
+
+    def cache_stats(self) -> dict:
+        """
+        Return hit and miss counters and the size of the prediction cache.
+        :return: cache statistics, or an empty dictionary if caching is not enabled
+        """
+        return self._cache.stats() if self._cache is not None else {}
+
+    def check_constraints(self, data: pd.DataFrame | List[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate the model's constraints against its predictions on a dataset, and report the violation rates.
+
+        :param data: the inputs to predict on; defaults to the validation splits of the most recent build
+        :return: for each constraint description, the number of rows checked, violations and violation rate
+        """
+        if data is None:
+            splits = [
+                dataset.to_pandas()
+                for name, dataset in self.object_registry.get_all(TabularConvertible).items()
+                if name.endswith("_val")
+            ]
+            if not splits:
+                raise ValueError("No validation split is available; pass the data to check the constraints on")
+            data = pd.concat(splits, ignore_index=True)
+
+        inputs = to_dataframe(data)[list(self.input_schema.model_fields.keys())]
+        outputs = self.predict_batch(inputs)
+        report = {}
+        for constraint in self.constraints:
+            violations = int((~constraint.evaluate_batch(inputs, outputs)).sum())
+            report[constraint.description] = {
+                "rows": len(inputs),
+                "violations": violations,
+                "violation_rate": violations / len(inputs) if len(inputs) else 0.0,
+            }
+            if violations:
+                logger.warning(f"Constraint '{constraint.description}' violated on {violations}/{len(inputs)} rows")
+        return report
+
+    def predict_stream(
+        self,
+        source: str | Path | Iterable,
+        batch_size: int = None,
+        validate_input: bool = False,
+        validate_output: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Score a dataset that may not fit in memory, yielding the outputs batch by batch.
+
+        Files are read incrementally, only loading the input schema's columns, and the next batches are read
+        in the background while the current one is being scored.
+
+        :param source: path to a parquet or CSV file, a DataFrame or Arrow table, or an iterable of batches
+        :param batch_size: maximum number of rows per batch; defaults to `config.inference.stream_batch_size`
+        :param validate_input: whether to validate each input row against the input schema
+        :param validate_output: whether to validate each output row against the output schema
+        :return: iterator over output DataFrames, one per input batch, in input order
+        """
+        if self.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+        pairs = self._stream_predictions(source, batch_size, validate_input, validate_output)
+        return (outputs for _, outputs in pairs)
+
+    def predict_file(
+        self,
+        in_path: str | Path,
+        out_path: str | Path,
+        batch_size: int = None,
+        passthrough_columns: List[str] = None,
+        validate_input: bool = False,
+        validate_output: bool = False,
+    ) -> int:
+        """
+        Score a parquet or CSV file and write the outputs to a parquet or CSV file with bounded memory.
+
+        Reading, prediction and writing run concurrently, each on its own thread. Output rows are in the same
+        order as the input rows.
+
+        :param in_path: path to the input file, ending in .parquet or .csv
+        :param out_path: path to the output file, ending in .parquet or .csv
+        :param batch_size: maximum number of rows per batch; defaults to `config.inference.stream_batch_size`
+        :param passthrough_columns: input columns, such as record identifiers, to copy to the output file
+        :param validate_input: whether to validate each input row against the input schema
+        :param validate_output: whether to validate each output row against the output schema
+        :return: the number of rows written
+        """
+        if self.state != ModelState.READY:
+            raise RuntimeError("The model is not ready for predictions.")
+        passthrough_columns = passthrough_columns or []
+        pairs = self._stream_predictions(in_path, batch_size, validate_input, validate_output, passthrough_columns)
+        batches = (
+            pd.concat([inputs[passthrough_columns], outputs], axis=1) if passthrough_columns else outputs
+            for inputs, outputs in pairs
+        )
+        rows = write_batches(
+            batches,
+            out_path,
+            depth=config.inference.stream_prefetch,
+            empty_columns=passthrough_columns + list(self.output_schema.model_fields.keys()),
+            # Passthrough columns keep their input types; output columns always have the output schema's types
+            column_types={**arrow_types(self.input_schema), **arrow_types(self.output_schema)},
+        )
+        logger.info(f"Scored {rows} rows from {in_path} into {out_path}")
+        return rows
+
+    def _stream_predictions(
+        self,
+        source,
+        batch_size: int | None,
+        validate_input: bool,
+        validate_output: bool,
+        extra_columns: List[str] = None,
+    ) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Stream (inputs, outputs) batch pairs; only the input schema's columns are passed to the predictor.
+        """
+        input_columns = list(self.input_schema.model_fields.keys())
+        read_columns = input_columns + [c for c in extra_columns or [] if c not in input_columns]
+        return stream_predictions(
+            lambda batch: self.predict_batch(batch[input_columns], validate_input, validate_output),
+            source,
+            batch_size=batch_size or config.inference.stream_batch_size,
+            columns=read_columns,
+            prefetch_depth=config.inference.stream_prefetch,
+            column_types=arrow_types(self.input_schema),
+        )
+
     def get_state(self) -> ModelState:
         """
         Return the current state of the model.
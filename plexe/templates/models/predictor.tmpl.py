@@ -1,5 +1,7 @@
 from typing import List
 
+import pandas as pd
+
 # TODO: add any additional required imports here
 
 from plexe.internal.models.entities.artifact import Artifact
@@ -24,18 +26,26 @@ class PredictorImplementation(Predictor):
         Given an input conforming to the input schema, return the model's prediction
         as a dict conforming to the output schema.
         """
-        # TODO: add inference code here
+        # Do not modify this method; single inputs are scored through the vectorized predict_batch path.
+        return self.predict_batch(pd.DataFrame([inputs])).to_dict(orient="records")[0]
+
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Given a DataFrame whose rows conform to the input schema, return a DataFrame with exactly one row per
+        input row, in the same order, whose columns conform to the output schema.
+        """
+        # TODO: add vectorized inference code here; operate on whole columns and never loop over rows
         # Example: return self._postprocess_output(self.model.predict(self._preprocess_input(inputs)))
         pass
 
-    def _preprocess_input(self, inputs: dict):
-        """Map the input data from a dict to the input format of the underlying model."""
-        # TODO: add input preprocessing code here
+    def _preprocess_input(self, inputs: pd.DataFrame):
+        """Map a DataFrame of inputs to the input format of the underlying model, column by column."""
+        # TODO: add vectorized input preprocessing code here
         pass
 
-    def _postprocess_output(self, outputs) -> dict:
-        """Map the output from the underlying model to a dict compliant with the output schema."""
-        # TODO: add output postprocessing code here
+    def _postprocess_output(self, outputs) -> pd.DataFrame:
+        """Map the batch output of the underlying model to a DataFrame compliant with the output schema."""
+        # TODO: add vectorized output postprocessing code here
         pass
 
     @staticmethod
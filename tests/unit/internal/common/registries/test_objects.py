@@ -0,0 +1,62 @@
+"""
+Tests for the ObjectRegistry.
+
+This module verifies:
+1. Registering and retrieving items by type and name, and rejecting duplicate names.
+2. Registering and listing items from many threads at once.
+"""
+
+import threading
+
+import pytest
+
+from plexe.internal.common.registries.objects import ObjectRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ObjectRegistry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def test_register_and_get(registry):
+    registry.register(str, "greeting", "hello")
+    registry.register_multiple(int, {"one": 1, "two": 2})
+
+    assert registry.get(str, "greeting") == "hello"
+    assert registry.get_multiple(int, ["one", "two"]) == {"one": 1, "two": 2}
+    assert ObjectRegistry() is registry
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(str, "greeting", "hi")
+    with pytest.raises(KeyError):
+        registry.get(str, "missing")
+
+
+def test_concurrent_registration(registry):
+    threads, errors = 16, []
+    barrier = threading.Barrier(threads)
+
+    def work(index):
+        barrier.wait()
+        try:
+            for i in range(100):
+                registry.register(int, f"{index}-{i}", i)
+                registry.get_all(int)
+            # Only one of the threads registering the same name succeeds
+            registry.register(str, "shared", str(index))
+        except ValueError:
+            pass
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=work, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert errors == []
+    assert len(registry.get_all(int)) == threads * 100
+    assert len(registry.get_all(str)) == 1
@@ -5,17 +5,28 @@ This module verifies:
 1. Writing datasets to files and reading them back
 2. Storing datasets in shared memory and retrieving them
 3. Error handling for invalid file paths and data
+4. Mapping tabular datasets in shared memory as Arrow tables without copying them
+5. Raising the original error, not a BufferError, when reading or writing a segment fails
 """
 
 import os
+import uuid
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+import numpy as np
+import pyarrow as pa
 import pytest
 
 from plexe.internal.common.datasets.tabular import TabularDataset
 from plexe.internal.common.utils.dataset_storage import (
+    _SHM_PAYLOAD_OFFSET,
+    _write_arrow_stream,
     write_dataset_to_file,
     read_dataset_from_file,
     dataset_to_shared_memory,
     dataset_from_shared_memory,
+    table_from_shared_memory,
 )
 import pandas as pd
 
@@ -109,3 +120,77 @@ def test_shared_memory_error_handling():
             dataset_from_shared_memory(TabularDataset, "non_existent_segment_name")
     except ImportError:
         pytest.skip("shared_memory not available")
+
+
+@pytest.fixture
+def segment_name():
+    name = f"plexe-test-{uuid.uuid4().hex[:12]}"
+    yield name
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+        segment.close()
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def test_shared_memory_round_trip(segment_name):
+    """Test that a dataset is read back from shared memory using the size recorded in the segment's header."""
+    df = pd.DataFrame({"feature1": [1, 0, 3], "feature2": ["a", "", "c"], "target": [0.5, 0.0, np.nan]})
+    segment = dataset_to_shared_memory(TabularDataset(df), segment_name)
+    segment.close()
+
+    loaded = dataset_from_shared_memory(TabularDataset, segment_name)
+    pd.testing.assert_frame_equal(loaded.to_pandas(), df)
+
+
+def test_shared_memory_table_is_not_copied(segment_name):
+    """Test that Arrow tables mapped from shared memory use the segment's memory in place."""
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.int64)})
+    writer = dataset_to_shared_memory(TabularDataset(df), segment_name)
+
+    table, segment = table_from_shared_memory(segment_name)
+    values = table.column("x").to_numpy()
+    assert values.sum() == df["x"].sum()
+    # Writes to the segment are visible through the table, so the table refers to the same memory
+    writer.buf[:] = bytes(writer.size)
+    assert values.sum() == 0
+
+    del table, values
+    segment.close()
+    writer.close()
+
+
+def test_shared_memory_rejects_foreign_segments(segment_name):
+    """Test that segments not written by dataset_to_shared_memory are rejected rather than misread."""
+    segment = shared_memory.SharedMemory(name=segment_name, create=True, size=4096)
+    segment.buf[:4] = b"data"
+    with pytest.raises(ValueError, match="does not hold a dataset"):
+        dataset_from_shared_memory(TabularDataset, segment_name)
+    with pytest.raises(ValueError, match="does not hold a dataset"):
+        table_from_shared_memory(segment_name)
+    segment.close()
+
+
+def test_shared_memory_errors_are_not_hidden(segment_name):
+    """Test that failures while buffers of a segment are in use are raised, rather than an error closing it."""
+    segment = dataset_to_shared_memory(TabularDataset(pd.DataFrame({"x": [1, 2, 3]})), segment_name)
+    # Corrupt the Arrow stream, keeping the header
+    segment.buf[_SHM_PAYLOAD_OFFSET:] = b"\xff" * (segment.size - _SHM_PAYLOAD_OFFSET)
+    with pytest.raises(OSError, match="Invalid IPC"):
+        table_from_shared_memory(segment_name)
+    with pytest.raises(OSError, match="Invalid IPC"):
+        dataset_from_shared_memory(TabularDataset, segment_name)
+    segment.close()
+    segment.unlink()
+
+    def failing_write(sink, table):
+        if isinstance(sink, pa.FixedSizeBufferWriter):
+            raise RuntimeError("write failed")
+        _write_arrow_stream(sink, table)
+
+    with patch("plexe.internal.common.utils.dataset_storage._write_arrow_stream", new=failing_write):
+        with pytest.raises(RuntimeError, match="write failed"):
+            dataset_to_shared_memory(TabularDataset(pd.DataFrame({"x": [1, 2, 3]})), segment_name)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segment_name)
@@ -0,0 +1,89 @@
+"""
+Tests for the compiled batch schema validator.
+
+This module verifies:
+1. Column-wise checks of types, coercibility and nullability, with the positions of invalid rows.
+2. Fallback validation for types without a column check.
+3. Caching of compiled validators and of schemas created from dictionaries.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import create_model
+
+from plexe.exceptions import SchemaValidationError
+from plexe.internal.common.utils.pydantic_utils import map_to_basemodel
+from plexe.internal.common.utils.schema_validation import compile_validator
+
+
+@pytest.fixture
+def validator():
+    return compile_validator(map_to_basemodel("in", {"age": int, "score": float, "name": str, "active": bool}))
+
+
+def test_valid_data_passes(validator):
+    data = pd.DataFrame(
+        {
+            "age": [30, 40],
+            "score": [0.5, np.nan],
+            "name": ["a", "b"],
+            "active": [True, False],
+            "extra": [object(), None],
+        }
+    )
+    validator.validate(data)
+
+
+def test_coercible_values_pass(validator):
+    data = pd.DataFrame({"age": [30.0, "41"], "score": [1, "2.5"], "name": ["a", "b"], "active": ["yes", 0]})
+    assert validator.find_failures(data) == {}
+
+
+def test_invalid_rows_are_reported(validator):
+    data = pd.DataFrame(
+        {
+            "age": [30.0, 30.5, None, 7.0],
+            "score": ["1.0", "x", 2.0, 3.0],
+            "name": ["a", 1, "c", "d"],
+            "active": [1, 2, 0, 1],
+        }
+    )
+    failures = validator.find_failures(data)
+    assert {name: rows.tolist() for name, rows in failures.items()} == {
+        "age": [1, 2],
+        "score": [1],
+        "name": [1],
+        "active": [1],
+    }
+
+    with pytest.raises(SchemaValidationError, match="'age' \\(2 invalid values; rows \\[1, 2\\]\\)") as error:
+        validator.validate(data)
+    assert error.value.failures["name"] == [1]
+
+
+def test_missing_and_optional_columns():
+    validator = compile_validator(create_model("In", x=(int, ...), y=(Optional[int], None)))
+    assert validator.find_failures(pd.DataFrame({"x": [1, 2]})) == {}
+    assert validator.find_failures(pd.DataFrame({"x": [1], "y": [None]})) == {}
+    assert validator.find_failures(pd.DataFrame({"y": [1, 2]}))["x"].tolist() == [0, 1]
+
+
+def test_fallback_for_other_types():
+    validator = compile_validator(create_model("In", tags=(List[str], ...)))
+    failures = validator.find_failures(pd.DataFrame({"tags": [["a"], "not a list", ["b", "c"]]}))
+    assert failures["tags"].tolist() == [1]
+
+
+def test_large_batches_are_validated_column_wise(validator):
+    n = 1_000_000
+    data = pd.DataFrame({"age": np.arange(n), "score": np.ones(n), "name": ["x"] * n, "active": np.zeros(n, bool)})
+    assert validator.find_failures(data) == {}
+
+
+def test_compiled_validators_and_schemas_are_cached():
+    schema = map_to_basemodel("in", {"x": int})
+    assert map_to_basemodel("in", {"x": "int"}) is schema
+    assert compile_validator(schema) is compile_validator(create_model("Other", x=(int, ...)))
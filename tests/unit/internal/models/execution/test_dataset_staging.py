@@ -0,0 +1,93 @@
+"""
+Tests for staging datasets once per build and linking them into execution directories.
+
+This module verifies:
+1. Fingerprinting datasets by content, including columns of unhashable objects.
+2. Writing each distinct dataset to the staging directory once, as a read-only parquet file.
+3. Linking staged datasets into execution directories, and removing links without touching the staged files.
+4. Staging datasets as uncompressed Arrow IPC files that can be memory-mapped.
+5. Removing the staging directory at the end of a build, and releasing staging locks.
+"""
+
+import os
+
+import pandas as pd
+import pyarrow.feather as feather
+import pytest
+from unittest.mock import patch
+
+from plexe.internal.common.datasets.tabular import TabularDataset
+from plexe.internal.models.execution import dataset_staging
+from plexe.internal.models.execution.dataset_staging import (
+    STAGING_DIR,
+    clear_staging,
+    dataset_file_name,
+    dataset_fingerprint,
+    stage_dataset,
+    stage_datasets,
+)
+
+
+@pytest.fixture
+def dataset():
+    return TabularDataset(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+
+
+def test_fingerprint_depends_on_content(dataset):
+    same = TabularDataset(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+    assert dataset_fingerprint(dataset) == dataset_fingerprint(same)
+
+    assert dataset_fingerprint(dataset) != dataset_fingerprint(TabularDataset(pd.DataFrame({"a": [1, 2, 4]})))
+    assert dataset_fingerprint(TabularDataset(pd.DataFrame({"a": [1, 2, 3]}))) != dataset_fingerprint(
+        TabularDataset(pd.DataFrame({"a": [1.0, 2.0, 3.0]}))
+    )
+    assert dataset_fingerprint(TabularDataset(pd.DataFrame({"a": [[1], [2]]})))
+
+
+def test_dataset_is_staged_once(dataset, tmp_path):
+    staged = stage_dataset(dataset, tmp_path / "staging")
+
+    assert pd.read_parquet(staged).equals(dataset.to_pandas())
+    assert staged.stat().st_mode & 0o222 == 0
+    with patch("pyarrow.parquet.write_table") as mock_write_table:
+        assert stage_dataset(TabularDataset(dataset.to_pandas()), tmp_path / "staging") == staged
+    mock_write_table.assert_not_called()
+
+
+def test_datasets_are_linked_into_execution_directories(dataset, tmp_path):
+    staging_dir = tmp_path / "staging"
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    [first_file] = stage_datasets({"train": dataset}, staging_dir, first)
+    [second_file] = stage_datasets({"train": dataset}, staging_dir, second)
+
+    assert first_file == first / "train.parquet" and second_file == second / "train.parquet"
+    assert os.path.samefile(first_file, second_file)
+    first_file.unlink()
+    assert pd.read_parquet(second_file).equals(dataset.to_pandas())
+    assert len(list(staging_dir.glob("*.parquet"))) == 1
+
+
+def test_arrow_format(dataset, tmp_path):
+    [path] = stage_datasets({"train": dataset}, tmp_path / "staging", tmp_path, format="arrow")
+
+    assert path.name == dataset_file_name("train", "arrow") == "train.arrow"
+    assert feather.read_table(path, memory_map=True).to_pandas().equals(dataset.to_pandas())
+    with pytest.raises(ValueError, match="Unknown dataset format"):
+        dataset_file_name("train", "csv")
+
+
+def test_clear_staging(dataset, tmp_path):
+    execution_dir = tmp_path / "execution"
+    execution_dir.mkdir()
+    [path] = stage_datasets({"train": dataset}, tmp_path / STAGING_DIR, execution_dir)
+    assert not dataset_staging._staging
+
+    clear_staging(tmp_path)
+
+    assert not (tmp_path / STAGING_DIR).exists()
+    # Hard links keep the data of executions that are still running
+    assert pd.read_parquet(path).equals(dataset.to_pandas())
+    clear_staging(tmp_path)
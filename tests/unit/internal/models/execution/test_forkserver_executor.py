@@ -0,0 +1,92 @@
+"""
+Tests for executing code in processes forked from a warm worker.
+
+This module verifies:
+1. Running scripts as __main__ in their own working directory, with their output captured.
+2. Reporting scripts that fail or exit with an error code.
+3. Killing scripts that exceed the timeout.
+4. Mapping allowed packages to the modules preloaded by the worker.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from plexe.internal.common.datasets.tabular import TabularDataset
+from plexe.internal.models.execution import forkserver_executor
+from plexe.internal.models.execution.forkserver_executor import ForkServerExecutor, preload_modules
+
+pytestmark = pytest.mark.skipif(not forkserver_executor.is_available(), reason="forkserver is not available")
+
+
+@pytest.fixture
+def run(tmp_path):
+    def run(code: str, timeout: int = 30):
+        executor = ForkServerExecutor(
+            execution_id="test",
+            code=code,
+            working_dir=tmp_path,
+            datasets={"training_data": TabularDataset(pd.DataFrame({"x": [1, 2, 3]}))},
+            timeout=timeout,
+            code_execution_file_name="run.py",
+        )
+        return executor, executor.run()
+
+    return run
+
+
+def test_script_runs_in_forked_worker(run, tmp_path):
+    code = (
+        "import pandas as pd\n"
+        "assert __name__ == '__main__'\n"
+        "print('cwd:', Path.cwd().name, 'parent:', os.getppid() != {pid})\n"
+        "Path('model.txt').write_text('model')\n"
+        "print('Performance:', pd.read_parquet('training_data.parquet')['x'].sum())\n"
+    ).format(pid=os.getpid())
+    executor, result = run(code)
+
+    assert result.exception is None
+    assert "cwd: test parent: True" in result.term_out[0]
+    assert result.performance == 6
+    assert result.model_artifacts == [str(tmp_path / "test" / "model.txt")]
+    assert executor.worker.exitcode == 0
+
+
+def test_script_failure(run):
+    _, result = run("print('before')\nraise ValueError('broken script')")
+    assert isinstance(result.exception, RuntimeError)
+    assert "ValueError: broken script" in str(result.exception)
+    assert result.term_out == ["before\n"]
+
+    _, result = run("sys.exit(3)")
+    assert "exited with code 3" in str(result.exception)
+
+
+def test_script_timeout(run):
+    executor, result = run("import time\nprint('started', flush=True)\ntime.sleep(30)", timeout=1)
+
+    assert isinstance(result.exception, TimeoutError)
+    assert not executor.worker.is_alive()
+    assert result.term_out == ["started\n"]
+
+
+def test_preload_modules():
+    assert preload_modules(["scikit-learn", "sklearn", "pandas", "not-a-package"]) == ["sklearn", "pandas"]
+
+
+def test_executor_class_with_warm_workers():
+    from plexe.internal.models.tools.execution import _get_executor_class
+
+    with patch("plexe.internal.models.tools.execution.config") as config:
+        config.execution.warm_workers = True
+        assert _get_executor_class(distributed=False) == ForkServerExecutor
+
+
+def test_working_directory_is_isolated(run, tmp_path):
+    _, result = run("print('Performance:', len(list(Path('.').iterdir())))")
+    # Only the script and the dataset are in the execution's working directory
+    assert result.performance == 2
+    assert Path(tmp_path / "test").is_dir()
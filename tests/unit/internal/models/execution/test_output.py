@@ -0,0 +1,56 @@
+"""
+Tests for the streaming capture of execution output.
+
+This module verifies:
+1. Keeping the head and tail of long output, with a marker for what was dropped.
+2. Forwarding each line to the callback as it is read, and decoding binary pipes.
+3. Callback errors not interrupting the capture.
+"""
+
+import io
+
+import pytest
+
+from plexe.internal.models.execution.output import BoundedOutput, OutputCapture
+
+
+def test_bounded_output_keeps_head_and_tail():
+    output = BoundedOutput(head_chars=5, tail_chars=5)
+    for i in range(10):
+        output.append(f"{i}" * 3)
+
+    assert output.dropped == 20
+    assert output.text() == "00011\n[... 20 characters omitted ...]\n88999"
+
+
+def test_bounded_output_within_limits():
+    output = BoundedOutput(head_chars=5, tail_chars=5)
+    output.append("abc")
+    output.append("defg")
+
+    assert output.dropped == 0
+    assert output.text() == "abcdefg"
+    with pytest.raises(ValueError):
+        BoundedOutput(head_chars=-1, tail_chars=5)
+
+
+def test_capture_forwards_lines():
+    lines = []
+    capture = OutputCapture(
+        io.StringIO("loss=0.5\nloss=0.4\n"),
+        io.BytesIO("warning: é\n".encode("utf-8")),
+        on_output=lambda stream, line: lines.append((stream, line)),
+    )
+
+    assert capture.result() == ("loss=0.5\nloss=0.4\n", "warning: é\n")
+    assert sorted(lines) == [("stderr", "warning: é\n"), ("stdout", "loss=0.4\n"), ("stdout", "loss=0.5\n")]
+
+
+def test_capture_ignores_callback_errors():
+    def on_output(stream, line):
+        raise RuntimeError("callback failed")
+
+    capture = OutputCapture(io.StringIO("a\nb\n"), io.StringIO(""), on_output=on_output, head_chars=1, tail_chars=2)
+
+    assert capture.wait(timeout=5)
+    assert capture.result() == ("a\n[... 1 characters omitted ...]\nb\n", "")
@@ -5,13 +5,15 @@ These tests validate the functionality of the following:
 - RedirectQueue: Ensures that stdout and stderr redirection to a queue behaves as expected.
 - ProcessExecutor: Tests execution of Python code in an isolated process, including handling of:
   - Successful execution.
-  - Timeouts.
+  - Timeouts, keeping the output produced before the process was killed.
   - Exceptions raised during execution.
   - Dataset handling and working directory creation.
+  - Staging each dataset once and linking it into every execution's working directory.
 
 The tests use pytest as the test runner and employ mocking to isolate external dependencies.
 """
 
+import io
 import os
 import shutil
 import subprocess
@@ -20,10 +22,10 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
-import pyarrow
 import pytest
 
 from plexe.internal.common.datasets.tabular import TabularDataset
+from plexe.internal.models.execution.dataset_staging import STAGING_DIR
 from plexe.internal.models.execution.executor import ExecutionResult
 from plexe.internal.models.execution.process_executor import ProcessExecutor
 
@@ -33,6 +35,7 @@ class TestProcessExecutor:
         self.execution_id = "test_execution"
         self.code = "print('Hello, World!')"
         self.working_dir = Path(os.getcwd()) / self.execution_id
+        self.staging_dir = Path(os.getcwd()) / STAGING_DIR
         self.timeout = 5
         self.datasets = {"training_data": TabularDataset(pd.DataFrame({"col1": [1, 2], "col2": [3, 4]}))}
         self.process_executor = ProcessExecutor(
@@ -45,25 +48,22 @@ class TestProcessExecutor:
         )
 
     def teardown_method(self):
-        if self.working_dir.exists():
-            shutil.rmtree(self.working_dir, ignore_errors=True)
+        for directory in [self.working_dir, self.staging_dir]:
+            if directory.exists():
+                shutil.rmtree(directory, ignore_errors=True)
 
     def test_constructor_creates_working_directory(self):
         assert self.working_dir.exists()
 
-    @patch("pyarrow.parquet.write_table")
-    def test_run_successful_execution(self, mock_write_table):
+    def test_run_successful_execution(self):
         mock_process = MagicMock()
-        mock_process.communicate.return_value = ("Performance: 0.5", "")
+        mock_process.stdout = io.StringIO("Performance: 0.5")
+        mock_process.stderr = io.StringIO("")
         mock_process.returncode = 0
 
         with patch("subprocess.Popen", return_value=mock_process) as mock_popen:
             result = self.process_executor.run()
 
-        dataset_file = self.working_dir / "training_data.parquet"
-        mock_write_table.assert_called_once_with(
-            pyarrow.Table.from_pandas(self.datasets["training_data"].to_pandas()), dataset_file
-        )
         mock_popen.assert_called_once_with(
             [sys.executable, str(self.working_dir / "run.py")],
             stdout=subprocess.PIPE,
@@ -78,7 +78,9 @@ class TestProcessExecutor:
     @patch("subprocess.Popen")
     def test_run_timeout(self, mock_popen):
         mock_process = MagicMock()
-        mock_process.communicate.side_effect = subprocess.TimeoutExpired(cmd="test", timeout=self.timeout)
+        mock_process.stdout = io.StringIO("Epoch 1: loss=0.9\n")
+        mock_process.stderr = io.StringIO("")
+        mock_process.wait.side_effect = [subprocess.TimeoutExpired(cmd="test", timeout=self.timeout), None]
 
         with patch("subprocess.Popen", return_value=mock_process):
             result = self.process_executor.run()
@@ -86,11 +88,26 @@ class TestProcessExecutor:
         assert isinstance(result, ExecutionResult)
         assert isinstance(result.exception, TimeoutError)
         assert result.exec_time == self.timeout
+        mock_process.kill.assert_called()
+        assert result.term_out == ["Epoch 1: loss=0.9\n"]
+
+    def test_run_timeout_keeps_partial_output(self):
+        lines = []
+        self.process_executor.code = "import time\nprint('started', flush=True)\ntime.sleep(60)"
+        self.process_executor.timeout = 1
+        self.process_executor.on_output = lambda stream, line: lines.append((stream, line))
+
+        result = self.process_executor.run()
+
+        assert isinstance(result.exception, TimeoutError)
+        assert result.term_out == ["started\n"]
+        assert lines == [("stdout", "started\n")]
 
     @patch("subprocess.Popen")
     def test_run_exception(self, mock_popen):
         mock_process = MagicMock()
-        mock_process.communicate.return_value = ("", "RuntimeError: Something went wrong")
+        mock_process.stdout = io.StringIO("")
+        mock_process.stderr = io.StringIO("RuntimeError: Something went wrong")
         mock_process.returncode = 1
 
         with patch("subprocess.Popen", return_value=mock_process):
@@ -100,13 +117,36 @@ class TestProcessExecutor:
         assert isinstance(result.exception, RuntimeError)
         assert "Something went wrong" in str(result.exception)
 
-    @patch("pyarrow.parquet.write_table")
-    def test_dataset_written_to_file(self, mock_write_table):
-        self.process_executor.run()
-        dataset_file = self.working_dir / "training_data.parquet"
-        mock_write_table.assert_called_once_with(
-            pyarrow.Table.from_pandas(self.datasets["training_data"].to_pandas()), dataset_file
+    def test_dataset_written_to_file(self):
+        code = "import pandas as pd\nprint('Performance:', pd.read_parquet('training_data.parquet')['col2'].sum())"
+        self.process_executor.code = code
+        result = self.process_executor.run()
+
+        assert result.performance == 7
+        # The execution's link is removed, but the staged file is kept for later executions
+        assert not (self.working_dir / "training_data.parquet").exists()
+        assert len(list(self.staging_dir.glob("*.parquet"))) == 1
+
+    def test_dataset_staged_once(self):
+        self.process_executor.code = (
+            "import pandas as pd\nprint('Performance:', len(pd.read_parquet('training_data.parquet')))"
+        )
+        assert self.process_executor.run().performance == 2
+
+        executor = ProcessExecutor(
+            execution_id="test_execution_2",
+            code=self.process_executor.code,
+            working_dir=Path(os.getcwd()),
+            datasets={"training_data": TabularDataset(pd.DataFrame({"col1": [1, 2], "col2": [3, 4]}))},
+            timeout=self.timeout,
+            code_execution_file_name="run.py",
         )
+        try:
+            with patch("pyarrow.parquet.write_table") as mock_write_table:
+                assert executor.run().performance == 2
+            mock_write_table.assert_not_called()
+        finally:
+            shutil.rmtree(executor.working_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+"""
+Tests for the concurrent execution scheduler and the batch execution tools.
+
+This module verifies:
+1. Deriving the concurrency limit from the CPUs, and the configured maximum.
+2. Running executions concurrently, up to the limit, with results available as each finishes.
+3. Holding executions back while memory is short, unless none are running.
+4. Submitting a batch of candidates and collecting their results incrementally.
+5. Registering the artifacts of concurrent candidates that write files with the same names.
+"""
+
+import threading
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from plexe.internal.models.execution import scheduler as scheduler_module
+from plexe.internal.models.execution.scheduler import ExecutionScheduler
+
+
+def test_capacity_from_cpus():
+    with patch.object(scheduler_module, "available_cpus", return_value=32):
+        assert ExecutionScheduler(cpus_per_execution=4).capacity == 8
+        assert ExecutionScheduler(cpus_per_execution=4, max_concurrent=3).capacity == 3
+    with patch.object(scheduler_module, "available_cpus", return_value=2):
+        assert ExecutionScheduler(cpus_per_execution=4).capacity == 1
+    with pytest.raises(ValueError):
+        ExecutionScheduler(cpus_per_execution=-1)
+    with pytest.raises(ValueError):
+        ExecutionScheduler(cpus_per_execution=0)
+    with pytest.raises(ValueError):
+        ExecutionScheduler(memory_per_execution=0)
+
+
+def test_executions_run_concurrently_up_to_capacity():
+    with patch.object(scheduler_module, "available_cpus", return_value=8):
+        scheduler = ExecutionScheduler(cpus_per_execution=4)
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def execution(duration):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(duration)
+        with lock:
+            running[0] -= 1
+        return duration
+
+    futures = [scheduler.submit(execution, duration) for duration in [0.5, 0.1, 0.1, 0.1]]
+    finished = [future.result() for future in as_completed(futures)]
+    scheduler.shutdown()
+
+    assert peak[0] == 2
+    # Short executions finish while the long one is still running
+    assert finished[-1] == 0.5
+
+
+def test_executions_wait_for_memory():
+    with patch.object(scheduler_module, "available_cpus", return_value=8):
+        scheduler = ExecutionScheduler(cpus_per_execution=4, memory_per_execution=1024)
+    release = threading.Event()
+
+    with patch.object(scheduler_module, "available_memory", return_value=0):
+        # The first execution always starts, however little memory is available
+        first = scheduler.submit(release.wait)
+        second = scheduler.submit(lambda: "second")
+        time.sleep(0.2)
+        assert scheduler.running == 1 and not second.done()
+        release.set()
+        assert second.result(timeout=5) == "second"
+    assert first.result()
+    scheduler.shutdown()
+
+
+def test_running_executions_reserve_memory():
+    with patch.object(scheduler_module, "available_cpus", return_value=32):
+        scheduler = ExecutionScheduler(cpus_per_execution=4, memory_per_execution=1024)
+    release = threading.Event()
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def execution():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        release.wait()
+        with lock:
+            running[0] -= 1
+
+    # Memory for 3 executions, none of which has allocated any yet
+    with patch.object(scheduler_module, "available_memory", return_value=3 * 1024):
+        futures = [scheduler.submit(execution) for _ in range(8)]
+        time.sleep(0.5)
+        assert scheduler.capacity == 8
+        assert scheduler.running == 3
+        release.set()
+        for future in futures:
+            future.result(timeout=10)
+    scheduler.shutdown()
+    assert peak[0] == 3
+
+
+def test_batch_tools_collect_results_as_they_finish():
+    from plexe.internal.models.tools import execution
+
+    def fake_execute(node_id, code, *args):
+        time.sleep(float(code))
+        return {"success": True, "performance": None, "exception": None, "model_artifact_names": []}
+
+    with patch.object(scheduler_module, "available_cpus", return_value=2):
+        scheduler = ExecutionScheduler(cpus_per_execution=1)
+    with (
+        patch.object(execution, "_execute_training_code", side_effect=fake_execute),
+        patch.object(execution, "get_scheduler", return_value=scheduler),
+    ):
+        submit, collect = execution.get_batch_executor_tools()
+        batch = submit(
+            candidates=[{"node_id": "slow", "code": "0.5"}, {"node_id": "fast", "code": "0"}],
+            working_dir="unused",
+            dataset_names=[],
+            timeout=10,
+            metric_to_optimise_name="accuracy",
+            metric_to_optimise_comparison_method="HIGHER_IS_BETTER",
+        )
+        first = collect(batch_id=batch["batch_id"], wait_for_all=False)
+        assert [result["node_id"] for result in first["results"]] == ["fast"] and first["pending"] == 1
+
+        rest = collect(batch_id=batch["batch_id"], wait_for_all=True)
+        assert [result["node_id"] for result in rest["results"]] == ["slow"] and rest["pending"] == 0
+        with pytest.raises(ValueError, match="Unknown batch"):
+            collect(batch_id=batch["batch_id"], wait_for_all=True)
+    scheduler.shutdown()
+
+
+def test_concurrent_candidates_with_same_artifact_names(tmp_path):
+    import pandas as pd
+
+    from plexe.internal.common.datasets.interface import TabularConvertible
+    from plexe.internal.common.datasets.tabular import TabularDataset
+    from plexe.internal.common.registries.objects import ObjectRegistry
+    from plexe.internal.models.entities.artifact import Artifact
+    from plexe.internal.models.tools import execution
+
+    registry = ObjectRegistry()
+    registry.register(TabularConvertible, "scheduler_test_data", TabularDataset(pd.DataFrame({"x": [1, 2]})))
+    code = "open('model.pkl', 'w').write('{}')\nprint('Performance: {}')"
+
+    with patch.object(scheduler_module, "available_cpus", return_value=2):
+        scheduler = ExecutionScheduler(cpus_per_execution=1)
+    args = (str(tmp_path), ["scheduler_test_data"], 30, "accuracy", "HIGHER_IS_BETTER", False)
+    try:
+        futures = [
+            scheduler.submit(execution._execute_training_code, node_id, code.format(value, value), *args)
+            for node_id, value in [("first", 0.5), ("second", 0.7)]
+        ]
+        results = [future.result() for future in futures]
+        scheduler.shutdown()
+
+        assert all(result["success"] for result in results), results
+        names = [name for result in results for name in result["model_artifact_names"]]
+        assert len(set(names)) == 2
+        assert all(name.endswith("/model.pkl") for name in names)
+        artifacts = registry.get_multiple(Artifact, names)
+        assert sorted(Path(artifact.path).read_text() for artifact in artifacts.values()) == ["0.5", "0.7"]
+    finally:
+        registry.clear()
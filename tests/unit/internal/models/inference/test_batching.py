@@ -0,0 +1,115 @@
+"""
+Tests for the MicroBatcher.
+
+This module verifies:
+1. Coalescing of concurrent requests into batches bounded by the maximum batch size.
+2. Per-request results and isolation of failing requests within a batch.
+3. Batch size statistics.
+4. Closing the batcher fails queued requests instead of leaving their callers waiting.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from plexe.internal.models.inference.batching import MicroBatcher
+
+
+def double(records):
+    return [{"y": r["x"] * 2} for r in records]
+
+
+def test_concurrent_requests_are_batched():
+    batch_sizes = []
+
+    def predict(records):
+        batch_sizes.append(len(records))
+        return double(records)
+
+    batcher = MicroBatcher(predict, max_batch_size=8, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit({"x": i}) for i in range(20)))
+
+    results = asyncio.run(run())
+    assert results == [{"y": i * 2} for i in range(20)]
+    assert max(batch_sizes) == 8
+    assert sum(batch_sizes) == 20
+    stats = batcher.stats()
+    assert stats["requests"] == 20
+    assert stats["batches"] == len(batch_sizes)
+    assert stats["batch_size_histogram"][8] >= 2
+    batcher.close()
+
+
+def test_scoring_runs_off_the_event_loop():
+    threads = []
+
+    def predict(records):
+        threads.append(threading.current_thread())
+        return double(records)
+
+    batcher = MicroBatcher(predict, max_batch_size=4, max_wait_ms=0)
+    assert asyncio.run(batcher.submit({"x": 1})) == {"y": 2}
+    assert threads[0] is not threading.main_thread()
+    batcher.close()
+
+
+def test_failing_request_does_not_fail_its_batch():
+    def predict(records):
+        if any(r["x"] < 0 for r in records):
+            raise ValueError("negative input")
+        return double(records)
+
+    batcher = MicroBatcher(predict, max_batch_size=4, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit({"x": x}) for x in [1, -1, 2]), return_exceptions=True)
+
+    ok, failed, ok_again = asyncio.run(run())
+    assert ok == {"y": 2} and ok_again == {"y": 4}
+    assert isinstance(failed, ValueError)
+    assert batcher.stats()["failed_batches"] >= 1
+    batcher.close()
+
+
+def test_batcher_can_be_reused_across_event_loops():
+    batcher = MicroBatcher(double, max_wait_ms=0)
+    assert asyncio.run(batcher.submit({"x": 1})) == {"y": 2}
+    assert asyncio.run(batcher.submit({"x": 2})) == {"y": 4}
+    batcher.close()
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        MicroBatcher(double, max_batch_size=0)
+
+
+def test_close_fails_queued_requests():
+    started = threading.Event()
+    release = threading.Event()
+
+    def predict(records):
+        started.set()
+        release.wait(5)
+        return double(records)
+
+    batcher = MicroBatcher(predict, max_batch_size=1, max_wait_ms=0, max_concurrency=1)
+
+    async def run():
+        tasks = [asyncio.ensure_future(batcher.submit({"x": x})) for x in range(3)]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        # The first request is being scored, and its task is referenced by the batcher until it finishes
+        assert len(batcher._scoring) == 1
+        batcher.close()
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 5)
+        assert not batcher._scoring
+        return results
+
+    scored, *queued = asyncio.run(run())
+    assert scored == {"y": 0}
+    assert all(isinstance(e, RuntimeError) and "closed" in str(e) for e in queued)
+    with pytest.raises(RuntimeError):
+        asyncio.run(batcher.submit({"x": 1}))
@@ -0,0 +1,67 @@
+"""
+Tests for the PredictionCache.
+
+This module verifies:
+1. Canonical keys that do not depend on the order of the fields.
+2. LRU eviction by entry count and by approximate size, and expiry of entries after their TTL.
+3. Hit and miss statistics, and invalidation when the model identifier changes.
+"""
+
+import time
+
+import pytest
+
+from plexe.internal.models.inference.cache import PredictionCache, record_key
+
+
+def test_record_key_is_canonical():
+    assert record_key({"a": 1, "b": "x"}) == record_key({"b": "x", "a": 1})
+    assert record_key({"a": 1}) != record_key({"a": 2})
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = PredictionCache(max_entries=2)
+    keys = [record_key({"x": i}) for i in range(3)]
+    cache.put_many("m", keys[:2], [{"y": 0}, {"y": 1}])
+    cache.get_many("m", [keys[0]])  # keys[1] is now the least recently used
+    cache.put_many("m", [keys[2]], [{"y": 2}])
+
+    assert cache.get_many("m", keys) == [{"y": 0}, None, {"y": 2}]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_size_bound_is_enforced():
+    cache = PredictionCache(max_bytes=2_000)
+    keys = [record_key({"x": i}) for i in range(100)]
+    cache.put_many("m", keys, [{"y": "v" * 10} for _ in keys])
+    stats = cache.stats()
+    assert 0 < stats["entries"] < 100
+    assert stats["bytes"] <= 2_000
+
+
+def test_entries_expire_after_ttl():
+    cache = PredictionCache(max_entries=10, ttl=0.05)
+    key = record_key({"x": 1})
+    cache.put_many("m", [key], [{"y": 1}])
+    assert cache.get_many("m", [key]) == [{"y": 1}]
+    time.sleep(0.1)
+    assert cache.get_many("m", [key]) == [None]
+    assert cache.stats()["entries"] == 0
+
+
+def test_statistics_and_identifier_invalidation():
+    cache = PredictionCache(max_entries=10)
+    key = record_key({"x": 1})
+    cache.put_many("m1", [key], [{"y": 1}])
+    assert cache.get_many("m1", [key, record_key({"x": 2})]) == [{"y": 1}, None]
+    assert cache.get_many("m2", [key]) == [None]
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 0)
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        PredictionCache()
+    with pytest.raises(ValueError):
+        PredictionCache(max_entries=10, ttl=0)
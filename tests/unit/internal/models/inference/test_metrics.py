@@ -0,0 +1,117 @@
+"""
+Tests for the inference metrics.
+
+This module verifies:
+1. Recording of calls, errors, rows and latency percentiles, including across threads.
+2. Merging of the counters of threads that have exited.
+3. Prometheus text rendering and periodic JSON snapshots.
+4. Per-call overhead of the recording path.
+"""
+
+import json
+import threading
+import time
+import uuid
+
+import pytest
+
+from plexe.internal.models.inference.metrics import (
+    InferenceMetrics,
+    SnapshotWriter,
+    get_inference_metrics,
+    prometheus_text,
+)
+
+
+def test_calls_errors_and_rows_are_recorded():
+    metrics = InferenceMetrics("model-a")
+    for _ in range(9):
+        metrics.finish(metrics.start("predict_batch"), rows=100)
+    metrics.finish(metrics.start("predict_batch"), error=True)
+    metrics.start("predict")
+
+    snapshot = metrics.snapshot()
+    batch = snapshot["paths"]["predict_batch"]
+    assert (batch["calls"], batch["errors"], batch["rows"]) == (10, 1, 900)
+    assert batch["mean_rows_per_second_since_start"] > 0
+    assert snapshot["paths"]["predict"]["in_flight"] == 1
+    assert snapshot["in_flight"] == 1
+
+
+def test_latency_percentiles():
+    metrics = InferenceMetrics("model-b")
+    for latency in [1_000_000] * 90 + [100_000_000] * 10:  # 1ms and 100ms
+        counters, started = metrics.start("predict")
+        metrics.finish((counters, started - latency))
+
+    latency = metrics.snapshot()["paths"]["predict"]["latency_seconds"]
+    assert 0.001 <= latency["p50"] < 0.00125
+    assert 0.1 <= latency["p99"] < 0.125
+    assert latency["p50"] <= latency["p90"] <= latency["p99"]
+
+
+def test_counts_from_all_threads_are_combined():
+    metrics = InferenceMetrics("model-c")
+
+    def record():
+        for _ in range(1000):
+            metrics.finish(metrics.start("predict"), rows=1)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.snapshot()["paths"]["predict"]["calls"] == 8000
+
+
+def test_counters_of_exited_threads_are_merged():
+    metrics = InferenceMetrics("model-d")
+
+    # One short-lived thread per request, as in the HTTP server
+    for _ in range(200):
+        thread = threading.Thread(target=lambda: metrics.finish(metrics.start("predict"), rows=1))
+        thread.start()
+        thread.join()
+
+    assert not metrics._shards
+    assert metrics.snapshot()["paths"]["predict"]["rows"] == 200
+
+
+def test_prometheus_text():
+    metrics = get_inference_metrics(f"model-{uuid.uuid4()}")
+    metrics.finish(metrics.start("predict"), rows=1)
+    text = prometheus_text([metrics])
+
+    assert "# TYPE plexe_inference_latency_seconds histogram" in text
+    assert f'plexe_inference_latency_seconds_count{{model="{metrics.model_id}",path="predict"}} 1' in text
+    assert f'plexe_inference_rows_total{{model="{metrics.model_id}",path="predict"}} 1' in text
+    assert 'le="+Inf"} 1' in text
+    assert metrics.model_id in prometheus_text()
+
+
+def test_snapshot_writer(tmp_path):
+    metrics = get_inference_metrics(f"model-{uuid.uuid4()}")
+    metrics.finish(metrics.start("predict"), rows=1)
+    path = tmp_path / "metrics.json"
+
+    with SnapshotWriter(str(path), interval=0.01):
+        time.sleep(0.05)
+    snapshot = json.loads(path.read_text())
+    assert metrics.model_id in [model["model_id"] for model in snapshot["models"]]
+
+    with pytest.raises(ValueError):
+        SnapshotWriter(str(path), interval=0)
+
+
+def test_recording_overhead_is_small():
+    metrics = InferenceMetrics("model-d")
+    metrics.finish(metrics.start("predict"))
+    calls = 100_000
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.finish(metrics.start("predict"), rows=1)
+    per_call = (time.perf_counter() - start) / calls
+    # Typically well under a microsecond; the bound is loose to avoid flakiness on busy machines
+    assert per_call < 5e-6
@@ -0,0 +1,103 @@
+"""
+Tests for the PredictorPool.
+
+This module verifies:
+1. Sharded batch prediction across forked workers, with results in input order.
+2. Mapping over many batches, and error propagation from the workers.
+3. Lifecycle handling: unready models, closed pools, and workers replaced after dying.
+"""
+
+import os
+from typing import List
+
+import pandas as pd
+import pytest
+
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.inference.pool import PredictorPool
+from plexe.internal.models.interfaces.predictor import Predictor
+from plexe.models import Model
+
+
+class PidPredictor(Predictor):
+    initialisations = 0
+
+    def __init__(self, artifacts: List[Artifact]):
+        PidPredictor.initialisations += 1
+
+    def predict(self, inputs: dict) -> dict:
+        return self.predict_batch(pd.DataFrame([inputs])).to_dict(orient="records")[0]
+
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        if (inputs["x"] < 0).any():
+            raise ValueError("negative input")
+        return pd.DataFrame({"y": inputs["x"] + 1, "pid": os.getpid()})
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = Model(intent="increment x", input_schema={"x": int}, output_schema={"y": int, "pid": int})
+    model.predictor = PidPredictor([])
+    model.state = ModelState.READY
+    return model
+
+
+def test_predict_batch_shards_across_workers(model):
+    initialisations = PidPredictor.initialisations
+    with PredictorPool(model, workers=2, shard_size=10) as pool:
+        result = pool.predict_batch(pd.DataFrame({"x": range(100)}))
+
+    assert result["y"].tolist() == list(range(1, 101))
+    assert os.getpid() not in set(result["pid"])
+    # The predictor was initialised once in the parent, not once per worker
+    assert PidPredictor.initialisations == initialisations
+
+
+def test_small_batches_are_scored_in_process(model):
+    with PredictorPool(model, workers=2, shard_size=10) as pool:
+        result = pool.predict_batch([{"x": 1}, {"x": 2}])
+    assert result["pid"].tolist() == [os.getpid()] * 2
+
+
+def test_map_preserves_batch_order(model):
+    batches = [pd.DataFrame({"x": [i, i]}) for i in range(20)]
+    with PredictorPool(model, workers=3) as pool:
+        results = list(pool.map(batches))
+    assert [r["y"].tolist() for r in results] == [[i + 1, i + 1] for i in range(20)]
+
+
+def test_worker_errors_are_raised(model):
+    with PredictorPool(model, workers=2, shard_size=5) as pool:
+        with pytest.raises(RuntimeError, match="negative input"):
+            pool.predict_batch(pd.DataFrame({"x": [1] * 20 + [-1]}))
+
+
+def test_pool_lifecycle(model):
+    pool = PredictorPool(model, workers=1)
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.predict_batch([{"x": 1}])
+
+    model.state = ModelState.DRAFT
+    with pytest.raises(RuntimeError, match="not ready"):
+        PredictorPool(model, workers=1)
+
+
+def test_replaced_workers_have_the_model(model):
+    pool = PredictorPool(model, workers=1, shard_size=10)
+    try:
+        worker = pool._pool._pool[0]
+        # Exit from within a task: a worker killed while idle could die holding the task queue's lock
+        pool._pool.apply_async(os._exit, (1,))
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+
+        # The pool forks a replacement worker, which must be able to score
+        result = pool.predict_batch(pd.DataFrame({"x": range(20)}))
+        assert result["y"].tolist() == list(range(1, 21))
+    finally:
+        # The task that killed the worker never completes, so the pool is terminated rather than joined
+        pool._pool.terminate()
+        pool.close()
@@ -0,0 +1,177 @@
+"""
+Tests for the ModelServer.
+
+This module verifies:
+1. Readiness reporting on /healthz once the model has been warmed up, and metrics on /metrics.
+2. Single-record predictions on /predict and batch predictions on /predict_batch in JSON lines and Arrow IPC.
+3. Rejection of oversized, malformed and unknown requests, and load shedding when at capacity.
+4. Shutting down a server that runs several worker processes.
+"""
+
+import http.client
+import json
+import multiprocessing
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.inference.server import ARROW_STREAM, ModelServer
+from plexe.internal.models.interfaces.predictor import Predictor
+from plexe.main import main
+from plexe.models import Model
+
+
+class DoublingPredictor(Predictor):
+    def __init__(self, artifacts: List[Artifact]):
+        pass
+
+    def predict(self, inputs: dict) -> dict:
+        return self.predict_batch(pd.DataFrame([inputs])).to_dict(orient="records")[0]
+
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"y": inputs["x"] * 2})
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = Model(intent="double x", input_schema={"x": int}, output_schema={"y": int})
+    model.predictor = DoublingPredictor([])
+    model.state = ModelState.READY
+    return model
+
+
+@pytest.fixture
+def server(model):
+    server = ModelServer(model, port=0, max_request_bytes=1024)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    assert server.ready.wait(timeout=10)
+    yield server
+    server.shutdown()
+    thread.join(timeout=10)
+
+
+def request(server, path, body=None, content_type="application/json"):
+    host, port = server.address
+    req = urllib.request.Request(f"http://{host}:{port}{path}", data=body, headers={"Content-Type": content_type})
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def test_healthz_reports_ready(server):
+    status, body = request(server, "/healthz")
+    assert status == 200
+    assert json.loads(body) == {"status": "ready"}
+
+
+def test_healthz_reports_warming_up(server):
+    server.ready.clear()
+    assert request(server, "/healthz")[0] == 503
+    assert request(server, "/predict", b'{"x": 1}')[0] == 503
+
+
+def test_predict(server):
+    status, body = request(server, "/predict", b'{"x": 21}')
+    assert status == 200
+    assert json.loads(body) == {"y": 42}
+
+    status, body = request(server, "/metrics")
+    assert status == 200
+    assert b'path="serve_predict"} 1' in body
+
+
+def test_predict_batch_json_lines(server):
+    body = b'{"x": 1}\n{"x": 2}\n{"x": 3}\n'
+    status, response = request(server, "/predict_batch", body, "application/x-ndjson")
+    assert status == 200
+    assert [json.loads(line) for line in response.splitlines()] == [{"y": 2}, {"y": 4}, {"y": 6}]
+
+
+def test_predict_batch_arrow(server):
+    table = pa.table({"x": [1, 2, 3]})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    status, response = request(server, "/predict_batch", sink.getvalue().to_pybytes(), ARROW_STREAM)
+    assert status == 200
+    assert pa.ipc.open_stream(response).read_all().column("y").to_pylist() == [2, 4, 6]
+
+
+def test_rejected_requests(server):
+    assert request(server, "/predict", b"[" + b"1," * 1000 + b"1]")[0] == 413
+    assert request(server, "/predict", b"not json")[0] == 400
+    assert request(server, "/unknown", b"{}")[0] == 404
+
+
+def test_invalid_content_length(server):
+    for length in ["abc", "-1"]:
+        connection = http.client.HTTPConnection(*server.address, timeout=10)
+        connection.putrequest("POST", "/predict")
+        connection.putheader("Content-Length", length)
+        connection.endheaders()
+        assert connection.getresponse().status == 400
+        connection.close()
+
+
+def test_unread_body_closes_connection(server):
+    connection = http.client.HTTPConnection(*server.address, timeout=10)
+    connection.request("POST", "/unknown", body=b'{"x": 1}')
+    response = connection.getresponse()
+    response.read()
+    assert response.status == 404
+    # The server closes the connection rather than parsing the unread body as the next request
+    assert connection.sock.recv(1) == b""
+    connection.close()
+
+
+def test_requests_are_shed_at_capacity(server):
+    # Hold every in-flight slot, as if the worker were busy with other requests
+    for _ in range(server.max_inflight_requests):
+        server._slots.acquire()
+    status, _ = request(server, "/predict", b'{"x": 1}')
+    assert status == 429
+    for _ in range(server.max_inflight_requests):
+        server._slots.release()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+def test_shutdown_with_several_workers(model):
+    server = ModelServer(model, port=0, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    status = None
+    for _ in range(100):
+        try:
+            status = request(server, "/healthz")[0]
+        except OSError:
+            pass
+        if status == 200:
+            break
+        time.sleep(0.1)
+    assert status == 200
+
+    stopper = threading.Thread(target=server.shutdown, daemon=True)
+    stopper.start()
+    stopper.join(timeout=15)
+    thread.join(timeout=15)
+    assert not stopper.is_alive()
+    assert not thread.is_alive()
+    assert not any(process.is_alive() for process in server._processes)
+
+
+def test_cli_requires_a_command():
+    with pytest.raises(SystemExit):
+        main([])
@@ -0,0 +1,120 @@
+"""
+Tests for the streaming inference utilities.
+
+This module verifies:
+1. Batching of file, Arrow and DataFrame sources into fixed-size batches.
+2. Order preservation and error propagation through the prefetching pipeline.
+3. Incremental writing of result batches to parquet and CSV files.
+4. Use of schema column types for reading CSV files and writing output files.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pydantic import create_model
+
+from plexe.internal.models.inference.streaming import (
+    arrow_types,
+    iter_input_batches,
+    prefetch,
+    stream_predictions,
+    write_batches,
+)
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    path = tmp_path / "input.parquet"
+    df = pd.DataFrame({"x": range(1000), "extra": ["a"] * 1000})
+    # Small row groups, so that batches have to be stitched across row groups
+    pq.write_table(pa.Table.from_pandas(df), path, row_group_size=70)
+    return path
+
+
+def test_iter_parquet_batches(parquet_file):
+    batches = list(iter_input_batches(parquet_file, batch_size=256, columns=["x"]))
+    assert [len(b) for b in batches] == [256, 256, 256, 232]
+    assert list(batches[0].columns) == ["x"]
+    assert pd.concat(batches)["x"].tolist() == list(range(1000))
+
+
+def test_iter_csv_batches(tmp_path):
+    path = tmp_path / "input.csv"
+    pd.DataFrame({"x": range(10), "y": range(10)}).to_csv(path, index=False)
+    batches = list(iter_input_batches(path, batch_size=4, columns=["y"]))
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert list(batches[0].columns) == ["y"]
+
+
+def test_iter_csv_batches_with_column_types(tmp_path):
+    path = tmp_path / "input.csv"
+    pd.DataFrame({"x": range(10), "code": ["007"] * 10}).to_csv(path, index=False)
+    types = {"x": pa.float64(), "code": pa.string()}
+    batches = list(iter_input_batches(path, batch_size=4, columns=["x", "code"], column_types=types))
+    assert batches[0]["x"].dtype == "float64"
+    assert batches[0]["code"].tolist() == ["007"] * 4
+
+
+def test_iter_in_memory_batches():
+    df = pd.DataFrame({"x": range(5)})
+    assert [len(b) for b in iter_input_batches(df, batch_size=2)] == [2, 2, 1]
+    assert [len(b) for b in iter_input_batches(pa.Table.from_pandas(df), batch_size=3)] == [3, 2]
+    assert [len(b) for b in iter_input_batches([[{"x": 1}], df], batch_size=2)] == [1, 5]
+
+
+def test_iter_rejects_unknown_file_type(tmp_path):
+    with pytest.raises(ValueError):
+        list(iter_input_batches(tmp_path / "input.json", batch_size=10))
+
+
+def test_prefetch_preserves_order_and_propagates_errors():
+    assert list(prefetch(iter(range(100)), depth=2)) == list(range(100))
+
+    def failing():
+        yield 1
+        raise ValueError("read failed")
+
+    with pytest.raises(ValueError, match="read failed"):
+        list(prefetch(failing(), depth=2))
+
+
+def test_stream_predictions_and_write_parquet(parquet_file, tmp_path):
+    out = tmp_path / "out" / "predictions.parquet"
+    pairs = stream_predictions(lambda df: pd.DataFrame({"y": df["x"] * 2}), parquet_file, batch_size=300)
+    rows = write_batches((outputs for _, outputs in pairs), out)
+    assert rows == 1000
+    assert pq.read_table(out).column("y").to_pylist() == [x * 2 for x in range(1000)]
+
+
+def test_write_uses_column_types_instead_of_first_batch(tmp_path):
+    out = tmp_path / "predictions.parquet"
+    batches = [pd.DataFrame({"y": [1, 2]}), pd.DataFrame({"y": [2.5]})]
+    assert write_batches(iter(batches), out, column_types={"y": pa.float64()}) == 3
+    table = pq.read_table(out)
+    assert table.schema.field("y").type == pa.float64()
+    assert table.column("y").to_pylist() == [1.0, 2.0, 2.5]
+
+
+def test_arrow_types_from_schema():
+    schema = create_model("out", a=(int, ...), b=(float | None, None), c=(str, ...), d=(bool, ...), e=(list, ...))
+    assert arrow_types(schema) == {"a": pa.int64(), "b": pa.float64(), "c": pa.string(), "d": pa.bool_()}
+
+
+def test_write_empty_csv(tmp_path):
+    out = tmp_path / "predictions.csv"
+    assert write_batches(iter([]), out, empty_columns=["y"]) == 0
+    assert pd.read_csv(out).columns.tolist() == ["y"]
+
+
+def test_write_removes_output_on_failure(tmp_path):
+    out = tmp_path / "predictions.parquet"
+
+    def failing():
+        yield pd.DataFrame({"y": [1.0]})
+        raise RuntimeError("prediction failed")
+
+    with pytest.raises(RuntimeError, match="prediction failed"):
+        write_batches(failing(), out)
+    assert not out.exists()
@@ -0,0 +1,68 @@
+"""
+Tests for the content-addressed ArtifactStore.
+
+This module verifies:
+1. Storing content from bytes, files and streams under its SHA-256 digest, writing each blob only once.
+2. Recognising blobs of the store by path without hashing them again.
+3. Garbage collection of blobs that no existing archive references, respecting the grace period.
+"""
+
+import hashlib
+import io
+
+import pytest
+
+from plexe.internal.models.storage.artifact_store import ArtifactStore
+
+
+class _Stream:
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+    def seekable(self) -> bool:
+        return False
+
+
+def test_put_deduplicates(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    data = b"shared encoder weights" * 1000
+    digest = hashlib.sha256(data).hexdigest()
+    (tmp_path / "weights.bin").write_bytes(data)
+
+    results = [
+        store.put(data),
+        store.put(tmp_path / "weights.bin"),
+        store.put(io.BytesIO(data)),
+        store.put(_Stream(data)),
+    ]
+    assert results == [(digest, len(data))] * 4
+    assert store.blob_path(digest).read_bytes() == data
+    assert [path.name for path in store.blobs.rglob("*") if path.is_file()] == [digest]
+
+    # Blobs are recognised by their path
+    assert store.put(store.blob_path(digest)) == (digest, len(data))
+    with pytest.raises(ValueError, match="Invalid blob digest"):
+        store.blob_path("../../etc/passwd")
+
+
+def test_gc_removes_unreferenced_blobs(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    kept, _ = store.put(b"kept")
+    dropped, _ = store.put(b"dropped")
+    orphan, _ = store.put(b"orphan")
+    (tmp_path / "a.plexe").write_bytes(b"")
+    (tmp_path / "b.plexe").write_bytes(b"")
+    store.add_reference(tmp_path / "a.plexe", [kept])
+    store.add_reference(tmp_path / "b.plexe", [kept, dropped])
+    (tmp_path / "b.plexe").unlink()
+
+    # New blobs are protected by the grace period
+    assert store.gc(dry_run=True)["blobs"] == 0
+
+    assert store.gc(grace_period=0, dry_run=True) == {"blobs": 2, "references": 1, "bytes": 13}
+    assert dropped in store
+    assert store.gc(grace_period=0) == {"blobs": 2, "references": 1, "bytes": 13}
+    assert kept in store and dropped not in store and orphan not in store
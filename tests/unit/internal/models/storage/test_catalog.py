@@ -0,0 +1,80 @@
+"""
+Tests for the ModelCatalog.
+
+This module verifies:
+1. Indexing the models saved in a directory tree in every format, reading only new or changed archives.
+2. Querying by intent, metric, state and creation time, with ordering and limits.
+3. Removing deleted models from the index and skipping unreadable archives.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from plexe.fileio import save_model
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.metric import ComparisonMethod, Metric, MetricComparator
+from plexe.internal.models.storage.catalog import ModelCatalog
+from plexe.models import Model
+
+
+def make_model(intent: str, accuracy: float) -> Model:
+    model = Model(intent=intent, input_schema={"x": float}, output_schema={"y": float})
+    model.metric = Metric("accuracy", accuracy, MetricComparator(ComparisonMethod.HIGHER_IS_BETTER))
+    model.state = ModelState.READY
+    return model
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    models = tmp_path / "models"
+    save_model(make_model("predict churn", 0.8), models / "churn-v1.plexe")
+    save_model(make_model("predict churn", 0.9), models / "churn" / "churn-v2.tar.gz")
+    save_model(make_model("classify sentiment", 0.7), models / "sentiment", format="directory")
+    return models
+
+
+def test_indexes_models(directory):
+    catalog = ModelCatalog(directory)
+    assert len(catalog) == 3
+    assert sorted(entry.path.name for entry in catalog) == ["churn-v1.plexe", "churn-v2.tar.gz", "sentiment"]
+
+    entry = catalog.find(intent="SENTIMENT")[0]
+    assert entry.metric_name == "accuracy" and entry.metric_value == 0.7
+    assert entry.state == "ready"
+    assert entry.input_schema == {"x": "float"}
+    assert entry.created_at.tzinfo is not None
+
+    # Nothing is read again until archives change
+    assert catalog.refresh() == {"added": 0, "updated": 0, "removed": 0}
+    time.sleep(0.01)
+    save_model(make_model("predict churn", 0.95), directory / "churn-v1.plexe")
+    (directory / "churn" / "churn-v2.tar.gz").unlink()
+    assert catalog.refresh() == {"added": 0, "updated": 1, "removed": 1}
+
+    # The index persists across catalog instances
+    catalog.close()
+    assert len(ModelCatalog(directory, refresh=False)) == 2
+
+
+def test_queries(directory):
+    catalog = ModelCatalog(directory)
+
+    best = catalog.find(intent="churn", metric="accuracy", order_by="metric", limit=1)
+    assert [entry.metric_value for entry in best] == [0.9]
+    assert len(catalog.find(min_metric=0.75, max_metric=0.85)) == 1
+    assert len(catalog.find(state="ready")) == 3
+    assert catalog.find(intent="100%") == []
+
+    now = datetime.now(timezone.utc)
+    assert len(catalog.find(created_after=now - timedelta(hours=1))) == 3
+    assert catalog.find(created_before=now - timedelta(hours=1)) == []
+    with pytest.raises(ValueError, match="Cannot order by"):
+        catalog.find(order_by="size")
+
+
+def test_skips_unreadable_archives(directory):
+    (directory / "broken.plexe").write_bytes(b"PLEXE not really")
+    assert len(ModelCatalog(directory)) == 3
@@ -0,0 +1,78 @@
+"""
+Tests for loading predictor source as importable modules with cached bytecode.
+
+This module verifies:
+1. Writing each source to a file named by its digest, with bytecode cached for the running interpreter.
+2. Reusing the compiled code for repeated loads of the same source, in a new module for each load.
+3. Tracebacks pointing at real files and lines, including when the cache cannot be written.
+4. Rewriting cached source files whose content differs.
+"""
+
+import importlib
+import sys
+import traceback
+import uuid
+
+import pytest
+
+from plexe.internal.models.storage.code_cache import defining_module, load_source_module, module_name
+
+
+def source(marker: str) -> str:
+    return f'MARKER = "{marker}"\n\n\ndef fail():\n    raise ValueError("boom")\n\n\nclass Error(Exception):\n    def describe(self):\n        return MARKER\n'
+
+
+@pytest.fixture
+def code(tmp_path):
+    text = source(uuid.uuid4().hex)
+    yield text
+    sys.modules.pop(module_name(text), None)
+
+
+def test_module_is_importable_with_cached_bytecode(tmp_path, code):
+    module = load_source_module(code, tmp_path)
+
+    assert module.__file__ == str(tmp_path / f"{module_name(code)}.py")
+    assert module.__cached__.endswith(f"{module_name(code)}.{sys.implementation.cache_tag}.pyc")
+    assert (tmp_path / "__pycache__").is_dir() == (not sys.dont_write_bytecode)
+    assert importlib.import_module(module_name(code)) is module
+
+
+def test_each_load_gets_new_module_globals(tmp_path, code):
+    first = load_source_module(code, tmp_path)
+    first.MARKER = "changed"
+    second = load_source_module(code, tmp_path)
+
+    assert second is not first and second.MARKER != "changed"
+    assert second.fail.__code__ is first.fail.__code__
+    # The latest load is registered, and the module of an earlier load can still be found from its classes
+    assert sys.modules[module_name(code)] is second
+    assert defining_module(second.Error) is second
+    assert defining_module(first.Error).Error is first.Error and defining_module(first.Error).MARKER == "changed"
+
+
+def test_source_file_with_other_content_is_rewritten(tmp_path, code):
+    path = tmp_path / f"{module_name(code)}.py"
+    path.write_text("X" * len(code))
+
+    assert load_source_module(code, tmp_path).MARKER in code
+    assert path.read_text() == code
+
+
+def test_tracebacks_show_source_lines(tmp_path, code):
+    module = load_source_module(code, tmp_path)
+    with pytest.raises(ValueError) as error:
+        module.fail()
+    frame = traceback.extract_tb(error.value.__traceback__)[-1]
+    assert frame.filename == module.__file__
+    assert frame.lineno == 5 and frame.line == 'raise ValueError("boom")'
+
+
+def test_unwritable_cache_falls_back_to_exec(tmp_path, code):
+    (tmp_path / "file").write_text("not a directory")
+    module = load_source_module(code, tmp_path / "file")
+
+    assert module.MARKER in code
+    with pytest.raises(ValueError) as error:
+        module.fail()
+    assert traceback.extract_tb(error.value.__traceback__)[-1].line == 'raise ValueError("boom")'
@@ -0,0 +1,73 @@
+"""
+Tests for parallel compression of model archives.
+
+This module verifies:
+1. Multi-block gzip streams written on several threads decompress to the original data with standard readers.
+2. Empty streams still produce valid gzip files, and invalid settings are rejected.
+3. Chunks compressed in parallel are yielded in their original order, including by the container writer.
+"""
+
+import gzip
+import io
+import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from plexe.internal.models.storage.compression import ParallelGzipWriter, compress_chunks
+from plexe.internal.models.storage.container import ContainerReader, ContainerWriter
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parallel_gzip(workers):
+    data = os.urandom(50_000) + b"compressible " * 20_000
+    out = io.BytesIO()
+    with ParallelGzipWriter(out, workers=workers, block_size=16_384) as writer:
+        for start in range(0, len(data), 7_000):
+            writer.write(data[start : start + 7_000])
+        assert writer.tell() == len(data)
+
+    assert gzip.decompress(out.getvalue()) == data
+
+
+def test_parallel_gzip_tar_stream():
+    out = io.BytesIO()
+    with ParallelGzipWriter(out, workers=2, block_size=1024) as writer:
+        with tarfile.open(fileobj=writer, mode="w|") as tar:
+            info = tarfile.TarInfo("artifacts/weights.bin")
+            info.size = 10_000
+            tar.addfile(info, io.BytesIO(b"w" * 10_000))
+
+    out.seek(0)
+    with tarfile.open(fileobj=out, mode="r:gz") as tar:
+        assert tar.extractfile("artifacts/weights.bin").read() == b"w" * 10_000
+
+
+def test_empty_and_invalid_streams():
+    out = io.BytesIO()
+    ParallelGzipWriter(out, workers=2).close()
+    assert gzip.decompress(out.getvalue()) == b""
+
+    with pytest.raises(ValueError, match="level"):
+        ParallelGzipWriter(io.BytesIO(), level=0)
+    with pytest.raises(ValueError, match="closed"):
+        writer = ParallelGzipWriter(io.BytesIO(), workers=1)
+        writer.close()
+        writer.write(b"data")
+
+
+def test_compress_chunks_preserves_order():
+    chunks = [str(i).encode() * (i + 1) for i in range(50)]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(compress_chunks(bytes.upper, iter(chunks), executor, workers=4)) == [c.upper() for c in chunks]
+
+
+def test_parallel_container_writer(tmp_path):
+    data = b"".join(f"row {i}, ".encode() for i in range(100_000))
+    with ContainerWriter(tmp_path / "model.plexe", chunk_size=8192, workers=4) as writer:
+        writer.add("artifacts/rows.txt", io.BytesIO(data))
+
+    with ContainerReader(tmp_path / "model.plexe") as reader:
+        assert len(reader.info("artifacts/rows.txt")["chunks"]) > 10
+        assert reader.read("artifacts/rows.txt") == data
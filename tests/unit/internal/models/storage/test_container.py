@@ -0,0 +1,102 @@
+"""
+Tests for the .plexe model container.
+
+This module verifies:
+1. Round-tripping entries through a container with each codec, including multi-chunk and empty entries.
+2. Storing already-compressed and incompressible data as-is, and aligning uncompressed payloads.
+3. Reading single entries through the index, and rejecting corrupt or foreign files.
+"""
+
+import gzip
+import os
+
+import pytest
+
+from plexe.internal.models.storage.container import (
+    ALIGNMENT,
+    ContainerReader,
+    ContainerWriter,
+    is_container,
+)
+
+
+@pytest.mark.parametrize("codec", ["zstd", "lz4", "none"])
+def test_round_trip(tmp_path, codec):
+    large = b"plexe model weights " * 10_000
+    source = tmp_path / "weights.bin"
+    source.write_bytes(large)
+
+    with ContainerWriter(tmp_path / "model.plexe", codec=codec, chunk_size=4096) as writer:
+        writer.add("metadata/intent.txt", b"predict things")
+        writer.add("artifacts/weights.bin", source)
+        writer.add("artifacts/empty.bin", b"")
+
+    with ContainerReader(tmp_path / "model.plexe") as reader:
+        assert reader.names() == ["metadata/intent.txt", "artifacts/weights.bin", "artifacts/empty.bin"]
+        assert reader.read("metadata/intent.txt") == b"predict things"
+        assert reader.read("artifacts/weights.bin") == large
+        assert reader.read("artifacts/empty.bin") == b""
+        info = reader.info("artifacts/weights.bin")
+        assert info["codec"] == codec
+        if codec != "none":
+            assert len(info["chunks"]) > 1
+            assert info["stored"] < len(large) / 10
+
+
+def test_compressed_data_is_stored_raw(tmp_path):
+    with ContainerWriter(tmp_path / "model.plexe") as writer:
+        writer.add("artifacts/model.gz", gzip.compress(b"weights" * 1000))
+        writer.add("artifacts/noise.bin", os.urandom(10_000))
+        writer.add("artifacts/text.txt", b"text" * 1000)
+
+    with ContainerReader(tmp_path / "model.plexe") as reader:
+        for name in ("artifacts/model.gz", "artifacts/noise.bin"):
+            assert reader.info(name)["codec"] == "none"
+            assert reader.info(name)["offset"] % ALIGNMENT == 0
+        assert reader.info("artifacts/text.txt")["codec"] == "zstd"
+
+
+def test_entries_are_read_independently(tmp_path):
+    with ContainerWriter(tmp_path / "model.plexe", codec="none") as writer:
+        writer.add("metadata/intent.txt", b"intent")
+        writer.add("artifacts/weights.bin", b"weights")
+
+    # Corrupting one entry does not affect reading another
+    path = tmp_path / "model.plexe"
+    data = bytearray(path.read_bytes())
+    with ContainerReader(path) as reader:
+        offset = reader.info("artifacts/weights.bin")["offset"]
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with ContainerReader(path) as reader:
+        assert reader.read("metadata/intent.txt") == b"intent"
+        with pytest.raises(ValueError, match="checksum"):
+            reader.read("artifacts/weights.bin")
+
+
+def test_invalid_containers(tmp_path):
+    (tmp_path / "other.bin").write_bytes(b"not a container")
+    assert not is_container(tmp_path / "other.bin")
+    with pytest.raises(ValueError, match="Not a plexe container"):
+        ContainerReader(tmp_path / "other.bin")
+
+    with ContainerWriter(tmp_path / "model.plexe") as writer:
+        writer.add("a", b"a")
+        with pytest.raises(ValueError, match="Duplicate"):
+            writer.add("a", b"b")
+    truncated = tmp_path / "truncated.plexe"
+    truncated.write_bytes((tmp_path / "model.plexe").read_bytes()[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        ContainerReader(truncated)
+
+    with pytest.raises(ValueError, match="Unsupported codec"):
+        ContainerWriter(tmp_path / "bad.plexe", codec="rar")
+
+
+def test_failed_write_removes_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with ContainerWriter(tmp_path / "model.plexe") as writer:
+            writer.add("a", b"a")
+            raise RuntimeError("interrupted")
+    assert not (tmp_path / "model.plexe").exists()
@@ -0,0 +1,74 @@
+"""
+Tests for memory-mapped files and lazy artifacts.
+
+This module verifies:
+1. Mapping whole files and unaligned byte ranges, and rejecting ranges outside the file.
+2. Reading, seeking and zero-copy buffer access through MappedFile.
+3. Loading lazy artifacts on first access, releasing them, and pickling them.
+"""
+
+import io
+import pickle
+from functools import partial
+
+import numpy as np
+import pytest
+
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.storage.mapped import MappedFile, map_file
+
+
+def test_map_file_ranges(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 100)
+
+    assert map_file(path).tobytes() == path.read_bytes()
+    assert map_file(path, offset=5000, length=3).tobytes() == bytes([5000 % 256, 5001 % 256, 5002 % 256])
+    assert map_file(path, offset=100, length=0).tobytes() == b""
+    with pytest.raises(ValueError, match="outside"):
+        map_file(path, offset=25_000, length=1000)
+
+
+def test_mapped_file():
+    handle = MappedFile(memoryview(b"line one\nline two\n"))
+    assert handle.readline() == b"line one\n"
+    assert handle.read(4) == b"line"
+    handle.seek(-4, io.SEEK_END)
+    assert handle.read() == b"two\n"
+    assert handle.tell() == 18
+    handle.seek(0)
+    assert handle.getbuffer().tobytes() == b"line one\nline two\n"
+
+    array = np.arange(10, dtype=np.float64)
+    assert np.array_equal(np.load(MappedFile(memoryview(_npy_bytes(array)))), array)
+
+
+def test_lazy_artifact(tmp_path):
+    path = tmp_path / "weights.bin"
+    path.write_bytes(b"weights")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return map_file(path)
+
+    artifact = Artifact.from_loader("weights.bin", loader)
+    assert artifact.is_lazy() and not artifact.is_data() and not calls
+
+    with artifact.get_as_handle() as handle:
+        assert handle.read() == b"weights"
+    assert artifact.data == b"weights"
+    assert len(calls) == 1
+
+    artifact.release()
+    assert artifact.get_buffer().tobytes() == b"weights"
+    assert len(calls) == 2
+
+    restored = pickle.loads(pickle.dumps(Artifact.from_loader("weights.bin", partial(map_file, path))))
+    assert restored.data == b"weights"
+
+
+def _npy_bytes(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
@@ -0,0 +1,87 @@
+"""
+Tests for the LoadedModelCache.
+
+This module verifies:
+1. Returning the cached model for a key, and loading it only once under concurrent requests.
+2. Least-recently-used eviction by number of models and by estimated footprint.
+3. Explicit eviction by path and clearing, and not caching models larger than the whole budget.
+"""
+
+import threading
+import time
+
+import pytest
+
+from plexe.internal.models.storage.model_cache import LoadedModelCache
+
+
+def loader(model, footprint=1, calls=None):
+    def load():
+        if calls is not None:
+            calls.append(model)
+        return model, footprint
+
+    return load
+
+
+def test_cached_models_are_shared():
+    cache = LoadedModelCache(max_models=2)
+    first = cache.get_or_load("a", "a.plexe", loader(object()))
+    assert cache.get_or_load("a", "a.plexe", loader(object())) is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "models": 1, "bytes": 1}
+
+
+def test_concurrent_loads_happen_once():
+    cache = LoadedModelCache(max_models=2)
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.1)
+        return "model", 1
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("a", "a.plexe", slow_load))) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["model"] * 5
+    assert len(calls) == 1
+
+
+def test_lru_eviction_by_count_and_footprint():
+    cache = LoadedModelCache(max_models=2, max_bytes=100)
+    cache.get_or_load("a", "a.plexe", loader("a", 10))
+    cache.get_or_load("b", "b.plexe", loader("b", 10))
+    cache.get_or_load("a", "a.plexe", loader("a", 10))
+    cache.get_or_load("c", "c.plexe", loader("c", 10))
+
+    calls = []
+    cache.get_or_load("a", "a.plexe", loader("a", 10, calls))
+    cache.get_or_load("b", "b.plexe", loader("b", 10, calls))
+    assert calls == ["b"]
+
+    cache.get_or_load("d", "d.plexe", loader("d", 95))
+    assert cache.stats()["models"] == 1 and cache.stats()["bytes"] == 95
+
+    # Models larger than the whole budget are returned but not cached
+    assert cache.get_or_load("e", "e.plexe", loader("e", 1000)) == "e"
+    assert cache.stats()["models"] == 1
+
+
+def test_evict_and_clear(tmp_path):
+    cache = LoadedModelCache(max_models=4)
+    cache.get_or_load("a", tmp_path / "a.plexe", loader("a"))
+    cache.get_or_load("b", tmp_path / "b.plexe", loader("b"))
+
+    assert cache.evict(tmp_path / "a.plexe")
+    assert not cache.evict(tmp_path / "a.plexe")
+    assert cache.stats()["models"] == 1
+    cache.clear()
+    assert cache.stats()["models"] == 0 and cache.stats()["bytes"] == 0
+
+    with pytest.raises(ValueError):
+        LoadedModelCache(max_models=0)
@@ -0,0 +1,99 @@
+"""
+Tests for snapshots of initialised predictors.
+
+This module verifies:
+1. Fingerprinting the Python version, platform and the packages a predictor module uses, scanning the installed
+   distributions once per process.
+2. Snapshotting only predictors that opt in, with pickle or cloudpickle.
+3. Restoring snapshots without initialising the predictor, and ignoring snapshots from other environments.
+"""
+
+import sys
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from plexe.internal.models.storage.code_cache import load_source_module, module_name
+from plexe.internal.models.storage.snapshots import create_snapshot, fingerprint, restore_snapshot
+
+SOURCE = """
+import numpy as np
+
+from plexe.internal.models.interfaces.predictor import Predictor
+
+INITIALISED = []
+
+
+class PredictorImplementation(Predictor):
+    snapshot_serializer = {serializer!r}
+
+    def __init__(self, artifacts):
+        INITIALISED.append(self)
+        self.table = np.arange(3)
+
+    def predict(self, inputs: dict) -> dict:
+        return {{"y": int(self.table[inputs["x"]])}}
+
+# {marker}
+"""
+
+
+@pytest.fixture
+def module_factory(tmp_path):
+    names = []
+
+    def load(serializer):
+        source = SOURCE.format(serializer=serializer, marker=uuid.uuid4().hex)
+        names.append(module_name(source))
+        return load_source_module(source, tmp_path)
+
+    yield load
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_fingerprint_lists_used_packages(module_factory):
+    module = module_factory("pickle")
+    result = fingerprint(module)
+
+    assert result["python"].startswith(sys.implementation.name)
+    assert {"numpy", "plexe"} <= set(result["packages"])
+
+
+def test_installed_distributions_are_scanned_once(module_factory):
+    module = module_factory("pickle")
+    fingerprint(module)
+    with patch("importlib.metadata.packages_distributions") as packages_distributions:
+        assert fingerprint(module) == fingerprint(module)
+    packages_distributions.assert_not_called()
+
+
+@pytest.mark.parametrize("serializer", ["pickle", "cloudpickle"])
+def test_restore_skips_initialisation(module_factory, serializer):
+    module = module_factory(serializer)
+    data, expected = create_snapshot(module.PredictorImplementation([]), module)
+    assert expected["serializer"] == serializer
+
+    restored = restore_snapshot(data, expected, module)
+    assert isinstance(restored, module.PredictorImplementation)
+    assert restored.predict({"x": 2}) == {"y": 2}
+    assert len(module.INITIALISED) == 1
+
+
+def test_predictors_must_opt_in(module_factory):
+    module = module_factory(None)
+    assert create_snapshot(module.PredictorImplementation([]), module) is None
+
+    module = module_factory("marshal")
+    with pytest.raises(ValueError, match="Unknown snapshot serializer"):
+        create_snapshot(module.PredictorImplementation([]), module)
+
+
+def test_snapshot_from_other_environment_is_ignored(module_factory):
+    module = module_factory("pickle")
+    data, expected = create_snapshot(module.PredictorImplementation([]), module)
+
+    assert restore_snapshot(data, {**expected, "python": "cpython-2.7.18"}, module) is None
+    assert restore_snapshot(data, {**expected, "packages": {**expected["packages"], "numpy": "0.1"}}, module) is None
+    assert restore_snapshot(b"not a pickle", expected, module) is None
@@ -0,0 +1,82 @@
+import pytest
+from pydantic import create_model
+
+from plexe.internal.models.validation.primitives.predict import PredictorValidator
+
+PREDICTOR_HEADER = """
+from typing import List
+
+import pandas as pd
+
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.interfaces.predictor import Predictor
+
+
+class PredictorImplementation(Predictor):
+    def __init__(self, artifacts: List[Artifact]):
+        pass
+
+    def predict(self, inputs: dict) -> dict:
+        return self.predict_batch(pd.DataFrame([inputs])).to_dict(orient="records")[0]
+"""
+
+BATCH_PREDICTOR = (
+    PREDICTOR_HEADER
+    + """
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"y": inputs["x"] * 0.1})
+"""
+)
+
+INCONSISTENT_PREDICTOR = (
+    PREDICTOR_HEADER
+    + """
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        # normalises by the batch, so batch and single-row outputs differ
+        return pd.DataFrame({"y": inputs["x"] / inputs["x"].sum()})
+"""
+)
+
+MISALIGNED_PREDICTOR = (
+    PREDICTOR_HEADER
+    + """
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"y": [float(inputs["x"].sum())]})
+"""
+)
+
+
+@pytest.fixture
+def predictor_validator():
+    """
+    Fixture to provide an instance of PredictorValidator with a simple numeric schema.
+
+    :return: An instance of PredictorValidator.
+    """
+    return PredictorValidator(
+        input_schema=create_model("In", x=(float, ...)),
+        output_schema=create_model("Out", y=(float, ...)),
+        sample=[{"x": 1.0}, {"x": 2.0}, {"x": 3.0}],
+    )
+
+
+def test_consistent_batch_predictor_passes(predictor_validator):
+    """Test that a predictor whose batch and single-row outputs agree passes validation."""
+    result = predictor_validator.validate(BATCH_PREDICTOR, model_artifacts=[])
+    assert result.passed is True
+
+
+def test_inconsistent_batch_predictor_fails(predictor_validator):
+    """Test that differing outputs between predict and predict_batch are reported with their indices."""
+    result = predictor_validator.validate(INCONSISTENT_PREDICTOR, model_artifacts=[])
+    assert result.passed is False
+    assert result.error_stage == "batch_prediction"
+    assert "3/3 samples" in result.error_details
+
+
+def test_misaligned_batch_predictor_fails(predictor_validator):
+    """Test that predict_batch must return one row per input row."""
+    result = predictor_validator.validate(MISALIGNED_PREDICTOR, model_artifacts=[])
+    assert result.passed is False
+    assert result.error_stage == "batch_prediction"
+    assert "1 rows for 3 inputs" in result.error_details
@@ -5,9 +5,13 @@ This module verifies:
 1. Validation of conditions during initialization.
 2. Logical operations (AND, OR, NOT) between constraints.
 3. Error handling during condition evaluation.
+4. Batch evaluation of vectorized and row-wise conditions, including short-circuiting of flattened trees.
 """
 
+import numpy as np
+import pandas as pd
 import pytest
+
 from plexe.constraints import Constraint
 
 
@@ -94,3 +98,44 @@ def test_runtime_error_handling():
     )
     with pytest.raises(RuntimeError):
         constraint.evaluate({}, {})
+
+
+def test_evaluate_batch_matches_evaluate():
+    positive = Constraint(lambda inputs, outputs: outputs["y"] > 0, "positive", vectorized=True)
+    below_x = Constraint(lambda inputs, outputs: outputs["y"] < inputs["x"], "below x")
+    even = Constraint(lambda inputs, outputs: outputs["y"] % 2 == 0, "even", vectorized=True)
+    constraint = (positive & below_x) | ~even
+
+    inputs = pd.DataFrame({"x": [5, 5, 5, 5, 0]}, index=[9, 8, 7, 6, 5])
+    outputs = pd.DataFrame({"y": [2, 6, -2, 3, -4]})
+    expected = [constraint.evaluate(i, o) for i, o in zip(inputs.to_dict("records"), outputs.to_dict("records"))]
+
+    assert constraint.evaluate_batch(inputs, outputs).tolist() == expected == [True, False, False, True, False]
+
+
+def test_evaluate_batch_short_circuits_per_row():
+    evaluated = []
+
+    def record(inputs, outputs):
+        evaluated.append(len(inputs))
+        return np.ones(len(inputs), dtype=bool)
+
+    positive = Constraint(lambda inputs, outputs: outputs["y"] > 0, "positive", vectorized=True)
+    rules = [Constraint(record, f"rule {i}", vectorized=True) for i in range(30)]
+    constraint = positive
+    for rule in rules:
+        constraint = constraint & rule
+
+    mask = constraint.evaluate_batch(pd.DataFrame({"x": range(4)}), pd.DataFrame({"y": [1, -1, 2, -2]}))
+    assert mask.tolist() == [True, False, True, False]
+    # The chain is flattened into one pass, and later rules only see the rows that are still satisfied
+    assert evaluated == [2] * 30
+    assert constraint._compile()[0] == "and" and len(constraint._compile()[1]) == 31
+
+
+def test_evaluate_batch_errors():
+    failing = Constraint(lambda inputs, outputs: outputs["missing"] > 0, "failing", vectorized=True)
+    with pytest.raises(RuntimeError, match="failing"):
+        failing.evaluate_batch(pd.DataFrame({"x": [1]}), pd.DataFrame({"y": [1]}))
+    with pytest.raises(ValueError):
+        failing.evaluate_batch(pd.DataFrame({"x": [1, 2]}), pd.DataFrame({"y": [1]}))
@@ -0,0 +1,342 @@
+"""
+Tests for saving and loading models with plexe.fileio.
+
+This module verifies:
+1. Round-tripping a model, its predictor code, artifacts and input sample through each archive format.
+2. Warming up the predictor when loading.
+3. Choosing the codec of .plexe containers, and rejecting unknown archive formats.
+4. Loading artifacts lazily from memory maps, extracting compressed artifacts to one local cache whatever the
+   working directory, clearing that cache, and overwriting archives that are in use.
+5. Saving to and loading from directories, with artifacts exposed by path.
+6. Streaming artifacts from file handles of known and unknown length into tar archives.
+7. Sharing loaded models through the process-wide model cache until the archive changes or is evicted.
+8. Saving artifacts to a content-addressed store once, shared between model versions.
+9. Loading only the metadata of a model, without its code or artifacts.
+10. Restoring predictor snapshots instead of initialising the predictor, unless the environment has changed.
+"""
+
+import io
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from plexe import fileio
+from plexe.fileio import clear_extracted_artifacts, clear_model_cache, evict_model, load_model, save_model
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.storage.artifact_store import ArtifactStore
+from plexe.internal.models.storage.code_cache import defining_module, load_source_module
+from plexe.internal.models.storage.container import ContainerReader
+from plexe.models import Model
+
+PREDICTOR_SOURCE = """
+from typing import List
+
+import pandas as pd
+
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.storage.artifact_store import ArtifactStore
+from plexe.internal.models.storage.container import ContainerReader
+from plexe.internal.models.interfaces.predictor import Predictor
+
+
+class PredictorImplementation(Predictor):
+    def __init__(self, artifacts: List[Artifact]):
+        self.calls = 0
+        with artifacts[0].get_as_handle() as handle:
+            self.factor = float(handle.read().decode())
+
+    def predict(self, inputs: dict) -> dict:
+        self.calls += 1
+        return self.predict_batch(pd.DataFrame([inputs])).to_dict(orient="records")[0]
+
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"y": inputs["x"] * self.factor})
+"""
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # The local cache directory is resolved once per process; each test uses its own
+    fileio._cache_dir.cache_clear()
+    model = Model(intent="scale x", input_schema={"x": float}, output_schema={"y": float})
+    model.predictor_source = PREDICTOR_SOURCE
+    model.artifacts = [Artifact.from_data("factor.txt", b"3.0")]
+    model.input_sample = [{"x": 1.0}, {"x": 2.0}]
+    model.state = ModelState.READY
+    yield model
+    fileio._cache_dir.cache_clear()
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe"])
+def test_round_trip(model, tmp_path, filename):
+    path = save_model(model, tmp_path / filename)
+    loaded = load_model(path)
+
+    assert loaded.identifier == model.identifier
+    assert loaded.state == ModelState.READY
+    assert loaded.input_sample == [{"x": 1.0}, {"x": 2.0}]
+    assert [artifact.name for artifact in loaded.artifacts] == ["factor.txt"]
+    assert loaded.predict({"x": 2.0}) == {"y": 6.0}
+    assert "warmup" not in loaded.metadata
+
+
+def test_load_with_warmup(model, tmp_path):
+    loaded = load_model(save_model(model, tmp_path / "model.tar.gz"), warmup=True)
+
+    stats = loaded.metadata["warmup"]
+    assert stats["samples"] == 2
+    assert stats["cold_predict_ms"] > 0 and stats["warm_predict_batch_ms"] > 0
+    # Warm-up calls are not counted as served predictions
+    assert loaded.inference_stats()["paths"] == {}
+
+
+def test_load_with_warmup_after_saving_warmed_model(model, tmp_path):
+    warmed = load_model(save_model(model, tmp_path / "model.tar.gz"), warmup=True)
+    assert "warmup" in warmed.metadata
+
+    loaded = load_model(save_model(warmed, tmp_path / "warmed.tar.gz"), warmup=True)
+    # The warm-up stats saved with the model do not stop the loaded predictor from being warmed up
+    assert loaded.predictor.calls > 0
+
+
+def test_container_codec(model, tmp_path):
+    model.artifacts.append(Artifact.from_data("weights.bin", b"0" * 100_000))
+    path = save_model(model, tmp_path / "model.plexe", codec="lz4")
+
+    with ContainerReader(path) as reader:
+        assert reader.info("artifacts/weights.bin")["codec"] == "lz4"
+    assert load_model(path).artifacts[1].data == b"0" * 100_000
+
+    with pytest.raises(ValueError, match="codec"):
+        save_model(model, tmp_path / "model.tar.gz", codec="lz4")
+
+
+def test_unknown_format(model, tmp_path):
+    with pytest.raises(ValueError, match="Path must end with"):
+        save_model(model, tmp_path / "model.zip")
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe"])
+def test_artifacts_are_lazy(model, tmp_path, filename):
+    model.artifacts.append(Artifact.from_data("weights.npz", b"PK\x03\x04" + b"0" * 1000))
+    loaded = load_model(save_model(model, tmp_path / filename))
+
+    assert all(artifact.is_lazy() for artifact in loaded.artifacts)
+    # The buffers used by the predictor's constructor are released once it has loaded
+    assert all(artifact._buffer is None for artifact in loaded.artifacts)
+    assert loaded.artifacts[1].data == b"PK\x03\x04" + b"0" * 1000
+
+    # Compressed entries are extracted to the local cache; uncompressed container entries are mapped in place
+    extracted = {path.name for path in (tmp_path / ".smolcache" / "artifacts").rglob("*") if path.is_file()}
+    assert extracted == ({"factor.txt", "weights.npz"} if filename.endswith(".tar.gz") else set())
+
+
+def test_extracted_artifacts_are_shared_across_working_directories(model, tmp_path, monkeypatch):
+    path = save_model(model, tmp_path / "model.tar.gz")
+    load_model(path)
+    extracted = [path for path in (tmp_path / ".smolcache" / "artifacts").rglob("*") if path.is_file()]
+
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")
+    assert load_model(path).predict({"x": 2.0}) == {"y": 6.0}
+    assert not (tmp_path / "elsewhere" / ".smolcache").exists()
+    assert [path for path in (tmp_path / ".smolcache" / "artifacts").rglob("*") if path.is_file()] == extracted
+
+    clear_extracted_artifacts()
+    assert not (tmp_path / ".smolcache" / "artifacts").exists()
+    clear_extracted_artifacts()
+
+
+def test_overwrite_archive_in_use(model, tmp_path):
+    path = tmp_path / "model.plexe"
+    loaded = load_model(save_model(model, path, codec="none"))
+    buffer = loaded.artifacts[0].get_buffer()
+
+    model.artifacts = [Artifact.from_data("factor.txt", b"5.0")]
+    save_model(model, path, codec="none")
+
+    assert buffer.tobytes() == b"3.0"
+    assert load_model(path).predict({"x": 1.0}) == {"y": 5.0}
+
+
+def test_directory_format(model, tmp_path):
+    path = save_model(model, tmp_path / "served/", format="directory")
+
+    assert (tmp_path / "served" / "code" / "predictor.py").read_text() == PREDICTOR_SOURCE
+    assert (tmp_path / "served" / "artifacts" / "factor.txt").read_bytes() == b"3.0"
+    loaded = load_model(tmp_path / "served/")
+    assert loaded.artifacts[0].path == (tmp_path / "served" / "artifacts" / "factor.txt").resolve()
+    assert loaded.predict({"x": 2.0}) == {"y": 6.0}
+
+    # A loaded model can be saved over its own directory, since artifacts are copied before the old one is removed
+    loaded.intent = "scale x again"
+    save_model(loaded, path, format="directory")
+    assert load_model(path).intent == "scale x again"
+    assert not list(tmp_path.glob(".served*"))
+
+
+def test_directory_format_refuses_other_directories(model, tmp_path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "important.csv").write_text("a,b")
+    with pytest.raises(ValueError, match="does not contain a saved model"):
+        save_model(model, tmp_path / "data", format="directory")
+    with pytest.raises(ValueError, match="Unknown format"):
+        save_model(model, tmp_path / "model", format="zip")
+
+
+class _Stream:
+    """A binary stream that cannot seek, so its length is not known in advance."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+    def seekable(self) -> bool:
+        return False
+
+
+def test_tar_streams_artifact_handles(model, tmp_path):
+    (tmp_path / "weights.bin").write_bytes(b"w" * 3_000_000)
+    model.artifacts += [
+        Artifact.from_path(tmp_path / "weights.bin"),
+        Artifact(name="seekable.bin", handle=io.BytesIO(b"s" * 10_000)),
+        Artifact(name="stream.bin", handle=_Stream(b"u" * 10_000)),
+    ]
+    loaded = load_model(save_model(model, tmp_path / "model.tar.gz"))
+
+    assert {artifact.name: len(artifact.data) for artifact in loaded.artifacts} == {
+        "factor.txt": 3,
+        "weights.bin": 3_000_000,
+        "seekable.bin": 10_000,
+        "stream.bin": 10_000,
+    }
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe", "model_dir"])
+def test_model_cache(model, tmp_path, filename):
+    fmt = "directory" if filename == "model_dir" else None
+    path = save_model(model, tmp_path / filename, format=fmt)
+    clear_model_cache()
+
+    loaded = load_model(path, cache=True)
+    assert load_model(path, cache=True) is loaded
+    assert load_model(path) is not loaded
+
+    # Saving the model again changes the archive, so it is loaded afresh
+    time.sleep(0.01)
+    model.intent = "scale x differently"
+    save_model(model, path, format=fmt)
+    reloaded = load_model(path, cache=True)
+    assert reloaded is not loaded and reloaded.intent == "scale x differently"
+
+    assert evict_model(path)
+    assert load_model(path, cache=True) is not reloaded
+    clear_model_cache()
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe"])
+def test_artifact_store(model, tmp_path, filename):
+    weights = b"encoder" * 100_000
+    model.artifacts.append(Artifact.from_data("encoder.bin", weights))
+    first = save_model(model, tmp_path / "v1" / filename, store=True)
+    store = ArtifactStore(tmp_path / ".smolcache" / "store")
+    assert Path(first).stat().st_size < 10_000
+    blobs = sorted(path for path in store.blobs.rglob("*") if path.is_file())
+
+    # A new version sharing the artifacts writes no new blobs, even when saved from a loaded model
+    loaded = load_model(first)
+    assert loaded.artifacts[1].path.parent.parent == store.blobs
+    assert loaded.predict({"x": 2.0}) == {"y": 6.0}
+    loaded.intent = "scale x, version 2"
+    second = save_model(loaded, tmp_path / "v2" / filename, store=store)
+    assert sorted(path for path in store.blobs.rglob("*") if path.is_file()) == blobs
+
+    Path(first).unlink()
+    assert store.gc(grace_period=0)["blobs"] == 0
+    Path(second).unlink()
+    assert store.gc(grace_period=0)["blobs"] == 2
+
+
+def test_missing_blob(model, tmp_path):
+    path = save_model(model, tmp_path / "model.plexe", store=tmp_path / "store")
+    for blob in (tmp_path / "store" / "blobs").rglob("*"):
+        if blob.is_file():
+            blob.unlink()
+    with pytest.raises(ValueError, match="missing from the store"):
+        load_model(path)
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe", "model_dir"])
+def test_metadata_only(model, tmp_path, filename):
+    fmt = "directory" if filename == "model_dir" else None
+    model.predictor_source = "raise RuntimeError('predictor code must not run')"
+    path = save_model(model, tmp_path / filename, format=fmt)
+
+    loaded = load_model(path, metadata_only=True)
+    assert loaded.intent == "scale x" and loaded.state == ModelState.READY
+    assert list(loaded.input_schema.model_fields) == ["x"]
+    assert loaded.input_sample == [{"x": 1.0}, {"x": 2.0}]
+    assert "created_at" in loaded.metadata
+    assert loaded.predictor is None and loaded.predictor_source is None and loaded.artifacts == []
+    assert not (tmp_path / ".smolcache" / "artifacts").exists()
+
+
+SNAPSHOT_PREDICTOR_SOURCE = PREDICTOR_SOURCE.replace(
+    "        with artifacts", "        INITIALISED.append(self)\n        with artifacts"
+).replace(
+    "class PredictorImplementation(Predictor):\n",
+    "INITIALISED = []\n\n\nclass PredictorImplementation(Predictor):\n    snapshot_serializer = 'pickle'\n\n",
+)
+
+
+@pytest.mark.parametrize("filename", ["model.tar.gz", "model.plexe", "model_dir"])
+def test_predictor_snapshot(model, tmp_path, filename):
+    fmt = "directory" if filename == "model_dir" else None
+    model.predictor_source = SNAPSHOT_PREDICTOR_SOURCE + f"\n# {filename}\n"
+    module = load_source_module(model.predictor_source)
+    model.predictor = module.PredictorImplementation(model.artifacts)
+    path = save_model(model, tmp_path / filename, format=fmt, snapshot=True)
+
+    loaded = load_model(path)
+    assert loaded.predict({"x": 2.0}) == {"y": 6.0}
+    # Each load runs the predictor code in a new module, where the restored predictor was never initialised
+    loaded_module = defining_module(type(loaded.predictor))
+    assert loaded_module is not module and loaded_module.INITIALISED == []
+
+
+def test_predictor_snapshot_from_other_environment(model, tmp_path):
+    model.predictor_source = SNAPSHOT_PREDICTOR_SOURCE + "\n# other environment\n"
+    module = load_source_module(model.predictor_source)
+    model.predictor = module.PredictorImplementation(model.artifacts)
+    path = Path(save_model(model, tmp_path / "model", format="directory", snapshot=True))
+    fingerprint = json.loads((path / "snapshot" / "fingerprint.json").read_text())
+    (path / "snapshot" / "fingerprint.json").write_text(json.dumps({**fingerprint, "python": "cpython-3.0.0"}))
+
+    loaded = load_model(path)
+    assert loaded.predict({"x": 2.0}) == {"y": 6.0}
+    assert defining_module(type(loaded.predictor)).INITIALISED == [loaded.predictor]
+
+
+def test_predictor_snapshot_after_later_load_of_same_code(model, tmp_path):
+    model.predictor_source = SNAPSHOT_PREDICTOR_SOURCE + "\n# loaded twice\n"
+    model.predictor = load_source_module(model.predictor_source).PredictorImplementation(model.artifacts)
+    # Another model loaded from the same code replaces the module registered under its name
+    load_source_module(model.predictor_source)
+    path = Path(save_model(model, tmp_path / "model", format="directory", snapshot=True))
+
+    assert (path / "snapshot").exists()
+    assert load_model(path).predict({"x": 2.0}) == {"y": 6.0}
+
+
+def test_predictor_without_snapshot_support(model, tmp_path):
+    model.predictor = load_source_module(PREDICTOR_SOURCE).PredictorImplementation(model.artifacts)
+    path = Path(save_model(model, tmp_path / "model", format="directory", snapshot=True))
+
+    assert not (path / "snapshot").exists()
+    assert load_model(path).predict({"x": 2.0}) == {"y": 6.0}
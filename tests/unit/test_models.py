@@ -0,0 +1,220 @@
+"""
+Tests for the prediction API of the Model class in plexe.models.
+
+This module verifies:
+1. Batch prediction with vectorized predictors and with the per-row fallback.
+2. Coercion of the supported batch input types.
+3. Error handling for predictors that return the wrong number of outputs.
+4. Streaming prediction over batches and files.
+5. Asynchronous prediction with micro-batching.
+6. Prediction caching, including deduplication within batches and invalidation on identifier changes.
+7. Checking constraints against predictions.
+8. Inference statistics for each prediction path.
+9. Warming up the predictor.
+"""
+
+import asyncio
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from plexe.constraints import Constraint
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.interfaces.predictor import Predictor
+from plexe.models import Model
+
+
+class RowPredictor(Predictor):
+    def __init__(self, artifacts: List[Artifact]):
+        self.calls = 0
+
+    def predict(self, inputs: dict) -> dict:
+        self.calls += 1
+        return {"y": inputs["x"] * 2.0}
+
+
+class BatchPredictor(RowPredictor):
+    def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        self.calls += 1
+        return pd.DataFrame({"y": inputs["x"] * 2.0})
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = Model(intent="double x", input_schema={"x": float}, output_schema={"y": float})
+    model.predictor = RowPredictor([])
+    model.state = ModelState.READY
+    return model
+
+
+def test_predict_batch_falls_back_to_predict(model):
+    result = model.predict_batch(pd.DataFrame({"x": [1.0, 2.0, 3.0]}))
+    assert result["y"].tolist() == [2.0, 4.0, 6.0]
+    assert model.predictor.calls == 3
+
+
+def test_predict_batch_uses_vectorized_predictor(model):
+    model.predictor = BatchPredictor([])
+    result = model.predict_batch(pd.DataFrame({"x": [1.0, 2.0, 3.0]}, index=[10, 11, 12]))
+    assert result["y"].tolist() == [2.0, 4.0, 6.0]
+    assert list(result.index) == [0, 1, 2]
+    assert model.predictor.calls == 1
+
+
+def test_predict_batch_accepts_records_and_arrow(model):
+    assert model.predict_batch([{"x": 1.0}, {"x": 2.0}])["y"].tolist() == [2.0, 4.0]
+    assert model.predict_batch(pa.table({"x": [1.5]}))["y"].tolist() == [3.0]
+
+
+def test_predict_batch_empty_input(model):
+    result = model.predict_batch([])
+    assert len(result) == 0
+    assert list(result.columns) == ["y"]
+
+
+def test_predict_batch_validates_inputs(model):
+    with pytest.raises(RuntimeError):
+        model.predict_batch([{"x": "not a number"}], validate_input=True)
+
+
+def test_predict_batch_rejects_misaligned_outputs(model):
+    class BrokenPredictor(RowPredictor):
+        def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+            return pd.DataFrame({"y": [0.0]})
+
+    model.predictor = BrokenPredictor([])
+    with pytest.raises(RuntimeError, match="1 outputs for 2 inputs"):
+        model.predict_batch([{"x": 1.0}, {"x": 2.0}])
+
+
+def test_predict_batch_requires_ready_model(model):
+    model.state = ModelState.DRAFT
+    with pytest.raises(RuntimeError):
+        model.predict_batch([{"x": 1.0}])
+
+
+def test_predict_file_streams_with_passthrough(model, tmp_path):
+    model.predictor = BatchPredictor([])
+    in_path = tmp_path / "in.parquet"
+    pd.DataFrame({"id": range(10), "x": [float(i) for i in range(10)]}).to_parquet(in_path)
+
+    rows = model.predict_file(in_path, tmp_path / "out.csv", batch_size=3, passthrough_columns=["id"])
+
+    result = pd.read_csv(tmp_path / "out.csv")
+    assert rows == 10
+    assert result.columns.tolist() == ["id", "y"]
+    assert result["y"].tolist() == [2.0 * i for i in range(10)]
+    assert model.predictor.calls == 4
+
+
+def test_predict_file_reads_and_writes_schema_types(model, tmp_path):
+    dtypes = []
+
+    class IntegralPredictor(RowPredictor):
+        def predict_batch(self, inputs: pd.DataFrame) -> pd.DataFrame:
+            dtypes.append(str(inputs["x"].dtype))
+            return pd.DataFrame({"y": (inputs["x"] * 2).astype("int64")})
+
+    model.predictor = IntegralPredictor([])
+    in_path = tmp_path / "in.csv"
+    pd.DataFrame({"x": range(5)}).to_csv(in_path, index=False)
+
+    model.predict_file(in_path, tmp_path / "out.parquet", batch_size=2)
+
+    # Integral values are read as the input schema's floats, and outputs are written as the output schema's floats
+    assert set(dtypes) == {"float64"}
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.schema.field("y").type == pa.float64()
+    assert table.column("y").to_pylist() == [2.0 * i for i in range(5)]
+
+
+def test_predict_stream_yields_output_batches(model):
+    batches = list(model.predict_stream(pd.DataFrame({"x": [1.0, 2.0, 3.0]}), batch_size=2))
+    assert [b["y"].tolist() for b in batches] == [[2.0, 4.0], [6.0]]
+
+
+def test_apredict_batches_concurrent_requests(model):
+    model.predictor = BatchPredictor([])
+    model.configure_batching(max_batch_size=16, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(model.apredict({"x": float(i)}) for i in range(16)))
+
+    assert asyncio.run(run()) == [{"y": 2.0 * i} for i in range(16)]
+    assert model.batching_stats()["requests"] == 16
+    assert model.predictor.calls < 16
+
+
+def test_cache_deduplicates_and_reuses_outputs(model):
+    model.predictor = BatchPredictor([])
+    model.enable_cache(max_entries=100)
+
+    result = model.predict_batch([{"x": 1.0}, {"x": 2.0}, {"x": 1.0}])
+    assert result["y"].tolist() == [2.0, 4.0, 2.0]
+    assert model.predictor.calls == 1
+
+    result = model.predict_batch([{"x": 2.0}, {"x": 3.0}, {"x": 3.0}])
+    assert result["y"].tolist() == [4.0, 6.0, 6.0]
+    assert model.predict({"x": 3.0}) == {"y": 6.0}
+    assert model.predictor.calls == 2
+    assert model.cache_stats()["hits"] == 2
+
+
+def test_cache_is_invalidated_when_identifier_changes(model):
+    model.enable_cache(max_entries=100)
+    model.predict({"x": 1.0})
+    model.identifier = "model-rebuilt"
+    model.predict({"x": 1.0})
+    assert model.predictor.calls == 2
+
+    model.disable_cache()
+    assert model.cache_stats() == {}
+
+
+def test_check_constraints_reports_violation_rates(model):
+    model.constraints = [
+        Constraint(lambda inputs, outputs: outputs["y"] >= 0, "non-negative", vectorized=True),
+        Constraint(lambda inputs, outputs: outputs["y"] < 100, "below 100"),
+    ]
+    report = model.check_constraints(pd.DataFrame({"x": [-1.0, 1.0, 2.0, 3.0]}))
+    assert report["non-negative"] == {"rows": 4, "violations": 1, "violation_rate": 0.25}
+    assert report["below 100"]["violations"] == 0
+
+    with pytest.raises(ValueError, match="validation split"):
+        model.check_constraints()
+
+
+def test_inference_stats(model):
+    model.predict({"x": 1.0})
+    model.predict_batch([{"x": 1.0}, {"x": 2.0}])
+    with pytest.raises(RuntimeError):
+        model.predict_batch([{"x": "a"}], validate_input=True)
+
+    stats = model.inference_stats()
+    assert stats["model_id"] == model.identifier
+    assert stats["paths"]["predict"]["calls"] == 1
+    assert stats["paths"]["predict_batch"]["rows"] == 2
+    assert stats["paths"]["predict_batch"]["errors"] == 1
+
+
+def test_warmup_replays_sample_through_both_paths(model):
+    model.predictor = BatchPredictor([])
+    stats = model.warmup(n=2, sample=[{"x": 1.0}, {"x": 2.0}])
+
+    assert model.metadata["warmup"] == stats
+    assert (stats["rounds"], stats["samples"]) == (2, 2)
+    # Each round makes two single-row calls and one batch call
+    assert model.predictor.calls == 6
+
+
+def test_warmup_falls_back_to_placeholder_inputs(model):
+    model.warmup(n=1)
+    # One single-row call, and one more from the per-row fallback of the batch call
+    assert model.predictor.calls == 2
+    with pytest.raises(ValueError):
+        model.warmup(n=0)